@@ -0,0 +1,155 @@
+# benchmarks/catalog_scaling.py
+"""
+How page-object operations scale with catalog size.
+
+    python -m benchmarks.catalog_scaling --sizes 100,1000,10000,50000
+    python -m benchmarks.catalog_scaling --sizes 1000,10000 --long-names \
+        --duplicate-prices 0.3 --unicode
+    python -m benchmarks.catalog_scaling --fake --plot reports/scaling.png  # no browser, counts
+
+For every size a stand-in with a synthetic catalog (src/utils/catalog.py) is started and
+`item_names`, `products`, `sort` and `add_to_cart` (last product A→Z, worst case for the card
+XPath) are timed. The growth exponent k (time ~ size**k) between consecutive sizes is printed
+per operation; k > --superlinear flags the operation. Results are stored per commit in
+benchmarks/results/catalog_scaling.json.
+"""
+import argparse
+import sys
+
+from benchmarks.common import ResultStore, git_commit, measure
+from benchmarks.page_objects import _session
+from src.fake.driver import FakeDriver
+from src.pages.inventory_page import InventoryPage
+from src.standin.server import StandinServer
+from src.utils.catalog import sorted_catalog, synthetic_catalog
+from src.utils.driver_factory import build_driver
+from src.utils.stats import growth_exponents
+
+RESULTS_PATH = "benchmarks/results/catalog_scaling.json"
+_BAR = 40
+
+
+def operations(url: str, catalog: list) -> dict:
+    """name -> (setup, op)"""
+    target = sorted_catalog(catalog, "az")[-1]["name"]
+
+    def inventory_setup(d):
+        _session(d, url)
+        d.get(url + "/inventory.html")
+
+    return {
+        "item_names": (inventory_setup, lambda d: InventoryPage(d, url).item_names()),
+        "products": (inventory_setup, lambda d: InventoryPage(d, url).products()),
+        "sort": (inventory_setup, lambda d: InventoryPage(d, url).sort("hilo")),
+        "add_to_cart": (inventory_setup, lambda d: InventoryPage(d, url).add_to_cart(target)),
+    }
+
+
+def run_size(args, size: int) -> dict:
+    catalog = synthetic_catalog(size, args.seed, args.long_names, args.duplicate_prices,
+                                args.unicode)
+    if args.fake:
+        driver, shop = FakeDriver(catalog=catalog), None
+        url = driver.shop.url
+    else:
+        shop = StandinServer(catalog, glitch_ms=0).start()
+        driver, url = build_driver(args.browser, args.headed), shop.url
+    try:
+        ops = operations(url, catalog)
+        names = [n for n in args.only.split(",") if n] or list(ops)
+        return {name: measure(driver, ops[name][1], ops[name][0],
+                              runs=args.runs, warmup=args.warmup)
+                for name in names}
+    finally:
+        driver.quit()
+        if shop:
+            shop.stop()
+
+
+def report(sizes, results: dict, superlinear: float) -> list:
+    """Print time/commands per size with growth exponents; return the super-linear operations."""
+    flagged = []
+    ops = list(results[sizes[0]])
+    for op in ops:
+        medians = [results[n][op]["median"] for n in sizes]
+        commands = [results[n][op]["commands"]["mean"] for n in sizes]
+        exponents = growth_exponents(sizes, medians)
+        top = max(medians) or 1
+        print(f"\n{op}")
+        for i, n in enumerate(sizes):
+            k = f"k={exponents[i - 1]:.2f}" if i else ""
+            bar = "#" * max(1, round(_BAR * medians[i] / top))
+            print(f"  {n:>7} {medians[i] * 1000:>10.1f}ms {commands[i]:>8.0f} cmds {k:>7}  {bar}")
+        worst = max(exponents, default=0.0)
+        if worst > superlinear:
+            flagged.append(f"{op}: k={worst:.2f}")
+    return flagged
+
+
+def plot(path: str, sizes, results: dict):
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not installed; skipping --plot")
+        return
+    fig, ax = plt.subplots(figsize=(7, 4.5))
+    for op in results[sizes[0]]:
+        ax.plot(sizes, [results[n][op]["median"] * 1000 for n in sizes], marker="o", label=op)
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("catalog size")
+    ax.set_ylabel("median ms")
+    ax.legend()
+    ax.grid(True, which="both", alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(path)
+    print(f"plot written to {path}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--fake", action="store_true",
+                        help="use the in-memory fake driver instead of a browser")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--only", default="", help="comma-separated operation names")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--long-names", action="store_true")
+    parser.add_argument("--duplicate-prices", type=float, default=0.0)
+    parser.add_argument("--unicode", action="store_true")
+    parser.add_argument("--superlinear", type=float, default=1.3,
+                        help="flag growth exponents above this")
+    parser.add_argument("--plot", default=None, help="write a log-log PNG (needs matplotlib)")
+    parser.add_argument("--results", default=RESULTS_PATH)
+    args = parser.parse_args(argv)
+
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    results = {}
+    for size in sizes:
+        print(f"catalog of {size} products ...", flush=True)
+        results[size] = run_size(args, size)
+
+    flagged = report(sizes, results, args.superlinear)
+    if args.plot:
+        plot(args.plot, sizes, results)
+
+    commit = git_commit()
+    shape = {k: getattr(args, k) for k in ("seed", "long_names", "duplicate_prices", "unicode")}
+    ResultStore(args.results).save(commit, {
+        "driver": "fake" if args.fake else args.browser, "runs": args.runs, "shape": shape,
+        "sizes": {str(n): results[n] for n in sizes},
+    })
+    print(f"\nresults stored under {commit} in {args.results}")
+    for line in flagged:
+        print(f"SUPER-LINEAR {line}")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
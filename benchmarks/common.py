@@ -0,0 +1,115 @@
+# benchmarks/common.py
+"""Shared helpers for the benchmark scripts: timing loop, result store, baseline comparison."""
+import json
+import os
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+
+from src.utils.commands import CommandCounter, add_command_listener, remove_command_listener
+from src.utils.stats import summarize
+
+
+def git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True).stdout.strip()
+        return commit + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def measure(driver, op, setup=None, runs: int = 30, warmup: int = 3) -> dict:
+    """
+    Run `setup(driver)` (untimed) and `op(driver)` (timed) `warmup + runs` times.
+    Returns timing stats in seconds plus WebDriver command counts of the timed part;
+    `by_command` is the per-run median count of every command.
+    """
+    counter = CommandCounter()
+    samples, commands, per_run = [], [], []
+    for i in range(warmup + runs):
+        if setup:
+            setup(driver)
+        counter.reset()
+        add_command_listener(driver, counter)
+        start = time.perf_counter()
+        try:
+            op(driver)
+        finally:
+            elapsed = time.perf_counter() - start
+            remove_command_listener(driver, counter)
+        if i >= warmup:
+            samples.append(elapsed)
+            commands.append(counter.total)
+            per_run.append(dict(counter.counts))
+    result = summarize(samples)
+    result["commands"] = summarize(commands)
+    # run bez neke komande se broji kao 0 -> isti runovi kao `commands`
+    names = sorted({name for counts in per_run for name in counts})
+    result["by_command"] = {name: statistics.median([counts.get(name, 0) for counts in per_run])
+                            for name in names}
+    return result
+
+
+class ResultStore:
+    """JSON file of benchmark results keyed by commit."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, commit: str, entry: dict):
+        data = self.load()
+        entry = dict(entry, timestamp=datetime.now(timezone.utc).isoformat(timespec="seconds"))
+        data[commit] = entry
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: dict):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def regressions(results: dict, baseline: dict, threshold: float, metric: str = "median") -> list:
+    """Operations whose `metric` (or mean command count) grew more than `threshold` (0.2 = 20%)."""
+    found = []
+    for name, cur in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if cur[metric] > base[metric] * (1 + threshold):
+            found.append(
+                f"{name}: {metric} {base[metric] * 1000:.1f}ms -> {cur[metric] * 1000:.1f}ms"
+            )
+        cur_cmds, base_cmds = cur["commands"]["mean"], base["commands"]["mean"]
+        if cur_cmds > base_cmds * (1 + threshold):
+            found.append(f"{name}: commands {base_cmds:.1f} -> {cur_cmds:.1f}")
+    return found
+
+
+def print_table(results: dict):
+    print(f"{'operation':<16}{'min':>9}{'median':>9}{'p95':>9}{'cv':>7}{'cmds':>7}")
+    for name, r in results.items():
+        print(
+            f"{name:<16}{r['min'] * 1000:>8.1f}m{r['median'] * 1000:>8.1f}m{r['p95'] * 1000:>8.1f}m"
+            f"{r['cv']:>7.2f}{r['commands']['mean']:>7.1f}"
+        )
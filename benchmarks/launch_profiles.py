@@ -0,0 +1,86 @@
+# benchmarks/launch_profiles.py
+"""
+Launch time and memory per browser launch profile (src/utils/driver_factory.py).
+
+    python -m benchmarks.launch_profiles --profiles default,fast --launches 10
+    CHROME_HEADLESS_SHELL=/opt/chrome-headless-shell/chrome-headless-shell \\
+        python -m benchmarks.launch_profiles --profiles default,fast,shell
+    python -m benchmarks.launch_profiles --browser firefox --profiles default,fast
+
+For every launch: time to a ready session, time to the first stand-in page, and RSS of the
+driver process tree (driver + browser + renderers, Linux /proc) after that page. Results are
+stored per commit in benchmarks/results/launch_profiles.json.
+"""
+import argparse
+import sys
+import time
+
+from benchmarks.common import ResultStore, git_commit
+from src.standin.server import StandinServer
+from src.utils.driver_factory import PROFILES, build_driver
+from src.utils.memory import tree_rss_mb
+from src.utils.stats import summarize
+
+RESULTS_PATH = "benchmarks/results/launch_profiles.json"
+
+
+def launch_once(browser: str, profile: str, url: str) -> dict:
+    start = time.perf_counter()
+    driver = build_driver(browser, profile=profile)
+    ready = time.perf_counter()
+    try:
+        driver.get(url + "/")
+        first_page = time.perf_counter()
+        rss = tree_rss_mb(driver.service.process.pid)
+    finally:
+        driver.quit()
+    return {"launch": ready - start, "first_page": first_page - start, "rss_mb": rss}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--profiles", default="default,fast")
+    parser.add_argument("--launches", type=int, default=10)
+    parser.add_argument("--results", default=RESULTS_PATH)
+    args = parser.parse_args(argv)
+
+    profiles = [p for p in args.profiles.split(",") if p]
+    unknown = set(profiles) - set(PROFILES)
+    if unknown:
+        parser.error(f"unknown profile(s): {', '.join(sorted(unknown))}")
+
+    results = {}
+    with StandinServer(glitch_ms=0) as shop:
+        # naizmjenično po profilima, da drift mašine ne favorizuje jedan profil
+        samples = {p: [] for p in profiles}
+        for _ in range(args.launches):
+            for profile in profiles:
+                samples[profile].append(launch_once(args.browser, profile, shop.url))
+        for profile, rows in samples.items():
+            rss = [r["rss_mb"] for r in rows if r["rss_mb"] is not None]
+            results[profile] = {
+                "launch": summarize(r["launch"] for r in rows),
+                "first_page": summarize(r["first_page"] for r in rows),
+                "rss_mb": summarize(rss) if rss else None,
+            }
+
+    base = results[profiles[0]]
+    print(f"{'profile':<10}{'launch p50':>12}{'first page p50':>16}{'RSS p50':>10}"
+          f"{'vs ' + profiles[0]:>14}")
+    for profile, r in results.items():
+        rss = f"{r['rss_mb']['median']:>8.0f}MB" if r["rss_mb"] else f"{'n/a':>10}"
+        delta = (r["first_page"]["median"] / base["first_page"]["median"] - 1) * 100
+        print(f"{profile:<10}{r['launch']['median'] * 1000:>10.0f}ms"
+              f"{r['first_page']['median'] * 1000:>14.0f}ms{rss}{delta:>+13.1f}%")
+
+    commit = git_commit()
+    ResultStore(args.results).save(commit, {"browser": args.browser, "launches": args.launches,
+                                            "profiles": results})
+    print(f"results stored under {commit} in {args.results}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# benchmarks/page_objects.py
+"""
+Microbenchmarks of page-object operations against the stand-in shop.
+
+    python -m benchmarks.page_objects --runs 30
+    python -m benchmarks.page_objects --save-baseline      # accept current numbers
+    python -m benchmarks.page_objects --threshold 0.25     # exit 1 on >25% regression
+
+Results are appended to benchmarks/results/page_objects.json under the current commit.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks.common import (
+    ResultStore, git_commit, load_baseline, measure, print_table, regressions, save_baseline,
+)
+from src.pages.cart_page import CartPage
+from src.pages.checkout_info_page import CheckoutInfoPage
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.standin.server import StandinServer
+from src.utils.driver_factory import build_driver
+
+RESULTS_PATH = "benchmarks/results/page_objects.json"
+BASELINE_PATH = "benchmarks/baseline/page_objects.json"
+
+with open("src/data/users.json", "r", encoding="utf-8") as f:
+    USERS = json.load(f)
+PRODUCT = USERS["products"][0]
+
+
+def _session(driver, url, cart=()):
+    """Logged-in standard_user with these product ids in the cart (cookie/localStorage, no UI)."""
+    driver.get(url + "/")
+    driver.delete_all_cookies()
+    driver.add_cookie({"name": "session-username", "value": USERS["valid"]["username"]})
+    driver.execute_script(
+        "localStorage.setItem('cart-contents', arguments[0])", json.dumps(list(cart))
+    )
+
+
+def operations(url: str) -> dict:
+    """name -> (setup, op)"""
+    valid, info = USERS["valid"], USERS["checkout_info"]
+
+    def login_setup(d):
+        d.get(url + "/")
+        d.delete_all_cookies()
+
+    def inventory_setup(d):
+        _session(d, url)
+        d.get(url + "/inventory.html")
+
+    def cart_setup(d):
+        _session(d, url, cart=[4])
+        d.get(url + "/cart.html")
+
+    def info_setup(d):
+        _session(d, url, cart=[4])
+        d.get(url + "/checkout-step-one.html")
+
+    return {
+        "login": (
+            login_setup,
+            lambda d: LoginPage(d, url).login(valid["username"], valid["password"]),
+        ),
+        "item_names": (inventory_setup, lambda d: InventoryPage(d, url).item_names()),
+        "add_to_cart": (inventory_setup, lambda d: InventoryPage(d, url).add_to_cart(PRODUCT)),
+        "sort": (inventory_setup, lambda d: InventoryPage(d, url).sort("hilo")),
+        "checkout": (cart_setup, lambda d: CartPage(d, url).checkout()),
+        "fill": (
+            info_setup,
+            lambda d: CheckoutInfoPage(d, url).fill(info["first"], info["last"], info["zip"]),
+        ),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument(
+        "--base-url", default=None, help="benchmark this URL instead of a fresh stand-in"
+    )
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", default="", help="comma-separated operation names")
+    parser.add_argument("--results", default=RESULTS_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)"
+    )
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    shop = None if args.base_url else StandinServer(glitch_ms=0).start()
+    url = (args.base_url or shop.url).rstrip("/")
+    driver = build_driver(args.browser, args.headed)
+    results = {}
+    try:
+        ops = operations(url)
+        names = [n for n in args.only.split(",") if n] or list(ops)
+        for name in names:
+            setup, op = ops[name]
+            results[name] = measure(driver, op, setup, runs=args.runs, warmup=args.warmup)
+    finally:
+        driver.quit()
+        if shop:
+            shop.stop()
+
+    print_table(results)
+    commit = git_commit()
+    ResultStore(args.results).save(
+        commit, {"browser": args.browser, "runs": args.runs, "ops": results}
+    )
+    print(f"results stored under {commit} in {args.results}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    found = regressions(results, load_baseline(args.baseline), args.threshold)
+    for line in found:
+        print(f"REGRESSION {line}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
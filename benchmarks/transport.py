@@ -0,0 +1,133 @@
+# benchmarks/transport.py
+"""
+Stock selenium transport vs the pooled transport (src/utils/transport.py), per command.
+
+    python -m benchmarks.transport               # fake driver over loopback HTTP (+ Unix socket)
+    python -m benchmarks.transport --target chrome --runs 50
+
+Every variant gets its own session on the same target; rounds alternate between variants so
+machine drift hits all of them. `fake` isolates the client + transport cost (the driver answers
+in microseconds); `chrome`/`firefox` show what is left of it next to a real driver. The pooled
+variants also print the encode/transport/driver/decode breakdown. Results are stored per commit
+in benchmarks/results/transport.json.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from benchmarks.common import ResultStore, git_commit, measure
+from src.fake.server import FakeDriverServer
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.standin.server import StandinServer
+from src.utils.driver_factory import build_driver
+from src.utils.transport import TransportStats, install_transport
+
+RESULTS_PATH = "benchmarks/results/transport.json"
+
+OPERATIONS = {
+    "title": lambda d: d.title,
+    "find_element": lambda d: d.find_element(By.CSS_SELECTOR, ".inventory_item"),
+    # + isDisplayed atom
+    "is_displayed": lambda d: d.find_element(By.CSS_SELECTOR, ".title").is_displayed(),
+    "item_names": lambda d: InventoryPage(d, d.bench_url).item_names(),
+}
+
+
+def fake_variants(stack):
+    """stock / pooled / pooled over a Unix socket, each on its own fake driver server."""
+    folder = tempfile.mkdtemp(prefix="qa-transport-")
+    stack.append(lambda: shutil.rmtree(folder, ignore_errors=True))
+    variants = {}
+    for name in ("stock", "pooled", "pooled-unix"):
+        sock = os.path.join(folder, "driver.sock") if name == "pooled-unix" else None
+        server = FakeDriverServer(unix_socket=sock).start()
+        stack.append(server.stop)
+        driver = webdriver.Remote(RemoteConnection(server.url, keep_alive=True),
+                                  options=ChromeOptions())
+        stack.append(driver.quit)
+        driver.bench_url = server.shop.url
+        variants[name] = (driver, server.unix_socket)
+    return variants
+
+
+def browser_variants(stack, browser: str):
+    shop = StandinServer(glitch_ms=0).start()
+    stack.append(shop.stop)
+    variants = {}
+    for name in ("stock", "pooled"):
+        driver = build_driver(browser)
+        stack.append(driver.quit)
+        driver.bench_url = shop.url
+        variants[name] = (driver, None)
+    return variants
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default="fake", choices=("fake", "chrome", "firefox"))
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--results", default=RESULTS_PATH)
+    args = parser.parse_args(argv)
+
+    stack = []
+    try:
+        variants = (fake_variants(stack) if args.target == "fake"
+                    else browser_variants(stack, args.target))
+        stats = {}
+        for name, (driver, sock) in variants.items():
+            LoginPage(driver, driver.bench_url).open_login().login("standard_user", "secret_sauce")
+            if name != "stock":
+                stats[name] = TransportStats()
+                install_transport(driver, unix_socket=sock, stats=stats[name])
+        # naizmjenično po varijantama, više rundi; uzima se najbolja runda po operaciji
+        results = {name: {} for name in variants}
+        per_round = max(args.runs // args.rounds, 1)
+        for _ in range(args.rounds):
+            for op, fn in OPERATIONS.items():
+                for name, (driver, _) in variants.items():
+                    r = measure(driver, fn, runs=per_round, warmup=2)
+                    best = results[name].get(op)
+                    if best is None or r["median"] < best["median"]:
+                        results[name][op] = r
+    finally:
+        for close in reversed(stack):
+            close()
+
+    names = list(variants)
+    print(f"{'operation':<16}" + "".join(f"{n + ' p50':>18}" for n in names) + "".join(
+        f"{n + ' vs stock':>24}" for n in names[1:]))
+    for op in OPERATIONS:
+        cells = "".join(f"{results[n][op]['median'] * 1000:>16.3f}ms" for n in names)
+        base = results["stock"][op]["median"]
+        deltas = "".join(f"{(results[n][op]['median'] / base - 1) * 100:>+23.1f}%"
+                         for n in names[1:])
+        print(f"{op:<16}{cells}{deltas}")
+    for name, s in stats.items():
+        print(f"\n{name}: mean ms per command")
+        for line in s.format_table(limit=8):
+            print("  " + line)
+
+    commit = git_commit()
+    ResultStore(args.results).save(commit, {
+        "target": args.target, "runs": args.runs,
+        "results": {n: {op: {k: r[k] for k in ("min", "median", "p95", "cv")}
+                        for op, r in ops.items()}
+                    for n, ops in results.items()},
+        "breakdown": {n: s.snapshot() for n, s in stats.items()},
+    })
+    print(f"\nresults stored under {commit} in {args.results}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,17 +4,30 @@ import json
 import pytest
 from dotenv import load_dotenv
 
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
-
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from src.fake.driver import FakeDriver
+from src.pages.base_page import BasePage
+from src.utils.driver_factory import build_driver, parse_window_size
 
 load_dotenv()
 
+pytest_plugins = [
+    "src.plugins.retry_telemetry",
+    "src.plugins.trace_recorder",
+    "src.plugins.browser_matrix",
+    "src.plugins.result_cache",
+    "src.plugins.traffic_replay",
+    "src.plugins.transition_coverage",
+    "src.plugins.memory_watchdog",
+    "src.plugins.sharding",
+    "src.plugins.gates",
+    "src.plugins.cpu_profile",
+    "src.plugins.adaptive_timeouts",
+    "src.plugins.catalog_index",
+    "src.plugins.hang_watchdog",
+    "src.plugins.time_budget",
+    "src.plugins.webdriver_transport",
+]
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -25,50 +38,79 @@ def pytest_addoption(parser):
     parser.addoption("--browser", action="store", default=os.getenv("BROWSER", "chrome"))
     parser.addoption("--headed", action="store_true", help="Run headed (disable headless)")
     parser.addoption("--window-size", action="store", default=os.getenv("WINDOW_SIZE", "1440,900"))
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default=os.getenv("BROWSER_PROFILE", "default"),
+        help="Launch profile: default, fast or shell (chrome-headless-shell)",
+    )
     parser.addoption("--implicit-wait", action="store", default=os.getenv("IMPLICIT_WAIT", "2"))
+    parser.addoption("--fast-fill", action="store_true",
+                     default=os.getenv("FAST_FILL", "").lower() in ("1", "true", "yes"),
+                     help="Fill forms with one script call instead of typing (src/utils/forms.py)")
     # 🔥 nova opcija
     parser.addoption("--keep-browser-open", action="store_true", help="Do not quit browser after test")
 
 
+def pytest_configure(config):
+    BasePage.fast_fill = config.getoption("--fast-fill")
+
+
 @pytest.fixture(scope="session")
-def base_url(pytestconfig):
+def base_url(pytestconfig, traffic_proxy):
+    # --record-traffic / --replay-traffic: sve ide preko proxyja (src/plugins/traffic_replay.py)
+    if traffic_proxy is not None:
+        return traffic_proxy.url
     return pytestconfig.getoption("--base-url").rstrip("/")
 
 
 @pytest.fixture(scope="session")
-def browser_name(pytestconfig):
-    return pytestconfig.getoption("--browser").lower()
+def browser_name(request, pytestconfig):
+    # --browsers parametrizuje ovaj fixture (src/plugins/browser_matrix.py)
+    return getattr(request, "param", pytestconfig.getoption("--browser")).lower()
 
 
-@pytest.fixture(scope="function")
-def driver(pytestconfig, browser_name):
+def _acquire_driver(pytestconfig, browser_name, browser_pool):
     headed = pytestconfig.getoption("--headed")
-    keep_open = pytestconfig.getoption("--keep-browser-open")
     size = pytestconfig.getoption("--window-size")
     implicit = int(pytestconfig.getoption("--implicit-wait"))
-    w, h = [int(x) for x in size.split(",")] if "," in size else (1440, 900)
-
-    if browser_name == "firefox":
-        opts = FirefoxOptions()
-        if not headed:
-            opts.add_argument("-headless")
-        service = FirefoxService(executable_path=GeckoDriverManager().install())
-        drv = webdriver.Firefox(service=service, options=opts)
-    else:
-        opts = ChromeOptions()
-        if not headed:
-            opts.add_argument("--headless=new")
-        opts.add_argument(f"--window-size={w},{h}")
-        opts.add_argument("--disable-gpu")
-        service = ChromeService(ChromeDriverManager().install())
-        drv = webdriver.Chrome(service=service, options=opts)
-
-    drv.implicitly_wait(implicit)
+    if pytestconfig.getoption("--adaptive-timeouts"):
+        # implicit wait bi produžio svaki naučeni timeout (src/plugins/adaptive_timeouts.py)
+        implicit = 0
+    profile = pytestconfig.getoption("--browser-profile")
+    transport = pytestconfig.getoption("--webdriver-transport")
+    # --reuse-browser: sesija workera; inače nova za svaki test (src/plugins/memory_watchdog.py)
+    return browser_pool.acquire(
+        browser_name,
+        lambda: build_driver(
+            browser_name, headed, parse_window_size(size), implicit, profile, transport
+        ),
+    )
+
+
+@pytest.fixture(scope="function")
+def driver(request, pytestconfig, browser_name, browser_pool):
+    drv = _acquire_driver(pytestconfig, browser_name, browser_pool)
     yield drv
 
-    # 🔥 zatvori samo ako korisnik nije tražio da ostane otvoren
-    if not keep_open:
-        drv.quit()
+    # 🔥 zatvori samo ako korisnik nije tražio da ostane otvoren (o tome odlučuje pool)
+    browser_pool.release(drv, browser_name, request.node.nodeid)
+
+
+@pytest.fixture(scope="class")
+def class_driver(request, pytestconfig, browser_name, browser_pool):
+    """One session for all tests of a class (e.g. one login, several parametrized checks)."""
+    drv = _acquire_driver(pytestconfig, browser_name, browser_pool)
+    yield drv
+    browser_pool.release(drv, browser_name, request.node.nodeid)
+
+
+@pytest.fixture(scope="function")
+def fake_driver():
+    """In-memory driver (src/fake) for page-object unit tests: no browser, no network."""
+    drv = FakeDriver()
+    yield drv
+    drv.quit()
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,563 @@
+# src/fake/dom.py
+"""
+Minimal DOM for the fake driver: element nodes, text and the CSS/XPath subset the page
+objects use (compound CSS with descendant/child combinators and attribute operators;
+XPath paths with predicates, `and`/`or`, `contains()`, `normalize-space()`, `starts-with()`,
+`not()` and `text()`).
+"""
+import re
+from functools import lru_cache
+from itertools import count
+
+from selenium.common.exceptions import InvalidSelectorException
+
+_ids = count(1)
+
+BLOCK_TAGS = {"div", "form", "h1", "h2", "h3", "p", "ul", "li", "select", "option", "body", "html"}
+VOID_TAGS = {"input", "img", "br", "meta", "link"}
+
+
+class Node:
+    __slots__ = ("tag", "attrs", "children", "parent", "id", "value", "selected",
+                 "on_click", "on_change")
+
+    def __init__(self, tag, attrs=None, *children):
+        self.tag = tag
+        self.attrs = dict(attrs or {})
+        self.children = []
+        self.parent = None
+        self.id = f"fake-{next(_ids)}"
+        self.value = self.attrs.get("value", "")
+        self.selected = False
+        self.on_click = None
+        self.on_change = None
+        for child in children:
+            self.append(child)
+
+    def append(self, child):
+        if child is None:
+            return
+        if isinstance(child, (list, tuple)):
+            for c in child:
+                self.append(c)
+            return
+        if isinstance(child, Node):
+            child.parent = self
+        else:
+            child = str(child)
+        self.children.append(child)
+
+    def remove(self):
+        if self.parent is not None:
+            self.parent.children.remove(self)
+            self.parent = None
+
+    # ----- tree -----
+    def elements(self):
+        return [c for c in self.children if c.__class__ is Node]
+
+    def descendants(self):
+        stack = self.elements()[::-1]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.children:
+                stack.extend([c for c in reversed(node.children) if c.__class__ is Node])
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def root(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    def closest(self, predicate):
+        node = self
+        while node is not None and not predicate(node):
+            node = node.parent
+        return node
+
+    # ----- content -----
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    def string_value(self) -> str:
+        parts = []
+        for c in self.children:
+            parts.append(c.string_value() if isinstance(c, Node) else c)
+        return "".join(parts)
+
+    def is_displayed(self) -> bool:
+        for node in (self, *self.ancestors()):
+            if "hidden" in node.attrs or "display: none" in node.attrs.get("style", ""):
+                return False
+            if node.tag in ("head", "script", "style", "title"):
+                return False
+        return not (self.tag == "input" and self.attrs.get("type") == "hidden")
+
+    def rendered_text(self) -> str:
+        """Approximation of WebDriver's visible text: block children on their own lines."""
+        lines, current = [], []
+
+        def walk(node):
+            if not node.is_displayed():
+                return
+            for c in node.children:
+                if isinstance(c, Node):
+                    if c.tag in BLOCK_TAGS:
+                        flush()
+                        walk(c)
+                        flush()
+                    else:
+                        walk(c)
+                else:
+                    current.append(c)
+
+        def flush():
+            text = " ".join("".join(current).split())
+            if text:
+                lines.append(text)
+            current.clear()
+
+        walk(self)
+        flush()
+        return "\n".join(lines)
+
+    def html(self) -> str:
+        attrs = "".join(f' {k}="{_escape(v)}"' for k, v in self.attrs.items())
+        if self.tag in VOID_TAGS:
+            return f"<{self.tag}{attrs}>"
+        inner = "".join(c.html() if isinstance(c, Node) else _escape(c) for c in self.children)
+        return f"<{self.tag}{attrs}>{inner}</{self.tag}>"
+
+    def __repr__(self):
+        return f"<{self.tag} {self.attrs}>"
+
+
+def h(tag, attrs=None, *children) -> Node:
+    return Node(tag, attrs, *children)
+
+
+def _escape(s) -> str:
+    return (str(s).replace("&", "&amp;").replace("<", "&lt;")
+            .replace(">", "&gt;").replace('"', "&quot;"))
+
+
+def select(context: Node, using: str, value: str) -> list:
+    """Elements under `context` matching a W3C locator strategy, in document order."""
+    if using == "css selector":
+        matches = _css(value)
+        return [n for n in context.descendants() if matches(n)]
+    if using == "xpath":
+        return [n for n in _xpath(value)(context) if isinstance(n, Node)]
+    if using == "tag name":
+        return [n for n in context.descendants() if n.tag == value]
+    if using in ("link text", "partial link text"):
+        links = [n for n in context.descendants() if n.tag == "a"]
+        if using == "link text":
+            return [n for n in links if n.rendered_text() == value]
+        return [n for n in links if value in n.rendered_text()]
+    raise InvalidSelectorException(f"fake driver: unsupported locator strategy '{using}'")
+
+
+# ----------------------------------------------------------------- CSS
+
+_CSS_TOKEN = re.compile(
+    r"""(?:
+        (?P<comb>[>+~])
+      | (?P<tag>\*|[a-zA-Z][\w-]*)
+      | \#(?P<id>[\w-]+)
+      | \.(?P<cls>[\w-]+)
+      | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~^$*|]?=)\s*(?P<val>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]
+      | (?P<space>\s+)
+    )""",
+    re.X,
+)
+
+
+def _split_top(text: str, sep: str) -> list:
+    parts, depth, quote, buf = [], 0, None, []
+    for ch in text:
+        if quote:
+            quote = None if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif ch == sep and depth == 0:
+            parts.append("".join(buf))
+            buf = []
+            continue
+        buf.append(ch)
+    parts.append("".join(buf))
+    return parts
+
+
+def _attr_test(name, op, val):
+    if val is not None and val[:1] in "'\"":
+        val = val[1:-1]
+
+    def test(node):
+        actual = node.attrs.get(name)
+        if actual is None:
+            return False
+        if op is None:
+            return True
+        if op == "=":
+            return actual == val
+        if op == "~=":
+            return val in actual.split()
+        if op == "^=":
+            return actual.startswith(val)
+        if op == "$=":
+            return actual.endswith(val)
+        if op == "*=":
+            return val in actual
+        return actual == val or actual.startswith(val + "-")
+
+    return test
+
+
+def _compile_complex(text: str):
+    """-> [(combinator before this compound, [tests]), ...] from left to right."""
+    steps, tests, comb, pos = [], [], " ", 0
+    text = text.strip()
+    while pos < len(text):
+        m = _CSS_TOKEN.match(text, pos)
+        if not m or m.end() == pos:
+            raise InvalidSelectorException(f"fake driver: unsupported CSS selector '{text}'")
+        pos = m.end()
+        if m.group("space") or m.group("comb"):
+            if tests:
+                steps.append((comb, tests))
+                tests, comb = [], " "
+            if m.group("comb"):
+                if m.group("comb") != ">":
+                    raise InvalidSelectorException(
+                        f"fake driver: unsupported combinator in '{text}'")
+                comb = ">"
+            continue
+        if m.group("tag"):
+            tag = m.group("tag").lower()
+            if tag != "*":
+                tests.append(lambda n, t=tag: n.tag == t)
+        elif m.group("id"):
+            tests.append(lambda n, v=m.group("id"): n.attrs.get("id") == v)
+        elif m.group("cls"):
+            tests.append(lambda n, v=m.group("cls"): v in n.classes)
+        elif m.group("attr"):
+            tests.append(_attr_test(m.group("attr"), m.group("op"), m.group("val")))
+    if tests:
+        steps.append((comb, tests))
+    if not steps:
+        raise InvalidSelectorException(f"fake driver: empty CSS selector '{text}'")
+    return steps
+
+
+@lru_cache(maxsize=512)
+def _css(selector: str):
+    compiled = [_compile_complex(part) for part in _split_top(selector, ",")]
+
+    def match_steps(node, steps, i):
+        comb, tests = steps[i]
+        for t in tests:
+            if not t(node):
+                return False
+        if i == 0:
+            return True
+        if comb == ">":
+            return node.parent is not None and match_steps(node.parent, steps, i - 1)
+        return any(match_steps(anc, steps, i - 1) for anc in node.ancestors())
+
+    def matches(node):
+        for steps in compiled:
+            if match_steps(node, steps, len(steps) - 1):
+                return True
+        return False
+
+    return matches
+
+
+# ----------------------------------------------------------------- XPath
+
+_XP_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<str>"[^"]*"|'[^']*')
+      | (?P<num>\d+(?:\.\d+)?)
+      | (?P<op>//|/|\.\.|\.|\(|\)|\[|\]|@|,|!=|=|\*|\|)
+      | (?P<name>[A-Za-z_][\w\-]*)
+    )""",
+    re.X,
+)
+
+
+def _tokenize(expr: str) -> list:
+    tokens, pos = [], 0
+    expr = expr.strip()
+    while pos < len(expr):
+        m = _XP_TOKEN.match(expr, pos)
+        if not m or m.end() == pos:
+            raise InvalidSelectorException(f"fake driver: unsupported XPath '{expr}'")
+        pos = m.end()
+        kind = m.lastgroup
+        tokens.append((kind, m.group(kind)))
+    return tokens
+
+
+class _XPathParser:
+    def __init__(self, expr):
+        self.expr = expr
+        self.tokens = _tokenize(expr)
+        self.i = 0
+
+    def peek(self, offset=0):
+        j = self.i + offset
+        return self.tokens[j] if j < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        tok = self.peek()
+        if value is not None and tok[1] != value:
+            raise InvalidSelectorException(
+                f"fake driver: expected '{value}' in XPath '{self.expr}'")
+        self.i += 1
+        return tok
+
+    def parse(self):
+        fn = self.or_expr()
+        if self.i != len(self.tokens):
+            raise InvalidSelectorException(f"fake driver: unsupported XPath '{self.expr}'")
+        return fn
+
+    def or_expr(self):
+        left = self.and_expr()
+        while self.peek() == ("name", "or"):
+            self.take()
+            right = self.and_expr()
+            left = (lambda a, b: lambda ctx: _bool(a(ctx)) or _bool(b(ctx)))(left, right)
+        return left
+
+    def and_expr(self):
+        left = self.eq_expr()
+        while self.peek() == ("name", "and"):
+            self.take()
+            right = self.eq_expr()
+            left = (lambda a, b: lambda ctx: _bool(a(ctx)) and _bool(b(ctx)))(left, right)
+        return left
+
+    def eq_expr(self):
+        left = self.union_expr()
+        if self.peek()[1] in ("=", "!="):
+            op = self.take()[1]
+            right = self.union_expr()
+            return lambda ctx: _compare(left(ctx), right(ctx), op)
+        return left
+
+    def union_expr(self):
+        left = self.primary()
+        while self.peek()[1] == "|":
+            self.take()
+            right = self.primary()
+            left = (lambda a, b: lambda ctx: _dedupe(a(ctx) + b(ctx)))(left, right)
+        return left
+
+    def primary(self):
+        kind, val = self.peek()
+        if kind == "str":
+            self.take()
+            return lambda ctx: val[1:-1]
+        if kind == "num":
+            self.take()
+            return lambda ctx: float(val)
+        if val == "(":
+            self.take()
+            inner = self.or_expr()
+            self.take(")")
+            return inner
+        if kind == "name" and self.peek(1)[1] == "(" and val not in ("text", "node"):
+            return self.function()
+        return self.path()
+
+    def function(self):
+        name = self.take()[1]
+        self.take("(")
+        args = []
+        while self.peek()[1] != ")":
+            args.append(self.or_expr())
+            if self.peek()[1] == ",":
+                self.take()
+        self.take(")")
+        impl = _FUNCTIONS.get(name)
+        if impl is None:
+            raise InvalidSelectorException(f"fake driver: unsupported XPath function '{name}()'")
+        return lambda ctx: impl(ctx, *[a(ctx) for a in args])
+
+    def path(self):
+        steps = []
+        absolute = False
+        kind, val = self.peek()
+        if val == "/":
+            self.take()
+            absolute = True
+        elif val == "//":
+            self.take()
+            absolute = True
+            steps.append(("descendant-or-self", None, []))
+        while True:
+            steps.append(self.step())
+            if self.peek()[1] == "/":
+                self.take()
+            elif self.peek()[1] == "//":
+                self.take()
+                steps.append(("descendant-or-self", None, []))
+            else:
+                break
+
+        def evaluate(ctx):
+            nodes = [ctx.root() if absolute else ctx]
+            for axis, test, preds in steps:
+                nodes = _apply_step(nodes, axis, test, preds)
+            return nodes
+
+        return evaluate
+
+    def step(self):
+        kind, val = self.peek()
+        if val == ".":
+            self.take()
+            return ("self", None, [])
+        if val == "..":
+            self.take()
+            return ("parent", None, [])
+        axis = "child"
+        if val == "@":
+            self.take()
+            axis = "attribute"
+        kind, val = self.take()
+        if val == "*":
+            test = None
+        elif kind == "name" and self.peek()[1] == "(":
+            self.take("(")
+            self.take(")")
+            test = f"{val}()"
+        elif kind == "name":
+            test = val.lower() if axis == "child" else val
+        else:
+            raise InvalidSelectorException(
+                f"fake driver: unsupported XPath step '{val}' in '{self.expr}'")
+        preds = []
+        while self.peek()[1] == "[":
+            self.take()
+            preds.append(self.or_expr())
+            self.take("]")
+        return (axis, test, preds)
+
+
+def _apply_step(nodes, axis, test, preds):
+    out = []
+    for node in nodes:
+        if not isinstance(node, Node):
+            continue
+        if axis == "self":
+            found = [node]
+        elif axis == "parent":
+            found = [node.parent] if node.parent is not None else []
+        elif axis == "descendant-or-self":
+            found = [node, *node.descendants()]
+        elif axis == "attribute":
+            if test is None:
+                found = list(node.attrs.values())
+            else:
+                found = [node.attrs[test]] if test in node.attrs else []
+            out.extend(found)
+            continue
+        elif test == "text()":
+            out.extend(c for c in node.children if not isinstance(c, Node))
+            continue
+        elif test == "node()":
+            found = list(node.children)
+        else:
+            found = [c for c in node.elements() if test is None or c.tag == test]
+        for pred in preds:
+            kept = []
+            for pos, candidate in enumerate(found, 1):
+                result = pred(candidate)
+                if isinstance(result, float):
+                    if result == pos:
+                        kept.append(candidate)
+                elif _bool(result):
+                    kept.append(candidate)
+            found = kept
+        out.extend(found)
+    return _dedupe(out)
+
+
+def _dedupe(items):
+    seen, out = set(), []
+    for item in items:
+        key = id(item) if isinstance(item, Node) else None
+        if key is None or key not in seen:
+            if key is not None:
+                seen.add(key)
+            out.append(item)
+    return out
+
+
+def _string(value) -> str:
+    if isinstance(value, list):
+        if not value:
+            return ""
+        first = value[0]
+        return first.string_value() if isinstance(first, Node) else str(first)
+    if isinstance(value, Node):
+        return value.string_value()
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    return str(value)
+
+
+def _bool(value) -> bool:
+    if isinstance(value, list):
+        return bool(value)
+    return bool(value)
+
+
+def _compare(left, right, op) -> bool:
+    def values(v):
+        if isinstance(v, list):
+            return [x.string_value() if isinstance(x, Node) else str(x) for x in v]
+        return [_string(v)]
+
+    lv, rv = values(left), values(right)
+    if op == "=":
+        return any(a == b for a in lv for b in rv)
+    return any(a != b for a in lv for b in rv)
+
+
+_FUNCTIONS = {
+    "contains": lambda ctx, a, b: _string(b) in _string(a),
+    "starts-with": lambda ctx, a, b: _string(a).startswith(_string(b)),
+    "normalize-space": lambda ctx, *a: " ".join(_string(a[0] if a else ctx).split()),
+    "string": lambda ctx, *a: _string(a[0] if a else ctx),
+    "not": lambda ctx, a: not _bool(a),
+    "true": lambda ctx: True,
+    "false": lambda ctx: False,
+}
+
+
+@lru_cache(maxsize=512)
+def _xpath(expr: str):
+    fn = _XPathParser(expr).parse()
+
+    def evaluate(context):
+        result = fn(context)
+        return result if isinstance(result, list) else []
+
+    return evaluate
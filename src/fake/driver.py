@@ -0,0 +1,315 @@
+# src/fake/driver.py
+"""
+In-memory WebDriver for page-object unit tests.
+
+`FakeDriver` is a real `selenium.webdriver.Remote` whose command executor answers W3C
+commands from a `FakeShop` instead of HTTP, so `WebElement`, `WebDriverWait`, expected
+conditions and `Select` run unchanged and command listeners (`src/utils/commands.py`) see
+every call. Scripts cannot run; `on_script` registers Python stand-ins for them.
+
+    driver = FakeDriver()
+    LoginPage(driver, driver.shop.url).open_login().login("standard_user", "secret_sauce")
+"""
+import base64
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.fake.dom import select
+from src.fake.shop import FakeShop
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+_PNG = base64.b64encode(
+    bytes.fromhex(
+        "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+        "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+    )
+).decode()
+_SPECIAL_KEYS = {getattr(Keys, name) for name in dir(Keys) if not name.startswith("_")}
+
+
+class _Fail(Exception):
+    def __init__(self, error: str, message: str):
+        super().__init__(message)
+        self.error = error
+        self.message = message
+
+
+def _inventory_products(shop):
+    """Python stand-in for `InventoryPage._PRODUCTS_JS`."""
+    rows = []
+    for card in select(shop.document, "css selector", ".inventory_item"):
+        pid = name = price = None
+        for node in card.descendants():
+            classes = node.classes
+            if name is None and ("inventory_item_name" in classes
+                                 or node.attrs.get("data-test") == "inventory-item-name"):
+                name = " ".join(node.string_value().split())
+            elif price is None and ("inventory_item_price" in classes
+                                    or node.attrs.get("data-test") == "inventory-item-price"):
+                digits = "".join(ch for ch in node.string_value() if ch.isdigit() or ch == ".")
+                price = float(digits)
+            elif (pid is None and node.tag == "a"
+                  and node.attrs.get("id", "").endswith("_title_link")):
+                pid = int(node.attrs["id"].split("_")[1])
+        rows.append([pid, name, price])
+    return rows
+
+
+def _page_ready(shop, url_part, locators):
+    """Python stand-in for `src.utils.wait.READY_JS`."""
+    if url_part and url_part not in shop.current_url:
+        return False
+    return all(select(shop.document, using, value) for using, value in locators)
+
+
+def _bulk_check(shop, scope, specs):
+    """Python stand-in for `src.utils.element_checks.BULK_CHECK_JS`."""
+    def read(node, prop):
+        if prop == "displayed":
+            return node.is_displayed()
+        if prop == "text":
+            return node.rendered_text().strip()
+        if prop.startswith("attr:"):
+            return node.attrs.get(prop[5:])
+        if prop == "complete":
+            return node.tag == "img"
+        if prop in ("naturalHeight", "naturalWidth"):
+            return 1 if node.tag == "img" else None
+        return _get_attribute(node, prop)
+
+    scopes = select(shop.document, "css selector", scope) if scope else [shop.document]
+    rows = []
+    for node in scopes:
+        row = []
+        for selector, prop in specs:
+            found = select(node, "css selector", selector)[:1] if selector else [node]
+            row.append([True, read(found[0], prop)] if found else [False, None])
+        rows.append(row)
+    return rows
+
+
+def _fill_form(shop, fields, submit, url_part, locators, error_locator, timeout_ms):
+    """Python stand-in for `src.utils.forms.FILL_FORM_JS` (no React events to fire here)."""
+    def find(locator):
+        found = select(shop.document, locator[0], locator[1])
+        return found[0] if found else None
+
+    missing = []
+    for using, value, text in fields:
+        node = find([using, value])
+        if node is None:
+            missing.append(value)
+        else:
+            node.value = text
+    button = find(submit) if submit else None
+    if submit and button is None:
+        missing.append(submit[1])
+    if missing or not submit:
+        return {"missing": missing, "ready": not missing, "error": None}
+    target = button.closest(lambda n: n.on_click is not None)
+    if target is not None:
+        target.on_click()
+    error = find(error_locator) if error_locator else None
+    return {"missing": [], "ready": _page_ready(shop, url_part, locators),
+            "error": error.rendered_text().strip() if error else None}
+
+
+def _layout_metrics(shop, window, selectors):
+    """Python stand-in for `src.utils.viewport.LAYOUT_JS`: no layout engine, so no geometry."""
+    elements = {}
+    for selector in selectors:
+        found = select(shop.document, "css selector", selector)
+        elements[selector] = {"count": len(found),
+                              "visible": sum(1 for n in found if n.is_displayed()),
+                              "right": 0, "first": None}
+    return {"width": window["width"], "height": window["height"], "dpr": 1,
+            "scrollWidth": window["width"], "elements": elements}
+
+
+def _get_attribute(node, name):
+    """What the getAttribute atom returns: live value for inputs, 'true' for boolean attributes."""
+    if name == "value" and node.tag in ("input", "textarea", "select", "option"):
+        return node.value if node.tag != "option" else node.attrs.get("value", node.string_value())
+    if name in ("selected", "checked"):
+        return "true" if node.selected else None
+    if name in ("disabled", "hidden", "multiple", "readonly", "required"):
+        return "true" if name in node.attrs else None
+    if name == "src" and "src" in node.attrs and node.attrs["src"].startswith("/"):
+        return node.attrs["src"]
+    return node.attrs.get(name)
+
+
+class FakeExecutor:
+    def __init__(self, shop: FakeShop):
+        self.shop = shop
+        self.timeouts = {"implicit": 0, "pageLoad": 300000, "script": 30000}
+        self.window = {"x": 0, "y": 0, "width": 1440, "height": 900}
+        self.scripts = []
+        self._known = {}
+        self._handlers = {
+            Command.NEW_SESSION: lambda p: {
+                "sessionId": "fake-session",
+                "capabilities": {"browserName": "fake", "browserVersion": "0"}},
+            Command.QUIT: lambda p: None,
+            Command.GET: lambda p: self.shop.navigate(p["url"]),
+            Command.GET_CURRENT_URL: lambda p: self.shop.current_url,
+            Command.GET_TITLE: lambda p: "Swag Labs",
+            Command.GO_BACK: lambda p: self.shop.back(),
+            Command.GO_FORWARD: lambda p: self.shop.forward(),
+            Command.REFRESH: lambda p: self.shop.refresh(),
+            Command.GET_PAGE_SOURCE: lambda p: self.shop.document.elements()[0].html(),
+            Command.SET_TIMEOUTS: lambda p: self.timeouts.update(
+                {k: v for k, v in p.items() if k in self.timeouts}),
+            Command.GET_TIMEOUTS: lambda p: dict(self.timeouts),
+            Command.SET_WINDOW_RECT: lambda p: self._set_window(p),
+            Command.GET_WINDOW_RECT: lambda p: dict(self.window),
+            Command.SCREENSHOT: lambda p: _PNG,
+            Command.ELEMENT_SCREENSHOT: lambda p: _PNG,
+            Command.GET_LOG: lambda p: [],
+            Command.GET_ALL_COOKIES: lambda p: list(self.shop.cookies.values()),
+            Command.GET_COOKIE: lambda p: self._cookie(p["name"]),
+            Command.ADD_COOKIE: lambda p: self.shop.cookies.__setitem__(p["cookie"]["name"],
+                                                                        dict(p["cookie"])),
+            Command.DELETE_COOKIE: lambda p: self.shop.cookies.pop(p["name"], None),
+            Command.DELETE_ALL_COOKIES: lambda p: self.shop.cookies.clear(),
+            Command.FIND_ELEMENT: lambda p: self._find(self.shop.document, p, single=True),
+            Command.FIND_ELEMENTS: lambda p: self._find(self.shop.document, p, single=False),
+            Command.FIND_CHILD_ELEMENT: lambda p: self._find(self._node(p["id"]), p, single=True),
+            Command.FIND_CHILD_ELEMENTS: lambda p: self._find(self._node(p["id"]), p, single=False),
+            Command.CLICK_ELEMENT: lambda p: self._click(self._node(p["id"])),
+            Command.CLEAR_ELEMENT: lambda p: setattr(self._node(p["id"]), "value", ""),
+            Command.SEND_KEYS_TO_ELEMENT: lambda p: self._type(self._node(p["id"]), p["text"]),
+            Command.GET_ELEMENT_TEXT: lambda p: self._node(p["id"]).rendered_text(),
+            Command.GET_ELEMENT_TAG_NAME: lambda p: self._node(p["id"]).tag,
+            Command.GET_ELEMENT_ATTRIBUTE: lambda p: self._node(p["id"]).attrs.get(p["name"]),
+            Command.GET_ELEMENT_PROPERTY: lambda p: _get_attribute(self._node(p["id"]), p["name"]),
+            Command.IS_ELEMENT_ENABLED: lambda p: "disabled" not in self._node(p["id"]).attrs,
+            Command.IS_ELEMENT_SELECTED: lambda p: self._node(p["id"]).selected,
+            Command.GET_ELEMENT_RECT: lambda p: (self._node(p["id"])
+                                                 and {"x": 0, "y": 0, "width": 100, "height": 20}),
+            Command.W3C_EXECUTE_SCRIPT: lambda p: self._script(p["script"], p.get("args", [])),
+            Command.W3C_EXECUTE_SCRIPT_ASYNC: lambda p: self._script(p["script"],
+                                                                     p.get("args", [])),
+        }
+        self._install_default_scripts()
+
+    # ----- protocol -----
+    def close(self):
+        pass
+
+    def execute(self, command, params):
+        handler = self._handlers.get(command)
+        if handler is None:
+            return {"status": "unknown command",
+                    "value": {"message": f"fake driver does not implement '{command}'"}}
+        try:
+            value = handler(params or {})
+        except _Fail as e:
+            return {"status": e.error, "value": {"message": e.message}}
+        return {"value": self._wrap(value)}
+
+    def _wrap(self, value):
+        if isinstance(value, list):
+            return [self._wrap(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self._wrap(v) for k, v in value.items()}
+        if hasattr(value, "tag") and hasattr(value, "on_click"):
+            self._known[value.id] = value
+            return {ELEMENT_KEY: value.id}
+        return value
+
+    def _unwrap(self, value):
+        if isinstance(value, list):
+            return [self._unwrap(v) for v in value]
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return self._node(value[ELEMENT_KEY])
+            return {k: self._unwrap(v) for k, v in value.items()}
+        return value
+
+    def _node(self, element_id):
+        node = self._known.get(element_id)
+        if node is None:
+            raise _Fail("no such element", f"unknown element id {element_id}")
+        if node.root() is not self.shop.document:
+            raise _Fail("stale element reference",
+                        f"element {element_id} is no longer attached to the DOM")
+        return node
+
+    def _set_window(self, rect):
+        self.window.update({k: v for k, v in rect.items() if k in self.window and v is not None})
+        return dict(self.window)
+
+    def _cookie(self, name):
+        if name not in self.shop.cookies:
+            raise _Fail("no such cookie", name)
+        return self.shop.cookies[name]
+
+    # ----- elements -----
+    def _find(self, context, params, single):
+        found = select(context, params["using"], params["value"])
+        if single:
+            if not found:
+                raise _Fail("no such element",
+                            f"Unable to locate element: {{\"method\":\"{params['using']}\","
+                            f"\"selector\":\"{params['value']}\"}}")
+            return found[0]
+        return found
+
+    def _click(self, node):
+        if not node.is_displayed():
+            raise _Fail("element not interactable", "element not interactable")
+        target = node.closest(lambda n: n.on_click is not None)
+        if target is not None:
+            target.on_click()
+
+    def _type(self, node, text):
+        if node.tag not in ("input", "textarea"):
+            raise _Fail("element not interactable", f"cannot type into <{node.tag}>")
+        node.value += "".join(ch for ch in text if ch not in _SPECIAL_KEYS)
+
+    # ----- scripts -----
+    def on_script(self, matcher, handler):
+        """
+        `matcher`: substring of the script or predicate(script).
+        `handler(shop, *args)` returns the result.
+        """
+        test = matcher if callable(matcher) else (lambda script, m=matcher: m in script)
+        self.scripts.insert(0, (test, handler))
+
+    def _script(self, script, args):
+        args = self._unwrap(args)
+        for test, handler in self.scripts:
+            if test(script):
+                return handler(self.shop, *args)
+        raise _Fail("javascript error", f"fake driver: no on_script hook for: {script[:120]}")
+
+    def _install_default_scripts(self):
+        storage = self.shop.storage
+        self.on_script("/* isDisplayed */", lambda shop, el: el.is_displayed())
+        self.on_script("/* getAttribute */", lambda shop, el, name: _get_attribute(el, name))
+        self.on_script("return arguments[0][arguments[1]]",
+                       lambda shop, el, name: _get_attribute(el, name))
+        self.on_script("scrollIntoView", lambda shop, *a: None)
+        self.on_script(".complete && arguments[0].naturalHeight", lambda shop, el: el.tag == "img")
+        self.on_script("/* inventoryProducts */", _inventory_products)
+        self.on_script("/* pageReady */", _page_ready)
+        self.on_script("/* bulkCheck */", _bulk_check)
+        self.on_script("/* fillForm */", _fill_form)
+        self.on_script("/* layoutMetrics */",
+                       lambda shop, selectors: _layout_metrics(shop, self.window, selectors))
+        self.on_script("localStorage.clear()", lambda shop, *a: storage.clear())
+        self.on_script("localStorage.setItem('cart-contents'",
+                       lambda shop, value: storage.__setitem__("cart-contents", value))
+
+
+class FakeDriver(WebDriver):
+    def __init__(self, shop: FakeShop = None, **shop_options):
+        self.shop = shop or FakeShop(**shop_options)
+        super().__init__(command_executor=FakeExecutor(self.shop), options=ChromeOptions())
+
+    def on_script(self, matcher, handler):
+        self.command_executor.on_script(matcher, handler)
@@ -0,0 +1,148 @@
+# src/fake/server.py
+"""
+The fake driver (src/fake/driver.py) behind a real WebDriver HTTP endpoint.
+
+    with FakeDriverServer() as server:                       # TCP on 127.0.0.1
+        drv = webdriver.Remote(server.url, options=ChromeOptions())
+    with FakeDriverServer(unix_socket="/tmp/fake.sock") as server:    # TCP + Unix socket
+        install_transport(drv, unix_socket=server.unix_socket)
+
+Commands arrive as W3C HTTP requests (HTTP/1.1 keep-alive), are mapped back to selenium's
+command names and answered by a `FakeExecutor`: page objects run over real sockets with no
+browser, so the transport (src/utils/transport.py) can be tested and benchmarked on its own.
+Both listeners serve the same session; `connections` counts the accepted connections.
+"""
+import json
+import os
+import re
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.webdriver.remote.remote_connection import remote_commands
+
+from src.fake.driver import FakeExecutor
+from src.fake.shop import FakeShop
+
+# W3C greška -> HTTP status
+_STATUS = {"no such element": 404, "no such cookie": 404, "stale element reference": 404,
+           "unknown command": 404, "javascript error": 500}
+
+
+def _routes(handled):
+    routes = []
+    for command, (method, template) in remote_commands.items():
+        pattern = re.sub(r"\$(\w+)", r"(?P<\1>[^/]+)", template)
+        routes.append((method, re.compile(f"^{pattern}$"), command, command in handled))
+    # komanda koju FakeExecutor zna ima prednost kad dvije dijele putanju
+    routes.sort(key=lambda r: not r[3])
+    return routes
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeDriver/1.0"
+    # odgovor u jednom write-u (kao chromedriver):
+    # zaglavlja + tijelo odvojeno = Nagle + delayed ACK ~40ms
+    wbufsize = 64 * 1024
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _reply(self, status: int, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        params = json.loads(self.rfile.read(length) or b"{}") if length else {}
+        if self.path == "/status":
+            return self._reply(200, {"value": {"ready": True, "message": "fake driver ready"}})
+        for method, pattern, command, _ in self.server.routes:
+            match = pattern.match(self.path) if method == self.command else None
+            if match:
+                break
+        else:
+            return self._reply(404, {"value": {"error": "unknown command", "message": self.path}})
+        params.update(match.groupdict())
+        with self.server.lock:
+            response = self.server.executor.execute(command, params)
+        error = response.get("status")
+        if error:
+            value = response["value"]
+            return self._reply(_STATUS.get(error, 500),
+                               {"value": {"error": error, "message": value["message"]}})
+        self._reply(200, {"value": response["value"]})
+
+    do_GET = do_POST = do_DELETE = _handle
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)  # BaseHTTPRequestHandler očekuje (host, port)
+
+
+class FakeDriverServer:
+    """Serves one `FakeExecutor` on background threads; `url` is the driver URL."""
+
+    def __init__(self, shop: FakeShop = None, host: str = "127.0.0.1", port: int = 0,
+                 unix_socket: str = None):
+        self.shop = shop or FakeShop()
+        self.executor = FakeExecutor(self.shop)
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self._servers = []
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def connections(self) -> int:
+        return sum(server.connections for server in self._servers)
+
+    def start(self):
+        tcp = ThreadingHTTPServer((self.host, self.port), _Handler)
+        tcp.daemon_threads = True
+        self.port = tcp.server_address[1]
+        servers = [tcp]
+        if self.unix_socket:
+            if os.path.exists(self.unix_socket):
+                os.remove(self.unix_socket)
+            servers.append(_UnixServer(self.unix_socket, _Handler))
+        routes, lock = _routes(self.executor._handlers), threading.Lock()
+        for server in servers:
+            server.executor, server.routes, server.lock = self.executor, routes, lock
+            server.connections = 0
+            threading.Thread(target=server.serve_forever, args=(0.1,), name="fake-driver",
+                             daemon=True).start()
+        self._servers = servers
+        return self
+
+    def stop(self):
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers = []
+        if self.unix_socket and os.path.exists(self.unix_socket):
+            os.remove(self.unix_socket)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,400 @@
+# src/fake/shop.py
+"""
+State machine of the shop for the fake driver.
+
+Pages are rendered into `src.fake.dom` trees with the same structure and locators as
+saucedemo.com / the stand-in (`src/standin/site.py`). Navigation builds a new document, so
+old element references go stale like in a browser; in-page updates (add/remove, sort, form
+errors) mutate the existing nodes the way React reconciles them.
+"""
+import json
+from urllib.parse import parse_qs, urlsplit
+
+from src.fake.dom import Node, h
+from src.utils.catalog import data_test_id, load_catalog, sorted_catalog
+
+FAKE_URL = "http://shop.fake"
+USERS = ("standard_user", "locked_out_user", "problem_user",
+         "performance_glitch_user", "error_user", "visual_user")
+PASSWORD = "secret_sauce"
+
+ROUTES = {
+    "/": "login",
+    "/index.html": "login",
+    "/inventory.html": "inventory",
+    "/inventory-item.html": "item",
+    "/cart.html": "cart",
+    "/checkout-step-one.html": "step_one",
+    "/checkout-step-two.html": "step_two",
+    "/checkout-complete.html": "complete",
+}
+
+
+def money(value: float) -> str:
+    return f"${value:.2f}"
+
+
+class FakeShop:
+    """
+    catalog:           products (default: src/data/catalog.json)
+    data_test_buttons: listing buttons carry `data-test` ids (False exercises locator fallbacks)
+    listing_buttons:   listing cards have cart buttons at all (False forces the detail-page path)
+    """
+
+    def __init__(self, catalog=None, url: str = FAKE_URL, data_test_buttons: bool = True,
+                 listing_buttons: bool = True):
+        self.catalog = catalog if catalog is not None else load_catalog()
+        self.products = {p["id"]: p for p in self.catalog}
+        self.url = url.rstrip("/")
+        self.data_test_buttons = data_test_buttons
+        self.listing_buttons = listing_buttons
+        self.cookies = {}
+        self.storage = {}
+        self.history = []
+        self.position = -1
+        self.path = None
+        self.query = {}
+        self.document = Node("#document")
+        self._cart_link = None
+
+    # ----- browser state -----
+    @property
+    def current_url(self) -> str:
+        if self.path is None:
+            return "about:blank"
+        return self.history[self.position]
+
+    @property
+    def user(self) -> str:
+        cookie = self.cookies.get("session-username")
+        return cookie["value"] if cookie else ""
+
+    @property
+    def cart(self) -> list:
+        return json.loads(self.storage.get("cart-contents", "[]"))
+
+    @cart.setter
+    def cart(self, ids):
+        self.storage["cart-contents"] = json.dumps(list(ids))
+
+    def navigate(self, url: str):
+        if url.startswith("/"):
+            url = self.url + url
+        del self.history[self.position + 1:]
+        self.history.append(url)
+        self.position += 1
+        self._load()
+
+    def back(self):
+        if self.position > 0:
+            self.position -= 1
+            self._load()
+
+    def forward(self):
+        if self.position < len(self.history) - 1:
+            self.position += 1
+            self._load()
+
+    def refresh(self):
+        self._load()
+
+    def _load(self):
+        parts = urlsplit(self.history[self.position])
+        self.path = parts.path or "/"
+        self.query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        page = ROUTES.get(self.path)
+        self._cart_link = None
+        if page is None:
+            body = h("body", None, h("h1", None, "404 Not Found"))
+        elif page != "login" and not self.user:
+            body = self._login(f"Epic sadface: You can only access '{self.path}' "
+                               "when you are logged in.")
+        else:
+            body = getattr(self, f"_{page}")()
+        self.document = Node("#document", None,
+                             h("html", None, h("head", None, h("title", None, "Swag Labs")), body))
+
+    # ----- shared pieces -----
+    def _header(self, title: str, sort: bool = False):
+        self._cart_link = h("a", {"class": "shopping_cart_link", "data-test": "shopping-cart-link",
+                                  "href": "/cart.html"}, self._badge())
+        self._link(self._cart_link)
+        return [
+            h("div", {"class": "primary_header", "data-test": "primary-header"},
+              h("div", {"id": "menu_button_container"},
+                h("button", {"id": "react-burger-menu-btn"}, "Open Menu")),
+              h("div", {"class": "app_logo"}, "Swag Labs"),
+              h("div", {"id": "shopping_cart_container", "class": "shopping_cart_container"},
+                self._cart_link)),
+            h("div", {"class": "header_secondary_container"},
+              h("span", {"class": "title", "data-test": "title"}, title),
+              self._sort_select() if sort else None),
+        ]
+
+    def _badge(self):
+        n = len(self.cart)
+        if not n:
+            return None
+        return h("span", {"class": "shopping_cart_badge", "data-test": "shopping-cart-badge"},
+                 str(n))
+
+    def _refresh_badge(self):
+        if self._cart_link is not None:
+            self._cart_link.children.clear()
+            self._cart_link.append(self._badge())
+
+    def _link(self, node):
+        node.on_click = lambda: self.navigate(node.attrs["href"])
+        return node
+
+    def _button(self, attrs, text, action):
+        node = h("button", attrs, text)
+        node.on_click = action
+        return node
+
+    def _error(self, container, message: str):
+        container.children.clear()
+        container.append(h("h3", {"data-test": "error"}, message,
+                           h("button", {"class": "error-button", "data-test": "error-button"},
+                             "x")))
+
+    def _cart_button(self, product, detail: bool):
+        btn = h("button", {"data-id": str(product["id"])})
+
+        def toggle():
+            ids = self.cart
+            ids.remove(product["id"]) if product["id"] in ids else ids.append(product["id"])
+            self.cart = ids
+            self._set_cart_button(btn, product, detail)
+            self._refresh_badge()
+
+        btn.on_click = toggle
+        self._set_cart_button(btn, product, detail)
+        return btn
+
+    def _set_cart_button(self, btn, product, detail: bool):
+        added = product["id"] in self.cart
+        action = "remove" if added else "add-to-cart"
+        dt = action if detail else data_test_id(product["name"], action)
+        btn.attrs = {k: v for k, v in btn.attrs.items() if k == "data-id"}
+        btn.attrs["class"] = ("btn btn_small btn_inventory "
+                              + ("btn_secondary" if added else "btn_primary"))
+        if detail or self.data_test_buttons:
+            btn.attrs.update({"data-test": dt, "id": dt, "name": dt})
+        btn.children[:] = ["Remove" if added else "Add to cart"]
+
+    # ----- pages -----
+    def _login(self, error: str = ""):
+        user = h("input", {"class": "form_input", "placeholder": "Username", "type": "text",
+                           "data-test": "username", "id": "user-name", "name": "user-name"})
+        password = h("input", {"class": "form_input", "placeholder": "Password", "type": "password",
+                               "data-test": "password", "id": "password", "name": "password"})
+        errors = h("div", {"class": "error-message-container"})
+        submit = h("input", {"type": "submit", "class": "submit-button btn_action",
+                             "data-test": "login-button", "id": "login-button", "value": "Login"})
+
+        def login():
+            u, p = user.value, password.value
+            if not u:
+                return self._error(errors, "Epic sadface: Username is required")
+            if not p:
+                return self._error(errors, "Epic sadface: Password is required")
+            if u not in USERS or p != PASSWORD:
+                return self._error(errors, "Epic sadface: Username and password do not match "
+                                           "any user in this service")
+            if u == "locked_out_user":
+                return self._error(errors, "Epic sadface: Sorry, this user has been locked out.")
+            self.cookies["session-username"] = {"name": "session-username", "value": u, "path": "/"}
+            self.navigate("/inventory.html")
+
+        submit.on_click = login
+        if error:
+            self._error(errors, error)
+        return h("body", None, h("div", {"class": "login_wrapper"},
+                                 h("div", {"class": "login_logo"}, "Swag Labs"),
+                                 h("form", {"id": "login-form"}, user, password, errors, submit)))
+
+    def _card(self, p):
+        href = f"/inventory-item.html?id={p['id']}"
+        return h("div", {"class": "inventory_item", "data-test": "inventory-item",
+                         "data-id": str(p["id"])},
+                 h("div", {"class": "inventory_item_img"},
+                   self._link(h("a", {"href": href, "id": f"item_{p['id']}_img_link"},
+                                h("img", {"alt": p["name"], "class": "inventory_item_img",
+                                          "src": f"/static/img/{p['img']}"})))),
+                 h("div", {"class": "inventory_item_description",
+                           "data-test": "inventory-item-description"},
+                   h("div", {"class": "inventory_item_label"},
+                     self._link(h("a", {"href": href, "id": f"item_{p['id']}_title_link"},
+                                  h("div", {"class": "inventory_item_name",
+                                            "data-test": "inventory-item-name"},
+                                    p["name"]))),
+                     h("div", {"class": "inventory_item_desc", "data-test": "inventory-item-desc"},
+                       p["desc"])),
+                   h("div", {"class": "pricebar"},
+                     h("div", {"class": "inventory_item_price",
+                               "data-test": "inventory-item-price"},
+                       money(p["price"])),
+                     self._cart_button(p, False) if self.listing_buttons else None)))
+
+    def _sort_select(self):
+        select = h("select", {"class": "product_sort_container",
+                              "data-test": "product-sort-container"})
+        for value, label in (("az", "Name (A to Z)"), ("za", "Name (Z to A)"),
+                             ("lohi", "Price (low to high)"), ("hilo", "Price (high to low)")):
+            option = h("option", {"value": value}, label)
+            option.selected = value == "az"
+            option.on_click = (lambda o: lambda: self._choose(select, o))(option)
+            select.append(option)
+        return select
+
+    def _choose(self, select, option):
+        for o in select.elements():
+            o.selected = o is option
+        select.value = option.attrs["value"]
+        if select.on_change:
+            select.on_change()
+
+    def _sorted(self, mode: str):
+        return sorted_catalog(self.catalog, mode)
+
+    def _inventory(self):
+        cards = {p["id"]: self._card(p) for p in self.catalog}
+        inventory_list = h("div", {"class": "inventory_list", "data-test": "inventory-list"},
+                           [cards[p["id"]] for p in self._sorted("az")])
+        header = self._header("Products", sort=True)
+        select = header[1].elements()[1]
+
+        def resort():
+            inventory_list.children[:] = [cards[p["id"]] for p in self._sorted(select.value)]
+
+        select.on_change = resort
+        return h("body", None, header, h("div", {"id": "inventory_container"}, inventory_list))
+
+    def _item(self):
+        p = self.products.get(int(self.query.get("id", -1)))
+        details = (
+            h("div", {"class": "inventory_details"},
+              h("img", {"class": "inventory_details_img", "alt": p["name"],
+                        "src": f"/static/img/{p['img']}"}),
+              h("div", {"class": "inventory_details_name large_size",
+                        "data-test": "inventory-item-name"}, p["name"]),
+              h("div", {"class": "inventory_details_desc large_size",
+                        "data-test": "inventory-item-desc"}, p["desc"]),
+              h("div", {"class": "inventory_details_price", "data-test": "inventory-item-price"},
+                money(p["price"])),
+              self._cart_button(p, True))
+            if p else h("div", {"class": "inventory_details_name large_size"}, "ITEM NOT FOUND")
+        )
+        back = self._button({"id": "back-to-products", "data-test": "back-to-products"},
+                            "Back to products", lambda: self.navigate("/inventory.html"))
+        return h("body", None, self._header(""),
+                 h("div", {"id": "inventory_item_container", "class": "inventory_item_container"},
+                   back, details))
+
+    def _cart_rows(self, removable: bool):
+        rows = []
+        for pid in self.cart:
+            p = self.products.get(pid)
+            if p is None:
+                continue
+            row = h("div", {"class": "cart_item", "data-test": "inventory-item"},
+                    h("div", {"class": "cart_quantity"}, "1"),
+                    h("div", {"class": "cart_item_label"},
+                      self._link(h("a", {"href": f"/inventory-item.html?id={pid}"},
+                                   h("div", {"class": "inventory_item_name",
+                                             "data-test": "inventory-item-name"},
+                                     p["name"]))),
+                      h("div", {"class": "inventory_item_desc"}, p["desc"]),
+                      h("div", {"class": "item_pricebar"},
+                        h("div", {"class": "inventory_item_price"}, money(p["price"])))))
+            if removable:
+                btn = self._cart_button(p, False)
+                btn.on_click = (lambda r, i: lambda: self._remove_row(r, i))(row, pid)
+                row.elements()[1].elements()[2].append(btn)
+            rows.append(row)
+        return rows
+
+    def _remove_row(self, row, pid):
+        self.cart = [i for i in self.cart if i != pid]
+        row.remove()
+        self._refresh_badge()
+
+    def _cart(self):
+        return h("body", None, self._header("Your Cart"),
+                 h("div", {"id": "cart_contents_container", "class": "cart_contents_container"},
+                   h("div", {"class": "cart_list", "data-test": "cart-list"},
+                     h("div", {"class": "cart_quantity_label"}, "QTY"),
+                     h("div", {"class": "cart_desc_label"}, "Description"),
+                     self._cart_rows(removable=True)),
+                   h("div", {"class": "cart_footer"},
+                     self._button({"id": "continue-shopping", "data-test": "continue-shopping"},
+                                  "Continue Shopping", lambda: self.navigate("/inventory.html")),
+                     self._button({"class": "btn btn_action btn_medium checkout_button",
+                                   "data-test": "checkout", "id": "checkout"}, "Checkout",
+                                  lambda: self.navigate("/checkout-step-one.html")))))
+
+    def _step_one(self):
+        fields = [
+            h("input", {"class": "form_input", "placeholder": placeholder, "type": "text",
+                        "data-test": dt, "id": fid, "name": dt})
+            for placeholder, dt, fid in (("First Name", "firstName", "first-name"),
+                                         ("Last Name", "lastName", "last-name"),
+                                         ("Zip/Postal Code", "postalCode", "postal-code"))
+        ]
+        errors = h("div", {"class": "error-message-container"})
+        submit = h("input", {"type": "submit",
+                             "class": "submit-button btn btn_primary cart_button btn_action",
+                             "data-test": "continue", "id": "continue", "value": "Continue"})
+
+        def submit_form():
+            for field, label in zip(fields, ("First Name", "Last Name", "Postal Code")):
+                if not field.value:
+                    return self._error(errors, f"Error: {label} is required")
+            self.navigate("/checkout-step-two.html")
+
+        submit.on_click = submit_form
+        cancel = self._button({"id": "cancel", "data-test": "cancel"}, "Cancel",
+                              lambda: self.navigate("/cart.html"))
+        return h("body", None, self._header("Checkout: Your Information"),
+                 h("div", {"class": "checkout_info_container"},
+                   h("form", {"id": "checkout-form"},
+                     h("div", {"class": "checkout_info"}, fields, errors),
+                     h("div", {"class": "checkout_buttons"}, cancel, submit))))
+
+    def _step_two(self):
+        total = sum(self.products[i]["price"] for i in self.cart if i in self.products)
+        tax = round(total * 0.08, 2)
+
+        def finish():
+            self.cart = []
+            self.navigate("/checkout-complete.html")
+
+        return h("body", None, self._header("Checkout: Overview"),
+                 h("div", {"id": "checkout_summary_container",
+                           "class": "checkout_summary_container"},
+                   h("div", {"class": "cart_list"}, self._cart_rows(removable=False)),
+                   h("div", {"class": "summary_info"},
+                     h("div", {"class": "summary_subtotal_label", "data-test": "subtotal-label"},
+                       f"Item total: {money(total)}"),
+                     h("div", {"class": "summary_tax_label", "data-test": "tax-label"},
+                       f"Tax: {money(tax)}"),
+                     h("div", {"class": "summary_total_label", "data-test": "total-label"},
+                       f"Total: {money(total + tax)}"),
+                     h("div", {"class": "cart_footer"},
+                       self._button({"id": "cancel", "data-test": "cancel"}, "Cancel",
+                                    lambda: self.navigate("/inventory.html")),
+                       self._button({"class": "btn btn_action btn_medium cart_button",
+                                     "data-test": "finish", "id": "finish"}, "Finish", finish)))))
+
+    def _complete(self):
+        return h("body", None, self._header("Checkout: Complete!"),
+                 h("div", {"id": "checkout_complete_container",
+                           "class": "checkout_complete_container"},
+                   h("h2", {"class": "complete-header", "data-test": "complete-header"},
+                     "Thank you for your order!"),
+                   h("div", {"class": "complete-text", "data-test": "complete-text"},
+                     "Your order has been dispatched, and will arrive just as fast "
+                     "as the pony can get there!"),
+                   self._button({"id": "back-to-products", "data-test": "back-to-products"},
+                                "Back Home", lambda: self.navigate("/inventory.html"))))
@@ -1,29 +1,111 @@
 # src/pages/base_page.py
+import functools
+import importlib
+import os
+import pkgutil
+
+from src.utils.forms import fill_form
+from src.utils.page_graph import exercised
+from src.utils.retry import Retry
 from src.utils.wait import Wait
 
+
+def page_class(name: str):
+    """Registered page class by name; imports the page modules the first time one is missing."""
+    if name not in BasePage.pages:
+        folder = os.path.dirname(os.path.abspath(__file__))
+        for module in pkgutil.iter_modules([folder]):
+            importlib.import_module(f"src.pages.{module.name}")
+    return BasePage.pages[name]
+
+
+def transition(target: str):
+    """
+    Navigation method -> next page: after the method runs, waits until `target` (a page class
+    name) is ready and returns it. The edge is recorded in `src.utils.page_graph.exercised`.
+    A method that returns the target page itself (already checked ready, e.g. fast fill) skips
+    the wait.
+    """
+    def decorate(method):
+        source = method.__qualname__.split(".")[0]
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            page = method(self, *args, **kwargs)
+            if not isinstance(page, page_class(target)):
+                page = page_class(target)(self.driver, self.base_url).wait_ready()
+            exercised.record(source, method.__name__, target)
+            return page
+
+        wrapper.transition_target = target
+        return wrapper
+
+    return decorate
+
+
 class BasePage:
+    # kada je stranica spremna: URL sadrži `url_part` i svi `ready_locators` postoje
+    url_part = None
+    ready_locators = ()
+    pages = {}
+    # --fast-fill: formulari se popunjavaju jednim skriptom umjesto tipkanja (src/utils/forms.py)
+    fast_fill = False
+    # CatalogIndex ovog runa kad ga je neki test zatražio (src/plugins/catalog_index.py)
+    catalog = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        BasePage.pages[cls.__name__] = cls
+
     def __init__(self, driver, base_url: str):
         self.driver = driver
         self.base_url = base_url.rstrip("/")
-        self.wait = Wait(driver)
+        self.wait = Wait(driver, page=type(self).__name__)
+        self.retry = Retry()
+
+    def retry_key(self, locator) -> str:
+        """Telemetry key: page class + locator, e.g. 'LoginPage[id=login-button]'."""
+        by, value = locator
+        return f"{type(self).__name__}[{by}={value}]"
 
     def open(self, path: str = "/"):
         self.driver.get(self.base_url + path)
         return self
 
+    def wait_ready(self):
+        """Wait for the page's readiness conditions with one in-browser check per poll."""
+        self.wait.ready(self.url_part, self.ready_locators)
+        return self
+
     def type(self, locator, text: str):
-        el = self.wait.visible(locator)
-        el.clear()
-        el.send_keys(text)
-        return el
+        def attempt():
+            el = self.wait.visible(locator)
+            el.clear()
+            el.send_keys(text)
+            return el
+
+        return self.retry.call(attempt, key=self.retry_key(locator))
+
+    def fill_form(self, fields: dict, submit, target: str, error_locator=None):
+        """
+        Set all `fields` (locator -> text), click `submit` and return the ready `target` page,
+        in one round trip.
+        """
+        page = page_class(target)
+        fill_form(self.driver, fields, submit, page.url_part, page.ready_locators, error_locator,
+                  timeout=self.wait.timeout)
+        return page(self.driver, self.base_url)
 
     def click(self, locator):
-        el = self.wait.clickable(locator)
-        el.click()
-        return el
+        def attempt():
+            el = self.wait.clickable(locator)
+            el.click()
+            return el
+
+        return self.retry.call(attempt, key=self.retry_key(locator))
 
     def text_of(self, locator) -> str:
-        return self.wait.visible(locator).text
+        return self.retry.call(lambda: self.wait.visible(locator).text, key=self.retry_key(locator))
 
     def is_visible(self, locator) -> bool:
         try:
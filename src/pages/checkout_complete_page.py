@@ -4,5 +4,8 @@ from src.pages.base_page import BasePage
 class CheckoutCompletePage(BasePage):
     _header = (By.CSS_SELECTOR, "h2.complete-header, .complete-header")
 
+    url_part = "/checkout-complete.html"
+    ready_locators = (_header,)
+
     def success_text(self) -> str:
         return self.text_of(self._header)
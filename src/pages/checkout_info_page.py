@@ -1,22 +1,25 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from src.pages.base_page import BasePage
+from src.pages.base_page import BasePage, transition
 
 class CheckoutInfoPage(BasePage):
     _first = (By.ID, "first-name")
     _last = (By.ID, "last-name")
     _zip = (By.ID, "postal-code")
     _continue = (By.ID, "continue")
+    _error = (By.CSS_SELECTOR, "h3[data-test='error']")
 
-    def fill(self, first: str, last: str, zip_code: str):
+    url_part = "/checkout-step-one.html"
+    ready_locators = (_first,)
+
+    @transition("CheckoutOverviewPage")
+    def fill(self, first: str, last: str, zip_code: str, fast: bool = None):
+        """`fast` (default: --fast-fill) sets the form in one script instead of typing."""
+        if self.fast_fill if fast is None else fast:
+            return self.fill_form({self._first: first, self._last: last, self._zip: zip_code},
+                                  self._continue, "CheckoutOverviewPage", error_locator=self._error)
         # osiguraj da su polja vidljiva
         self.wait.visible(self._first)
         self.type(self._first, first)
         self.type(self._last, last)
         self.type(self._zip, zip_code)
         self.click(self._continue)
-
-        # čekaj overview (step two)
-        self.wait.wait.until(EC.url_contains("/checkout-step-two.html"))
-        self.wait.wait.until(EC.presence_of_element_located((By.ID, "finish")))
-        return self
@@ -1,13 +1,18 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from src.pages.base_page import BasePage
+from src.pages.base_page import BasePage, transition
 
 class CheckoutOverviewPage(BasePage):
     _finish = (By.ID, "finish")
+    _subtotal = (By.CSS_SELECTOR, ".summary_subtotal_label")
 
+    url_part = "/checkout-step-two.html"
+    ready_locators = (_finish,)
+
+    def item_total(self) -> float:
+        """'Item total: $29.99' -> 29.99"""
+        text = self.text_of(self._subtotal)
+        return float("".join(ch for ch in text if ch.isdigit() or ch == "."))
+
+    @transition("CheckoutCompletePage")
     def finish(self):
         self.click(self._finish)
-        # čekaj finalnu (complete) stranicu i header
-        self.wait.wait.until(EC.url_contains("/checkout-complete.html"))
-        self.wait.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "h2.complete-header, .complete-header")))
-        return self
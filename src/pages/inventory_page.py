@@ -1,6 +1,5 @@
 # src/pages/inventory_page.py
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
@@ -8,7 +7,10 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.support.ui import Select
 
-from src.pages.base_page import BasePage
+from src.pages.base_page import BasePage, transition
+from src.utils.catalog import data_test_id, sorted_catalog
+from src.utils.element_checks import check_elements
+from src.utils.profiling import profiled
 
 
 class InventoryPage(BasePage):
@@ -18,42 +20,79 @@ class InventoryPage(BasePage):
     _sort_select = (By.CSS_SELECTOR, "select[data-test='product-sort-container']")
     _cart_link = (By.CSS_SELECTOR, ".shopping_cart_link")
     _cart_badge = (By.CSS_SELECTOR, ".shopping_cart_badge")
-
-    _PRODUCT_TO_DATATEST = {
-        "Sauce Labs Backpack": "add-to-cart-sauce-labs-backpack",
-        "Sauce Labs Bike Light": "add-to-cart-sauce-labs-bike-light",
-        "Sauce Labs Bolt T-Shirt": "add-to-cart-sauce-labs-bolt-t-shirt",
-        "Sauce Labs Fleece Jacket": "add-to-cart-sauce-labs-fleece-jacket",
-        "Sauce Labs Onesie": "add-to-cart-sauce-labs-onesie",
-        "Test.allTheThings() T-Shirt (Red)": "add-to-cart-test.allthethings()-t-shirt-(red)",
-    }
+    # '%s' = ime proizvoda
+    _card = (
+        By.XPATH,
+        "//div[contains(@class,'inventory_item')]"
+        "[.//div[(@class='inventory_item_name' or contains(@class,'inventory_item_name') "
+        "or @data-test='inventory-item-name') and normalize-space()='%s']]",
+    )
+
+    url_part = "/inventory.html"
+    ready_locators = (_title, _inventory_items)
+
+    _PRODUCTS_JS = """/* inventoryProducts */
+        var cards = document.querySelectorAll('.inventory_item');
+        return Array.prototype.map.call(cards, function (card) {
+            var name = card.querySelector(
+                ".inventory_item_name, [data-test='inventory-item-name']");
+            var price = card.querySelector(
+                ".inventory_item_price, [data-test='inventory-item-price']");
+            var link = card.querySelector("a[id$='_title_link']");
+            return [
+                link ? parseInt(link.id.split('_')[1], 10) : null,
+                name ? name.textContent.replace(/\\s+/g, ' ').trim() : null,
+                price ? parseFloat(price.textContent.replace(/[^0-9.]/g, '')) : null
+            ];
+        });"""
 
     # ----- Status/helpers -----
+    @profiled("inventory load")
+    def _load(self, wait):
+        # isti korak za @transition (wait_ready) i za login() + is_loaded() u testovima
+        return wait()
+
+    def wait_ready(self):
+        return self._load(super().wait_ready)
+
     def is_loaded(self) -> bool:
-        return self.is_visible(self._title)
+        return self._load(lambda: self.is_visible(self._title))
 
     def item_names(self):
-        self.wait.wait.until(EC.presence_of_all_elements_located(self._inventory_items))
-        items = self.driver.find_elements(*self._inventory_items)
-        names = []
-        for i in items:
-            try:
-                names.append(
-                    i.find_element(By.CSS_SELECTOR, ".inventory_item_name, [data-test='inventory-item-name']").text
-                )
-            except NoSuchElementException:
-                continue
-        return names
+        return [p["name"] for p in self.products() if p["name"] is not None]
 
+    def products(self):
+        """
+        Id, name and price of every card in listing order, read with one script call instead
+        of 2 round trips per card (the id comes from the 'item_<id>_title_link' anchor).
+        """
+        self.wait.all_present(self._inventory_items)
+        rows = self.driver.execute_script(self._PRODUCTS_JS)
+        return [{"id": pid, "name": name, "price": price} for pid, name, price in rows]
+
+    def expected_names(self, mode: str) -> list:
+        """Names in `mode` order from the run's catalog index; without one, from the listing."""
+        if self.catalog is not None:
+            return self.catalog.sorted_names(mode)
+        return [p["name"] for p in sorted_catalog(self.products(), mode)]
+
+    def check_cards(self, checks):
+        """Run `Check`s (src/utils/element_checks.py) in every product card, in one script call."""
+        self.wait.all_present(self._inventory_items)
+        return check_elements(self.driver, checks, scope=self._inventory_items[1])
+
+    @profiled("sort")
     def sort(self, mode: str):
         """mode ∈ {'az','za','lohi','hilo'}"""
-        self.wait.wait.until(EC.element_to_be_clickable(self._sort_select))
+        self.wait.clickable(self._sort_select)
         Select(self.driver.find_element(*self._sort_select)).select_by_value(mode)
-        self.wait.wait.until(EC.presence_of_all_elements_located(self._inventory_items))
+        self.wait.all_present(self._inventory_items)
         return self
 
     def cart_badge_count(self) -> int:
-        return int(self.driver.find_element(*self._cart_badge).text) if self.is_visible(self._cart_badge) else 0
+        # prazna korpa nema badge — find_elements ne čeka puni timeout da to potvrdi
+        badges = self.driver.find_elements(*self._cart_badge)
+        return int(badges[0].text) if badges and badges[0].is_displayed() else 0
 
     def cart_count(self) -> int:
         return self.cart_badge_count()
@@ -68,15 +107,11 @@ class InventoryPage(BasePage):
         - potvrđuje se preko 'remove-*' ili badge +1
         """
         # Listing učitan
-        self.wait.wait.until(EC.presence_of_element_located(self._title))
-        self.wait.wait.until(EC.presence_of_all_elements_located(self._inventory_items))
+        self.wait.present(self._title)
+        self.wait.all_present(self._inventory_items)
 
         # Kartica proizvoda (OBAVEZNO navodnici u XPath-u)
-        card_xpath = (
-            "//div[contains(@class,'inventory_item')]"
-            "[.//div[(@class='inventory_item_name' or contains(@class,'inventory_item_name') "
-            "or @data-test='inventory-item-name') and normalize-space()='%s']]" % product_name
-        )
+        card_xpath = self._card[1] % product_name
         try:
             card = self.driver.find_element(By.XPATH, card_xpath)
         except NoSuchElementException:
@@ -91,40 +126,32 @@ class InventoryPage(BasePage):
             pass
 
         # Primarni lokator: data-test, pa fallbackovi
-        data_test = self._PRODUCT_TO_DATATEST.get(product_name)
-        add_locators = []
-        if data_test:
-            add_locators.append((By.CSS_SELECTOR, f"button[data-test='{data_test}']"))
-        add_locators += [
+        add_locators = [
+            (By.CSS_SELECTOR, f"button[data-test='{data_test_id(product_name)}']"),
             (By.XPATH, ".//button[contains(@data-test,'add-to-cart')]"),
             (By.XPATH, ".//button[normalize-space()='Add to cart']"),
             (By.CSS_SELECTOR, ".pricebar button.btn_inventory"),
         ]
 
-        import time
-
-        def click_with_retry(container_locator, button_locator, retries=3, pause=0.25):
+        def click_in(container_locator, button_locator):
             """
             Svaki pokušaj ponovo traži i karticu i dugme (izbjegava stale).
             container_locator: (By, value) koji opisuje trenutnu karticu/okvir
             button_locator: (By, value) za dugme unutar tog okvira
+            NoSuchElement se ne ponavlja: znači da ovaj lokator ne postoji, ide se na sljedeći.
             """
-            last_err = None
-            for _ in range(retries):
-                try:
-                    container = self.driver.find_element(*container_locator)
-                    self.driver.execute_script("arguments[0].scrollIntoView({block:'center'})", container)
-                    btn = container.find_element(*button_locator)
-                    # `element_to_be_clickable` sa lokatorom preko lambda re-find:
-                    self.wait.wait.until(lambda d: btn.is_displayed() and btn.is_enabled())
-                    btn.click()
-                    return True
-                except (StaleElementReferenceException, NoSuchElementException) as e:
-                    last_err = e
-                    time.sleep(pause)
-            if last_err:
-                raise last_err
-            return False
+            def attempt():
+                container = self.driver.find_element(*container_locator)
+                self.driver.execute_script(
+                    "arguments[0].scrollIntoView({block:'center'})", container
+                )
+                btn = container.find_element(*button_locator)
+                self.wait.until(lambda d: btn.is_displayed() and btn.is_enabled(),
+                                "%s=%s" % button_locator)
+                btn.click()
+                return True
+
+            return self.retry.call(attempt, key=self.retry_key(button_locator))
 
         # Locator za “trenutnu” karticu (da je lako refind-amo u retry-ju)
         card_locator = (By.XPATH, card_xpath)
@@ -133,7 +160,7 @@ class InventoryPage(BasePage):
         before = self.cart_badge_count()
         for loc in add_locators:
             try:
-                if click_with_retry(card_locator, loc):
+                if click_in(card_locator, loc):
                     break
             except (NoSuchElementException, StaleElementReferenceException):
                 continue
@@ -144,12 +171,12 @@ class InventoryPage(BasePage):
                     By.XPATH, card_xpath + "//*[@data-test='inventory-item-name' or contains(@class,'inventory_item_name')]"
                 )
                 name_el.click()
-                self.wait.wait.until(EC.presence_of_element_located((By.ID, "inventory_item_container")))
                 detail_locator = (By.ID, "inventory_item_container")
+                self.wait.present(detail_locator)
 
                 for loc in add_locators:
                     try:
-                        if click_with_retry(detail_locator, loc):
+                        if click_in(detail_locator, loc):
                             break
                     except (NoSuchElementException, StaleElementReferenceException):
                         continue
@@ -157,42 +184,31 @@ class InventoryPage(BasePage):
                     return False
 
                 # Potvrda na detalju
-                try:
-                    if data_test:
-                        remove_dt = data_test.replace("add-to-cart", "remove")
-                        self.wait.wait.until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, f"button[data-test='{remove_dt}']"))
-                        )
-                    else:
-                        self.wait.wait.until(EC.text_to_be_present_in_element((By.XPATH, "//button"), "Remove"))
-                except TimeoutException:
-                    self.wait.wait.until(lambda d: self.cart_badge_count() == before + 1)
+                self._wait_added("//*[@id='inventory_item_container']", before)
 
                 # Nazad na listing
                 self.driver.back()
-                self.wait.wait.until(EC.presence_of_all_elements_located(self._inventory_items))
+                self.wait.all_present(self._inventory_items)
                 return True
 
             except (NoSuchElementException, TimeoutException):
                 return False
 
         # Potvrda na listingu
-        try:
-            if data_test:
-                remove_dt = data_test.replace("add-to-cart", "remove")
-                self.wait.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, f"button[data-test='{remove_dt}']"))
-                )
-            else:
-                # bar promjena teksta na prvom dugmetu u kartici
-                self.wait.wait.until(EC.text_to_be_present_in_element((By.XPATH, ".//button"), "Remove"))
-        except TimeoutException:
-            self.wait.wait.until(lambda d: self.cart_badge_count() == before + 1)
-
+        self._wait_added(card_xpath, before)
         return True
 
+    def _wait_added(self, container_xpath: str, before: int):
+        """
+        Dodavanje je potvrđeno kad se u okviru pojavi 'Remove' dugme ILI badge poraste — šta god
+        prvo; jedan wait umjesto punog timeout-a na lokatoru koji možda ne postoji.
+        """
+        remove = (By.XPATH, container_xpath + "//button[starts-with(@data-test,'remove') "
+                                              "or normalize-space()='Remove']")
+        self.wait.until(lambda d: (bool(d.find_elements(*remove))
+                                   or self.cart_badge_count() == before + 1),
+                        "added")
+
+    @transition("CartPage")
     def open_cart(self):
         self.click(self._cart_link)
-        self.wait.wait.until(EC.url_contains("/cart.html"))
-        self.wait.wait.until(EC.presence_of_element_located((By.ID, "cart_contents_container")))
-        return self
@@ -1,5 +1,7 @@
 from selenium.webdriver.common.by import By
-from .base_page import BasePage
+from .base_page import BasePage, transition
+from src.utils.profiling import profiled
+from src.utils.timeouts import set_persona
 
 
 class LoginPage(BasePage):
@@ -8,14 +10,24 @@ class LoginPage(BasePage):
     _login_btn = (By.ID, "login-button")
     _error = (By.CSS_SELECTOR, "h3[data-test='error']")
 
+    ready_locators = (_login_btn,)
+
     def open_login(self):
         return self.open("/")
 
+    @profiled("login submit")
     def login(self, username: str, password: str):
+        # persona za naučene timeoute (src/utils/timeouts.py)
+        set_persona(self.driver, username)
         self.type(self._user, username)
         self.type(self._pass, password)
         self.click(self._login_btn)
         return self
 
+    @transition("InventoryPage")
+    def sign_in(self, username: str, password: str):
+        """`login` that must succeed: returns the loaded InventoryPage."""
+        self.login(username, password)
+
     def error_text(self) -> str:
         return self.text_of(self._error)
@@ -0,0 +1,76 @@
+# src/plugins/adaptive_timeouts.py
+"""
+Learned wait timeouts (src/utils/timeouts.py).
+
+    pytest --adaptive-timeouts                          # learn + use .qa-cache/wait-durations.json
+    pytest --adaptive-timeouts --timeout-factor 4 --timeout-floor 2 --timeout-ceiling 60
+
+Every successful wait is recorded per (persona, page, locator); once a key has 5 samples its
+timeout is p99 × factor within [floor, ceiling] instead of the fixed 10s. The implicit wait is
+set to 0 so a missing element costs the learned timeout, not the timeout plus implicit polls.
+Workers send their new samples to the controller, which saves the merged history.
+"""
+import os
+
+import pytest
+
+from src.utils.timeouts import TIMEOUTS_PATH, wait_history
+from src.utils.wait import DEFAULT_TIMEOUT
+
+
+def pytest_addoption(parser):
+    parser.addoption("--adaptive-timeouts", action="store_true",
+                     default=os.getenv("ADAPTIVE_TIMEOUTS", "").lower() in ("1", "true", "yes"),
+                     help="Learn wait timeouts per persona/page/locator from past runs")
+    parser.addoption("--wait-durations", action="store", default=TIMEOUTS_PATH,
+                     help="History of observed wait durations")
+    parser.addoption("--timeout-factor", action="store", type=float, default=3.0,
+                     help="Learned timeout = p99 of observed waits × factor")
+    parser.addoption("--timeout-floor", action="store", type=float, default=1.0)
+    parser.addoption("--timeout-ceiling", action="store", type=float, default=30.0)
+
+
+def pytest_configure(config):
+    wait_history.reset()
+    wait_history.enabled = config.getoption("--adaptive-timeouts")
+    if not wait_history.enabled:
+        return
+    wait_history.path = config.getoption("--wait-durations")
+    wait_history.factor = config.getoption("--timeout-factor")
+    wait_history.floor = config.getoption("--timeout-floor")
+    wait_history.ceiling = config.getoption("--timeout-ceiling")
+    wait_history.load()
+
+
+def pytest_unconfigure(config):
+    wait_history.enabled = False
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get("wait_durations")
+    if data:
+        wait_history.merge(data)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if not wait_history.enabled:
+        return
+    if hasattr(config, "workerinput"):
+        config.workeroutput["wait_durations"] = wait_history.new_samples()
+    elif wait_history.new_samples():
+        wait_history.save()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or not wait_history.enabled:
+        return
+    learned = wait_history.learned(DEFAULT_TIMEOUT)
+    if not learned:
+        return
+    terminalreporter.section("adaptive timeouts")
+    terminalreporter.write_line(f"{len(learned)} learned timeout(s), history: {wait_history.path}")
+    ranked = sorted(learned.items(), key=lambda kv: kv[1])
+    for key, seconds in ranked[:5] + [kv for kv in ranked[-5:] if kv not in ranked[:5]]:
+        terminalreporter.write_line(f"  {seconds:>6.2f}s  {key}")
@@ -0,0 +1,207 @@
+# src/plugins/browser_matrix.py
+"""
+Cross-browser matrix in one run: `--browsers chrome:3,firefox:2`.
+
+- every test that uses `browser_name` (so every `driver` test) runs once per browser,
+  with the browser in its id: test_login_success[chrome], test_login_success[firefox]
+- with xdist the workers are split into one pool per browser (3 + 2 above, `-n` is set to the
+  total) and a browser's tests only go to its own pool, so the browsers run side by side;
+  tests without a browser go to any worker
+- the end of the run has one table with tests, outcomes, summed and wall-clock time per browser
+  (also in reports/browser-matrix.json and as a "Browser" column in the pytest-html report)
+"""
+import json
+import os
+import re
+from collections import defaultdict
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+REPORT_PATH = "reports/browser-matrix.json"
+_browsers = []
+_stats = defaultdict(lambda: {"tests": 0, "passed": 0, "failed": 0, "skipped": 0,
+                              "seconds": 0.0, "start": None, "stop": None})
+
+
+def parse_browsers(value: str) -> dict:
+    """'chrome:3,firefox' -> {'chrome': 3, 'firefox': 1} (order kept)."""
+    groups = {}
+    for part in filter(None, (p.strip() for p in (value or "").split(","))):
+        name, _, size = part.partition(":")
+        groups[name.lower()] = int(size) if size else 1
+        if groups[name.lower()] < 1:
+            raise pytest.UsageError(f"--browsers: pool size for {name} must be >= 1")
+    return groups
+
+
+def browser_of(nodeid: str, browsers) -> str:
+    """Browser a test id was parametrized with, or None."""
+    m = re.search(r"\[(.*)\]$", nodeid)
+    if not m:
+        return None
+    parts = m.group(1).split("-")
+    return next((b for b in browsers if b in parts), None)
+
+
+def group_of_worker(worker_id: str, groups: dict) -> str:
+    """Workers go to the pools in order: chrome:2,firefox:1 -> gw0,gw1 chrome, gw2 firefox."""
+    index = int(worker_id.lstrip("gw"))
+    for name, size in groups.items():
+        if index < size:
+            return name
+        index -= size
+    return None
+
+
+class BrowserPoolScheduling(LoadScheduling):
+    """xdist load scheduling where every worker belongs to one browser pool."""
+
+    def __init__(self, config, log, groups: dict):
+        super().__init__(config, log)
+        self.groups = groups
+        self.node2group = {}
+        self.index2group = []
+
+    def add_node(self, node):
+        super().add_node(node)
+        self.node2group[node] = group_of_worker(node.gateway.id, self.groups)
+
+    def _eligible(self, node) -> list:
+        group = self.node2group.get(node)
+        return [i for i in self.pending if self.index2group[i] in (group, None)]
+
+    def schedule(self):
+        assert self.collection_is_completed
+        if self.collection is None:
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+            self.collection = next(iter(self.node2collection.values()))
+            self.pending[:] = range(len(self.collection))
+            self.index2group = [browser_of(nodeid, self.groups) for nodeid in self.collection]
+            if self.maxschedchunk is None:
+                self.maxschedchunk = len(self.collection)
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def check_schedule(self, node, duration: float = 0):
+        if node.shutting_down or self.collection is None:
+            return
+        eligible = self._eligible(node)
+        if not eligible:
+            node.shutdown()
+            return
+        pool = self.groups.get(self.node2group.get(node)) or len(self.nodes)
+        node_pending = self.node2pending[node]
+        items_min = max(2, len(eligible) // pool // 4)
+        items_max = max(2, len(eligible) // pool // 2)
+        if len(node_pending) < items_min:
+            if duration >= 0.1 and len(node_pending) >= 2:
+                return
+            num = min(items_max - len(node_pending), max(2 - len(node_pending), self.maxschedchunk))
+            self._send_indices(node, eligible[:num])
+
+    def _send_indices(self, node, indices):
+        if not indices:
+            return
+        for i in indices:
+            self.pending.remove(i)
+        self.node2pending[node].extend(indices)
+        node.send_runtest_some(indices)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browsers",
+        action="store",
+        default=os.getenv("BROWSERS", ""),
+        help="Run every driver test per browser, each browser in its own worker pool: "
+        "chrome:3,firefox:2",
+    )
+
+
+def _groups(config) -> dict:
+    return parse_browsers(config.getoption("--browsers"))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    groups = _groups(config)
+    # -n = zbir pool-ova (prije nego xdist iz -n napravi listu workera)
+    if groups and getattr(config.option, "numprocesses", None) not in (None, 0):
+        config.option.numprocesses = sum(groups.values())
+
+
+def pytest_generate_tests(metafunc):
+    groups = _groups(metafunc.config)
+    if groups and "browser_name" in metafunc.fixturenames:
+        metafunc.parametrize("browser_name", list(groups), indirect=True, ids=list(groups))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    groups = _groups(config)
+    if not groups:
+        return None
+    return BrowserPoolScheduling(config, log, groups)
+
+
+def pytest_runtest_logreport(report):
+    browser = browser_of(report.nodeid, _browsers) if _browsers else None
+    if browser is None:
+        return
+    stats = _stats[browser]
+    stats["seconds"] += report.duration
+    start, stop = getattr(report, "start", None), getattr(report, "stop", None)
+    if start is not None:
+        stats["start"] = start if stats["start"] is None else min(stats["start"], start)
+        stats["stop"] = stop if stats["stop"] is None else max(stats["stop"], stop)
+    if report.when == "call" or (report.when == "setup" and not report.passed):
+        stats["tests"] += 1
+        stats["passed" if report.passed else "failed" if report.failed else "skipped"] += 1
+
+
+def pytest_configure(config):
+    _browsers[:] = list(_groups(config))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or not _stats:
+        return
+    groups = _groups(config)
+    rows = {}
+    for browser in groups:
+        s = _stats.get(browser)
+        if not s:
+            continue
+        wall = (s["stop"] - s["start"]) if s["start"] is not None else None
+        rows[browser] = {"pool": groups[browser], "tests": s["tests"], "passed": s["passed"],
+                         "failed": s["failed"], "skipped": s["skipped"],
+                         "test_seconds": round(s["seconds"], 2),
+                         "wall_seconds": round(wall, 2) if wall is not None else None}
+
+    terminalreporter.section("browser matrix")
+    terminalreporter.write_line(f"{'browser':<10}{'pool':>5}{'tests':>7}{'passed':>8}{'failed':>8}"
+                                f"{'skipped':>9}{'test time':>11}{'wall':>9}")
+    for browser, r in rows.items():
+        wall = f"{r['wall_seconds']:>8.1f}s" if r["wall_seconds"] is not None else f"{'-':>9}"
+        terminalreporter.write_line(
+            f"{browser:<10}{r['pool']:>5}{r['tests']:>7}{r['passed']:>8}{r['failed']:>8}"
+            f"{r['skipped']:>9}{r['test_seconds']:>10.1f}s{wall}"
+        )
+    os.makedirs(os.path.dirname(REPORT_PATH), exist_ok=True)
+    with open(REPORT_PATH, "w", encoding="utf-8") as f:
+        json.dump(rows, f, indent=2)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_header(cells):
+    if _browsers:
+        cells.insert(2, "<th>Browser</th>")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_row(report, cells):
+    if _browsers:
+        cells.insert(2, f"<td>{browser_of(report.nodeid, _browsers) or ''}</td>")
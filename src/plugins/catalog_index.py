@@ -0,0 +1,109 @@
+# src/plugins/catalog_index.py
+"""
+One catalog index per run (`CatalogIndex`, src/utils/catalog.py), shared by every xdist worker.
+
+    pytest --catalog-source file        # default: src/data/catalog.json (--catalog-file)
+    pytest --catalog-source ui          # scraped from the inventory page with one script call
+
+The first worker that asks for the `catalog` fixture builds the index and writes it to a
+directory the controller hands to all workers; the others wait for that file and load it, so
+a `ui` run opens one extra browser in total, not one per worker. Page objects see it as
+`BasePage.catalog`.
+"""
+import os
+import shutil
+import tempfile
+import time
+
+import pytest
+
+from src.pages.base_page import BasePage
+from src.pages.login_page import LoginPage
+from src.utils.catalog import CATALOG_PATH, CatalogIndex, load_catalog
+from src.utils.driver_factory import build_driver, parse_window_size
+
+_DIR_KEY = "catalog_dir"
+_state = {"dir": None}
+BUILD_TIMEOUT = 180
+
+
+def pytest_addoption(parser):
+    parser.addoption("--catalog-source", action="store", choices=("file", "ui"),
+                     default=os.getenv("CATALOG_SOURCE", "file"),
+                     help="Build the catalog index from --catalog-file "
+                          "or by scraping the inventory page")
+    parser.addoption("--catalog-file", action="store", default=CATALOG_PATH)
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        _state["dir"] = config.workerinput.get(_DIR_KEY)
+    else:
+        _state["dir"] = tempfile.mkdtemp(prefix="qa-catalog-")
+
+
+def pytest_unconfigure(config):
+    BasePage.catalog = None
+    if not hasattr(config, "workerinput") and _state["dir"]:
+        shutil.rmtree(_state["dir"], ignore_errors=True)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput[_DIR_KEY] = _state["dir"]
+
+
+def scrape_catalog(config, base_url: str, credentials: dict) -> CatalogIndex:
+    """Log in with a throwaway browser and read every card with one script call."""
+    drv = build_driver(config.getoption("--browser").lower(), config.getoption("--headed"),
+                       parse_window_size(config.getoption("--window-size")), 0,
+                       config.getoption("--browser-profile"))
+    try:
+        inventory = LoginPage(drv, base_url).open_login().sign_in(credentials["username"],
+                                                                  credentials["password"])
+        return CatalogIndex(inventory.products(), source=f"ui {base_url}")
+    finally:
+        drv.quit()
+
+
+def shared_index(folder: str, build, timeout: float = BUILD_TIMEOUT) -> CatalogIndex:
+    """Build once per `folder`: the process that creates the lock file builds, the rest wait."""
+    path = os.path.join(folder, "catalog-index.json")
+    lock = path + ".lock"
+    if os.path.exists(path):
+        return CatalogIndex.load(path)
+    try:
+        os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(path):
+            if not os.path.exists(lock):
+                return shared_index(folder, build, timeout)  # graditelj pao -> pokušaj sam
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"catalog index not built within {timeout}s ({path})")
+            time.sleep(0.1)
+        return CatalogIndex.load(path)
+    try:
+        if os.path.exists(path):  # izgrađen između provjere i lock-a
+            return CatalogIndex.load(path)
+        index = build()
+        index.save(path)
+        return index
+    finally:
+        os.remove(lock)
+
+
+@pytest.fixture(scope="session")
+def catalog(pytestconfig, base_url, test_data):
+    """CatalogIndex of the shop under test, built once per run."""
+    if pytestconfig.getoption("--catalog-source") == "ui":
+        def build():
+            return scrape_catalog(pytestconfig, base_url, test_data["valid"])
+    else:
+        def build():
+            path = pytestconfig.getoption("--catalog-file")
+            return CatalogIndex(load_catalog(path), source=path)
+
+    index = shared_index(_state["dir"], build) if _state["dir"] else build()
+    BasePage.catalog = index
+    return index
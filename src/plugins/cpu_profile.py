@@ -0,0 +1,106 @@
+# src/plugins/cpu_profile.py
+"""
+Opt-in CPU profiling of page-object steps (src/utils/profiling.py): login submit, inventory
+load, sort.
+
+    pytest --cpu-profile                           # keep profiles of failing and >10s tests
+    pytest --cpu-profile --cpu-profile-budget 3
+
+Every `@profiled` step of a driver test is profiled through CDP (Chrome/Edge; other browsers
+run unprofiled). Profiles of passing tests within the budget are dropped; for the others
+reports/profiles/<test>/NN-<step>.cpuprofile is written, the test report gets a "cpu profile"
+section with the top self-time functions per step, and the run ends with a table of them.
+"""
+import os
+import re
+
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.profiling import DEFAULT_INTERVAL_US, StepProfiler, format_summary, summarize
+
+PROFILE_DIR = "reports/profiles"
+_PROFILER = pytest.StashKey()
+_profiled = []
+
+
+def pytest_addoption(parser):
+    parser.addoption("--cpu-profile", action="store_true",
+                     default=os.getenv("CPU_PROFILE", "").lower() in ("1", "true", "yes"),
+                     help="Profile page-object steps; "
+                          "keep profiles of failing or over-budget tests")
+    parser.addoption("--cpu-profile-budget", action="store", type=float,
+                     default=float(os.getenv("CPU_PROFILE_BUDGET", "10")),
+                     help="Seconds (test call) above which a passing test keeps its profiles")
+    parser.addoption("--cpu-profile-interval", action="store", type=int,
+                     default=DEFAULT_INTERVAL_US, help="Sampling interval in microseconds")
+    parser.addoption("--cpu-profile-dir", action="store", default=PROFILE_DIR)
+
+
+def pytest_configure(config):
+    _profiled.clear()
+
+
+def pytest_unconfigure(config):
+    _profiled.clear()
+
+
+def _drivers(item):
+    return [v for v in getattr(item, "funcargs", {}).values() if isinstance(v, WebDriver)]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    enabled = item.config.getoption("--cpu-profile")
+    drivers = [d for d in _drivers(item) if StepProfiler.supported(d)] if enabled else []
+    if drivers:
+        profiler = StepProfiler(drivers[0],
+                                interval_us=item.config.getoption("--cpu-profile-interval"))
+        item.stash[_PROFILER] = profiler.attach()
+    yield
+    if drivers:
+        item.stash[_PROFILER].detach()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    profiler = item.stash.get(_PROFILER, None)
+    if profiler is None or report.when != "call" or not profiler.steps:
+        return
+    over_budget = report.duration > item.config.getoption("--cpu-profile-budget")
+    if not (report.failed or over_budget):
+        return
+
+    folder = os.path.join(item.config.getoption("--cpu-profile-dir"),
+                          re.sub(r"[^\w.-]+", "_", item.nodeid).strip("_"))
+    profiler.save(folder)
+    steps = [{"step": s.step, "seconds": round(s.seconds, 3),
+              "summary": summarize(s.profile) if s.profile else None} for s in profiler.steps]
+    reason = "failed" if report.failed else f"over budget ({report.duration:.1f}s)"
+    text = "\n".join(format_summary(s["step"], s["seconds"], s["summary"]) for s in steps)
+    report.sections.append(("cpu profile", f"{reason}, profiles: {folder}\n{text}"))
+    # user_properties stižu i do xdist kontrolera -> tabela na kraju
+    report.user_properties.append(("cpu_profile",
+                                   {"reason": reason, "folder": folder, "steps": steps}))
+
+
+def pytest_runtest_logreport(report):
+    for name, value in report.user_properties:
+        if name == "cpu_profile":
+            _profiled.append((report.nodeid, value))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or not _profiled:
+        return
+    terminalreporter.section("cpu profiles")
+    for nodeid, data in _profiled:
+        terminalreporter.write_line(f"{nodeid}  [{data['reason']}]  {data['folder']}")
+        for s in data["steps"]:
+            top = s["summary"]["top"][:3] if s["summary"] else []
+            hot = ", ".join(f"{f['function']} {f['self_ms']:.0f}ms" for f in top) or "-"
+            idle = s["summary"]["categories"]["idle"] if s["summary"] else 0
+            terminalreporter.write_line(f"  {s['step']:<16}{s['seconds']:>7.2f}s  "
+                                        f"idle {idle:>6.0f}ms  top: {hot}")
@@ -0,0 +1,146 @@
+# src/plugins/gates.py
+"""
+Fail-fast gates: when a gating flow breaks, its dependents are skipped instead of timing out.
+
+    @pytest.mark.gate("login")                  # test_login_success gates "login"
+    pytestmark = pytest.mark.needs("login")     # every test in the module depends on it
+
+- gate tests are moved to the front of the run (gates that need other gates after those)
+- a dependent waits until all tests of its gates have reported (`--gate-timeout`), then
+  runs if they passed and is skipped with "gate 'login' failed: <test>" if one failed
+- with xdist every worker sees every gate result (files in a directory the controller creates)
+- with --browsers a gate only covers dependents of the same browser
+- a gate that is not in the run (deselected, other shard) blocks nothing; `--no-gates` turns
+  all of it off
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import pytest
+
+_DIR_KEY = "gates_dir"
+_state = {"dir": None, "gates": {}}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--no-gates", action="store_true", help="Ignore gate/needs markers")
+    parser.addoption("--gate-timeout", action="store", type=float, default=600.0,
+                     help="Seconds a dependent waits for its gate tests before running anyway")
+
+
+def pytest_configure(config):
+    if hasattr(config, "workerinput"):
+        _state["dir"] = config.workerinput.get(_DIR_KEY)
+    else:
+        _state["dir"] = tempfile.mkdtemp(prefix="qa-gates-")
+    _state["gates"] = {}
+
+
+def pytest_unconfigure(config):
+    if not hasattr(config, "workerinput") and _state["dir"]:
+        shutil.rmtree(_state["dir"], ignore_errors=True)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput[_DIR_KEY] = _state["dir"]
+
+
+def _browser(item):
+    callspec = getattr(item, "callspec", None)
+    return callspec.params.get("browser_name") if callspec else None
+
+
+def _gates_of(item) -> list:
+    return [m.args[0] for m in item.iter_markers("gate")]
+
+
+def _needs_of(item) -> list:
+    return sorted({name for m in item.iter_markers("needs") for name in m.args})
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--no-gates"):
+        return
+    gates = {}
+    for item in items:
+        for gate in _gates_of(item):
+            gates.setdefault((gate, _browser(item)), []).append(item.nodeid)
+    _state["gates"] = gates
+    order_gates(items)
+
+
+def order_gates(items):
+    """Gate tests first, the rest keeps its order (re-applied by src/plugins/time_budget.py)."""
+    # gate koji i sam nešto treba ide poslije onih bez zavisnosti
+    order = {item.nodeid: i for i, item in enumerate(items)}
+
+    def rank(item):
+        if _gates_of(item):
+            return 0, len(_needs_of(item)), order[item.nodeid]
+        return 1, 0, order[item.nodeid]
+
+    items.sort(key=rank)
+
+
+def _result_path(gate: str, browser, nodeid: str) -> str:
+    digest = hashlib.sha1(f"{gate}|{browser}|{nodeid}".encode()).hexdigest()[:16]
+    return os.path.join(_state["dir"], f"{digest}.json")
+
+
+def _result(gate: str, browser, nodeid: str):
+    try:
+        with open(_result_path(gate, browser, nodeid), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def pytest_runtest_setup(item):
+    if item.config.getoption("--no-gates") or not _state["dir"]:
+        return
+    browser = _browser(item)
+    deadline = time.monotonic() + item.config.getoption("--gate-timeout")
+    for gate in _needs_of(item):
+        members = [n for n in _state["gates"].get((gate, browser), []) if n != item.nodeid]
+        pending = list(members)
+        while pending:
+            for nodeid in list(pending):
+                result = _result(gate, browser, nodeid)
+                if result is None:
+                    continue
+                if result["outcome"] == "failed":
+                    detail = f" ({result['message']})" if result["message"] else ""
+                    pytest.skip(f"gate '{gate}' failed: {nodeid}{detail}")
+                pending.remove(nodeid)
+            if pending:
+                if time.monotonic() > deadline:
+                    break
+                time.sleep(0.2)
+
+
+def pytest_runtest_logreport(report):
+    if not _state["dir"] or not report.keywords.get("gate"):
+        return
+    if report.when != "teardown" and not report.failed:
+        return
+    # gate je gotov kad padne (bilo koja faza) ili kad prođe teardown
+    for (gate, browser), members in _state["gates"].items():
+        if report.nodeid not in members:
+            continue
+        path = _result_path(gate, browser, report.nodeid)
+        if os.path.exists(path):
+            continue
+        message = ""
+        if report.failed:
+            crash = getattr(report.longrepr, "reprcrash", None)
+            message = crash.message.splitlines()[0][:200] if crash else ""
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"outcome": "failed" if report.failed else "passed", "message": message}, f)
+        os.replace(tmp, path)
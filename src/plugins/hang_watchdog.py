@@ -0,0 +1,153 @@
+# src/plugins/hang_watchdog.py
+"""
+Per-test wall-clock limits (src/utils/hang_watchdog.py): a hung browser costs one test, not
+the worker.
+
+    pytest --test-timeout 300                       # default 600s, 0 = off
+    pytest --marker-timeout smoke=60 --marker-timeout regression=180
+    @pytest.mark.time_limit(30)                     # on one test
+
+Limit per test: its `time_limit` marker, else the smallest `--marker-timeout` of its markers,
+else `--test-timeout`; it covers setup, call and teardown (pytest's reporting hooks in between
+count towards it but are never interrupted). When it passes, the driver process
+trees are killed, the test fails as TIMEOUT with the stack it was stuck in (and the failure
+trace of src/plugins/trace_recorder.py), and the browser pool starts a new session.
+"""
+import os
+
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.hang_watchdog import HangWatchdog
+
+_DEADLINE = pytest.StashKey()
+_REPORTED = pytest.StashKey()
+_WATCHDOG = pytest.StashKey()
+_timeouts = []
+
+
+def pytest_addoption(parser):
+    parser.addoption("--test-timeout", action="store", type=float,
+                     default=float(os.getenv("TEST_TIMEOUT", "600")),
+                     help="Seconds one test (setup + call + teardown) may take before its "
+                          "browser is killed; 0 = off")
+    parser.addoption("--marker-timeout", action="append", default=[], metavar="MARKER=SECONDS",
+                     help="Limit for tests with this marker (repeatable)")
+
+
+def _marker_limits(config) -> dict:
+    limits = {}
+    for value in config.getoption("--marker-timeout"):
+        name, _, seconds = value.partition("=")
+        try:
+            limits[name.strip()] = float(seconds)
+        except ValueError:
+            raise pytest.UsageError(f"--marker-timeout: expected MARKER=SECONDS, got '{value}'")
+    return limits
+
+
+def limit_for(item):
+    """(seconds, source) for `item`; seconds 0 means no limit."""
+    marker = item.get_closest_marker("time_limit")
+    if marker is not None:
+        return float(marker.args[0]), "time_limit marker"
+    names = {m.name for m in item.iter_markers()}
+    matching = [(s, f"--marker-timeout {n}={s:g}")
+                for n, s in _marker_limits(item.config).items() if n in names]
+    if matching:
+        return min(matching)
+    return item.config.getoption("--test-timeout"), "--test-timeout"
+
+
+def pytest_configure(config):
+    _marker_limits(config)
+    _timeouts.clear()
+    config.stash[_WATCHDOG] = HangWatchdog().start()
+
+
+def pytest_unconfigure(config):
+    watchdog = config.stash.get(_WATCHDOG, None)
+    if watchdog is not None:
+        watchdog.stop()
+    _timeouts.clear()
+
+
+def _drivers(item):
+    return [v for v in getattr(item, "funcargs", {}).values() if isinstance(v, WebDriver)]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    seconds, source = limit_for(item)
+    watchdog = item.config.stash.get(_WATCHDOG, None)
+    if seconds and watchdog is not None:
+        # sat počinje sad, ali TestTimeout smije pasti samo unutar CallInfo.from_call (faze ispod)
+        deadline = watchdog.deadline(item.nodeid, seconds, lambda: _drivers(item))
+        item.stash[_DEADLINE] = (deadline, source)
+    yield
+
+
+def _enforced(item):
+    armed = item.stash.get(_DEADLINE, None)
+    if armed is None:
+        yield
+        return
+    watchdog = item.config.stash[_WATCHDOG]
+    watchdog.resume(armed[0])
+    try:
+        yield
+    finally:
+        watchdog.disarm()
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_setup(item):
+    yield from _enforced(item)
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_call(item):
+    yield from _enforced(item)
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield from _enforced(item)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    armed = item.stash.get(_DEADLINE, None)
+    if armed is None or not armed[0].fired or not report.failed or item.stash.get(_REPORTED, False):
+        return
+    deadline, source = armed
+    item.stash[_REPORTED] = True
+    killed = ", ".join(map(str, deadline.killed)) or "none (no local driver process)"
+    report.longrepr = (f"TIMEOUT: exceeded {deadline.seconds:g}s ({source}) during {report.when}\n"
+                       f"killed pids: {killed}\n\n"
+                       f"stack of the test when the limit passed:\n{deadline.stack}\n"
+                       f"{report.longreprtext[-4000:]}")
+    report.user_properties.append(("timeout", {"seconds": deadline.seconds, "source": source,
+                                               "when": report.when}))
+
+
+def pytest_report_teststatus(report, config):
+    if report.failed and any(name == "timeout" for name, _ in report.user_properties):
+        return "failed", "T", "TIMEOUT"
+
+
+def pytest_runtest_logreport(report):
+    for name, value in report.user_properties:
+        if name == "timeout" and report.failed and (report.nodeid, value) not in _timeouts:
+            _timeouts.append((report.nodeid, value))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or not _timeouts:
+        return
+    terminalreporter.section("watchdog timeouts")
+    for nodeid, data in _timeouts:
+        terminalreporter.write_line(f"{nodeid}: killed after {data['seconds']:g}s "
+                                    f"in {data['when']} ({data['source']})")
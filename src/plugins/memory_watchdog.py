@@ -0,0 +1,152 @@
+# src/plugins/memory_watchdog.py
+"""
+Browser reuse with a memory watchdog (src/utils/memory.py).
+
+    pytest --reuse-browser                          # one session per worker and browser
+    pytest --reuse-browser --max-browser-rss-mb 1200 --max-js-heap-mb 300
+    pytest --memory-watchdog                        # only sample (fresh browser per test)
+
+With `--reuse-browser` the `driver` fixture hands out the worker's session instead of starting
+one per test; after every test the session is reset (cookies, storage, about:blank), its
+memory is sampled and, over a threshold (or when the reset fails), it is quit and the next
+test gets a new one. Every sample goes into a per-worker timeline: a summary at the end of
+the run and reports/memory-timeline.json.
+"""
+import json
+import os
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from src.utils.memory import MemoryWatchdog, summarize_timeline
+from src.utils.timeouts import clear_persona
+
+REPORT_PATH = "reports/memory-timeline.json"
+_timelines = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--reuse-browser", action="store_true",
+                     default=os.getenv("REUSE_BROWSER", "").lower() in ("1", "true", "yes"),
+                     help="Reuse one browser session per worker across tests (reset between tests)")
+    parser.addoption("--memory-watchdog", action="store_true",
+                     help="Sample browser memory after every test (implied by --reuse-browser)")
+    parser.addoption("--max-browser-rss-mb", action="store", type=float,
+                     default=float(os.getenv("MAX_BROWSER_RSS_MB", "1500")),
+                     help="Restart a reused session when driver+browser RSS exceeds this "
+                          "(0 = never)")
+    parser.addoption("--max-js-heap-mb", action="store", type=float,
+                     default=float(os.getenv("MAX_JS_HEAP_MB", "512")),
+                     help="Restart a reused session when the page's JS heap exceeds this "
+                          "(0 = never)")
+
+
+def _worker_id(config) -> str:
+    return getattr(config, "workerinput", {}).get("workerid", "main")
+
+
+class BrowserPool:
+    """One reusable session per browser for this worker, recycled by the watchdog."""
+
+    def __init__(self, watchdog: MemoryWatchdog, reuse: bool, keep_open: bool = False):
+        self.watchdog = watchdog
+        self.reuse = reuse
+        self.keep_open = keep_open
+        self.sessions = {}
+
+    def acquire(self, browser: str, factory):
+        if not self.reuse:
+            return factory()
+        if browser not in self.sessions:
+            self.sessions[browser] = factory()
+        return self.sessions[browser]
+
+    def release(self, drv, browser: str, test: str):
+        """After a test: sample memory; reused sessions are reset or, when needed, recycled."""
+        clear_persona(drv)
+        if getattr(drv, "_hung", None):
+            # hang watchdog je ubio proces (src/plugins/hang_watchdog.py)
+            # -> sljedeći test dobija novu sesiju
+            self.sessions.pop(browser, None)
+            try:
+                drv.quit()
+            except Exception:
+                pass
+            return
+        reason = self.watchdog.check(drv, test, browser=browser) if self.watchdog else None
+        if not self.reuse:
+            if not self.keep_open:
+                drv.quit()
+            return
+        if reason is None:
+            reason = self._reset(drv)
+            if reason and self.watchdog:
+                self.watchdog.timeline[-1]["recycled"] = reason
+        if reason:
+            self.sessions.pop(browser, None)
+            drv.quit()
+
+    @staticmethod
+    def _reset(drv):
+        try:
+            drv.delete_all_cookies()
+            if drv.current_url.startswith("http"):
+                drv.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            drv.get("about:blank")
+        except WebDriverException as e:
+            return f"reset failed: {type(e).__name__}"
+        return None
+
+    def close(self):
+        if not self.keep_open:
+            for drv in self.sessions.values():
+                drv.quit()
+        self.sessions.clear()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(pytestconfig):
+    reuse = pytestconfig.getoption("--reuse-browser")
+    watchdog = None
+    if reuse or pytestconfig.getoption("--memory-watchdog"):
+        watchdog = MemoryWatchdog(pytestconfig.getoption("--max-browser-rss-mb") or None,
+                                  pytestconfig.getoption("--max-js-heap-mb") or None)
+    pool = BrowserPool(watchdog, reuse, pytestconfig.getoption("--keep-browser-open"))
+    yield pool
+    pool.close()
+    if watchdog and watchdog.timeline:
+        _timelines[_worker_id(pytestconfig)] = watchdog.timeline
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput") and _timelines:
+        config.workeroutput["memory_timeline"] = _timelines.get(_worker_id(config), [])
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    timeline = getattr(node, "workeroutput", {}).get("memory_timeline")
+    if timeline:
+        _timelines[node.gateway.id] = timeline
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or not _timelines:
+        return
+    os.makedirs(os.path.dirname(REPORT_PATH), exist_ok=True)
+    with open(REPORT_PATH, "w", encoding="utf-8") as f:
+        json.dump(_timelines, f, indent=1)
+
+    def mb(value):
+        return f"{value:>9.0f}" if value is not None else f"{'-':>9}"
+
+    terminalreporter.section("browser memory")
+    terminalreporter.write_line(f"{'worker':<8}{'samples':>8}{'recycles':>9}{'first RSS':>10}"
+                                f"{'last RSS':>9}{'peak RSS':>9}{'peak heap':>10}")
+    for worker in sorted(_timelines):
+        s = summarize_timeline(_timelines[worker])
+        terminalreporter.write_line(f"{worker:<8}{s['samples']:>8}{s['recycles']:>9}"
+                                    f"{mb(s['first_rss_mb']):>10}{mb(s['last_rss_mb'])}"
+                                    f"{mb(s['peak_rss_mb'])}{mb(s['peak_heap_mb']):>10}")
+    terminalreporter.write_line(f"timeline per worker (MB): {REPORT_PATH}")
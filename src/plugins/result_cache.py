@@ -0,0 +1,122 @@
+# src/plugins/result_cache.py
+"""
+Skips tests whose inputs did not change since they last passed (src/utils/result_cache.py).
+
+    pytest --result-cache                      # unchanged passing tests -> "cached-pass"
+    pytest --result-cache --force-full-run     # run everything, refresh the cache
+    pytest --summary-file test_summary.txt     # summary of this run, no second run needed
+
+Only passes are cached: a failing (or erroring) test always runs again and loses its entry.
+With xdist the workers compute the keys and the controller writes the cache at the end.
+"""
+import os
+import time
+
+import pytest
+
+from src.utils.result_cache import CACHE_PATH, ResultCache, cache_key
+
+CACHED_REASON = "cached-pass"
+SUMMARY_OUTCOMES = ("passed", "failed", "error", "skipped", "cached", "xfailed", "xpassed")
+_KEY = "result_cache_key"
+_KEYS = pytest.StashKey()
+_outcomes = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--result-cache", action="store_true",
+                     default=os.getenv("RESULT_CACHE", "").lower() in ("1", "true", "yes"),
+                     help="Skip tests whose inputs are unchanged since their last pass")
+    parser.addoption("--result-cache-path", action="store", default=CACHE_PATH)
+    parser.addoption("--force-full-run", action="store_true",
+                     help="With --result-cache: run every test anyway (the cache is still updated)")
+    parser.addoption("--summary-file", action="store", default=None,
+                     help="Write a short summary of this run (counts + failed tests) to this file")
+
+
+def pytest_configure(config):
+    _outcomes.clear()
+
+
+def _enabled(config) -> bool:
+    return config.getoption("--result-cache")
+
+
+def _item_key(item):
+    config = item.config
+    browser = None
+    if "driver" in item.fixturenames:
+        callspec = getattr(item, "callspec", None)
+        browser = callspec.params.get("browser_name") if callspec else None
+        browser = (browser or config.getoption("--browser")).lower()
+    return cache_key(str(config.rootpath), str(item.path), browser, config.getoption("--base-url"))
+
+
+def pytest_collection_modifyitems(config, items):
+    if not _enabled(config):
+        return
+    cache = ResultCache(config.getoption("--result-cache-path"))
+    force = config.getoption("--force-full-run")
+    skip = pytest.mark.skip(reason=CACHED_REASON)
+    for item in items:
+        key = _item_key(item)
+        item.stash[_KEYS] = key
+        if not force and cache.is_cached_pass(item.nodeid, key):
+            item.add_marker(skip)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    key = item.stash.get(_KEYS, None)
+    if key is not None and call.when == "call":
+        # user_properties putuju s reportom do xdist kontrolera
+        outcome.get_result().user_properties.append((_KEY, key))
+
+
+def _is_cached(report) -> bool:
+    return (report.skipped and isinstance(report.longrepr, tuple)
+            and report.longrepr[2].endswith(CACHED_REASON))
+
+
+def pytest_report_teststatus(report, config):
+    if report.when == "setup" and _is_cached(report):
+        return "cached", "c", "CACHED-PASS"
+
+
+def pytest_runtest_logreport(report):
+    if _is_cached(report):
+        return
+    state = _outcomes.setdefault(report.nodeid, {"failed": False, "key": None})
+    if report.failed:
+        state["failed"] = True
+    elif report.when == "call" and report.passed:
+        state["key"] = dict(report.user_properties).get(_KEY)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput") or not _enabled(config):
+        return
+    cache = ResultCache(config.getoption("--result-cache-path"))
+    for nodeid, state in _outcomes.items():
+        if state["failed"]:
+            cache.failed(nodeid)
+        else:
+            cache.passed(nodeid, state["key"])
+    cache.save()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    path = config.getoption("--summary-file")
+    if hasattr(config, "workerinput") or not path:
+        return
+    stats = terminalreporter.stats
+    counts = {k: len(stats.get(k, [])) for k in SUMMARY_OUTCOMES}
+    failed = [r.nodeid for r in stats.get("failed", []) + stats.get("error", [])]
+    lines = [f"Test run completed on {time.strftime('%a %b %d %H:%M:%S %Z %Y')}",
+             ", ".join(f"{n} {k}" for k, n in counts.items() if n) or "no tests ran"]
+    lines += [f"FAILED {nodeid}" for nodeid in dict.fromkeys(failed)]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
@@ -0,0 +1,49 @@
+# src/plugins/retry_telemetry.py
+"""Collects `src.utils.retry.telemetry` from every worker and reports flaky locators."""
+import json
+import os
+
+import pytest
+
+from src.utils.retry import telemetry
+
+REPORT_PATH = "reports/retry-telemetry.json"
+
+
+def _is_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def pytest_sessionfinish(session):
+    if _is_worker(session.config):
+        session.config.workeroutput["retry_telemetry"] = telemetry.snapshot()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get("retry_telemetry")
+    if data:
+        telemetry.merge(data)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if _is_worker(config):
+        return
+    flaky = telemetry.flaky()
+    if not flaky:
+        return
+
+    os.makedirs(os.path.dirname(REPORT_PATH), exist_ok=True)
+    with open(REPORT_PATH, "w", encoding="utf-8") as f:
+        json.dump(telemetry.snapshot(), f, indent=2)
+
+    terminalreporter.section("retry telemetry")
+    total = sum(r.retry_seconds for _, r in flaky)
+    terminalreporter.write_line(f"{len(flaky)} flaky locator(s), {total:.2f}s spent retrying")
+    for key, rec in flaky[:10]:
+        errors = ", ".join(f"{name}×{n}" for name, n in rec.errors.most_common())
+        terminalreporter.write_line(
+            f"  {key}: {rec.retries} retries / {rec.calls} calls, "
+            f"{rec.failures} failed, {rec.retry_seconds:.2f}s ({errors})"
+        )
+    terminalreporter.write_line(f"full data: {REPORT_PATH}")
@@ -0,0 +1,110 @@
+# src/plugins/sharding.py
+"""
+Run one shard of the suite: `--shard i/N` (src/utils/sharding.py).
+
+    pytest tests/ --shard 1/4       # on machine 1 ... pytest tests/ --shard 4/4 on machine 4
+    python -m tools.merge_shards reports/shards     # one HTML report, JUnit file and timing history
+
+The collected tests are split by the durations in `--shard-durations` (the history the merge
+step writes), the other shards' tests are deselected. Every shard writes
+reports/shards/shard-i-of-N.json (outcome, duration and failure text per test) and, unless
+--junitxml is given, reports/shards/shard-i-of-N.xml.
+"""
+import json
+import os
+import time
+
+import pytest
+
+from src.utils.sharding import DURATIONS_PATH, DurationHistory, parse_shard, partition, shard_name
+
+SHARD_DIR = "reports/shards"
+_results = {}
+_run = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--shard", action="store", default=os.getenv("SHARD") or None, metavar="i/N",
+                     help="Run only shard i of N, split by historical test duration")
+    parser.addoption("--shard-durations", action="store", default=DURATIONS_PATH,
+                     help="Duration history used to balance the shards")
+    parser.addoption("--shard-dir", action="store", default=SHARD_DIR,
+                     help="Where every shard writes its JSON/JUnit results")
+
+
+def _shard(config):
+    value = config.getoption("--shard")
+    if not value:
+        return None
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise pytest.UsageError(f"--shard: {e}")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    shard = _shard(config)
+    if shard and not getattr(config.option, "xmlpath", None):
+        # junitxml plugin čita putanju u svom pytest_configure
+        config.option.xmlpath = os.path.join(config.getoption("--shard-dir"),
+                                             shard_name(*shard) + ".xml")
+    _results.clear()
+    _run.update(start=time.time())
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    shard = _shard(config)
+    if not shard:
+        return
+    index, total = shard
+    nodeids = [item.nodeid for item in items]
+    estimates = DurationHistory(config.getoption("--shard-durations")).estimate(nodeids)
+    keep = set(partition(nodeids, estimates, total)[index - 1])
+    selected = [item for item in items if item.nodeid in keep]
+    deselected = [item for item in items if item.nodeid not in keep]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+def _outcome(report, previous):
+    if report.failed:
+        return "failed" if report.when == "call" else "error"
+    if previous in ("failed", "error"):
+        return previous
+    if hasattr(report, "wasxfail"):
+        return "xpassed" if report.passed else "xfailed"
+    if report.skipped:
+        return "skipped"
+    return previous if report.when == "teardown" and previous else "passed"
+
+
+def pytest_runtest_logreport(report):
+    entry = _results.setdefault(report.nodeid, {"nodeid": report.nodeid, "outcome": None,
+                                                "duration": 0.0, "longrepr": None})
+    entry["duration"] += report.duration
+    entry["outcome"] = _outcome(report, entry["outcome"])
+    if report.failed and entry["longrepr"] is None:
+        entry["longrepr"] = str(report.longrepr)[-8000:]
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    shard = _shard(config)
+    if hasattr(config, "workerinput") or not shard:
+        return
+    index, total = shard
+    folder = config.getoption("--shard-dir")
+    os.makedirs(folder, exist_ok=True)
+    data = {"shard": index, "total": total, "start": _run["start"], "stop": time.time(),
+            "tests": sorted(_results.values(), key=lambda e: e["nodeid"])}
+    with open(os.path.join(folder, shard_name(index, total) + ".json"), "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1)
+
+
+def pytest_report_header(config):
+    shard = _shard(config)
+    if shard:
+        return f"shard: {shard[0]}/{shard[1]} (durations: {config.getoption('--shard-durations')})"
@@ -0,0 +1,154 @@
+# src/plugins/time_budget.py
+"""
+Pre-merge lane that fits a time budget (src/utils/budget.py).
+
+    pytest --time-budget 120s          # or 2m / 1h; env TIME_BUDGET
+    pytest --time-budget 120s -n 4     # budget is wall time: 4 workers get 4 x 120s of tests
+
+Every run records per test its duration, whether it failed and which page transitions it
+walked (`--test-history`, default .qa-cache/test-history.json). With `--time-budget` the
+collected tests are cut down to the set with the most failure-detection and coverage value
+that fits, ordered so the tests most likely to fail run first (gate tests still ahead of their
+dependents, src/plugins/gates.py); the rest are deselected and listed at the end of the run.
+With `--shard` the budget applies to each shard.
+"""
+import os
+
+import pytest
+
+from src.plugins.gates import order_gates
+from src.utils.budget import HISTORY_PATH, TestHistory, parse_budget, select_within
+from src.utils.page_graph import exercised
+
+_state = {"selection": None}
+_runs = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption("--time-budget", action="store", default=os.getenv("TIME_BUDGET") or None,
+                     metavar="SECONDS",
+                     help="Run only the most valuable tests that fit in this much time "
+                          "(120s, 2m, 1h)")
+    parser.addoption("--test-history", action="store", default=HISTORY_PATH,
+                     help="Per-test durations, failure rates and transitions used by --time-budget")
+
+
+def _budget(config):
+    value = config.getoption("--time-budget")
+    if not value:
+        return None
+    try:
+        return parse_budget(value)
+    except ValueError as e:
+        raise pytest.UsageError(f"--time-budget: {e}")
+
+
+def pytest_configure(config):
+    _budget(config)
+    _state["selection"] = None
+    _runs.clear()
+
+
+def pytest_unconfigure(config):
+    _state["selection"] = None
+    _runs.clear()
+
+
+def _capacity(config, budget: float) -> float:
+    """Test-seconds that fit in `budget` of wall time: every xdist worker runs its part."""
+    # --shard je već izbacio testove ostalih shardova -> budžet važi po shardu
+    return budget * getattr(config, "workerinput", {}).get("workercount", 1)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    budget = _budget(config)
+    if budget is None:
+        return
+    history = TestHistory(config.getoption("--test-history"))
+    selection = select_within([item.nodeid for item in items], history, _capacity(config, budget))
+    selection.budget = budget
+    by_id = {item.nodeid: item for item in items}
+    left_out = [by_id[n] for n in selection.left_out]
+    if left_out:
+        config.hook.pytest_deselected(items=left_out)
+    items[:] = [by_id[n] for n in selection.selected]
+    if config.getoption("--no-gates", default=True) is False:
+        order_gates(items)  # gate testovi ostaju ispred svojih `needs` testova
+    _state["selection"] = selection.as_dict()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    exercised.drain()  # prijelazi prije ovog testa nisu njegovi
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.when == "teardown":
+        report.user_properties.append(("transitions", exercised.drain()))
+
+
+def pytest_runtest_logreport(report):
+    run = _runs.setdefault(report.nodeid,
+                           {"duration": 0.0, "failed": False, "skipped": False, "edges": []})
+    run["duration"] += report.duration
+    run["failed"] = run["failed"] or report.failed
+    run["skipped"] = run["skipped"] or (report.skipped and report.when != "teardown")
+    for name, value in report.user_properties:
+        if name == "transitions":
+            run["edges"] = value
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        if _state["selection"]:
+            config.workeroutput["time_budget"] = _state["selection"]
+        return
+    runs = {n: r for n, r in _runs.items() if not r["skipped"] or r["failed"]}
+    if not runs:
+        return
+    history = TestHistory(config.getoption("--test-history"))
+    for nodeid, run in runs.items():
+        history.record(nodeid, run["duration"], run["failed"], run["edges"])
+    history.save()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    selection = getattr(node, "workeroutput", {}).get("time_budget")
+    if selection and _state["selection"] is None:
+        _state["selection"] = selection
+
+
+def pytest_report_header(config):
+    budget = _budget(config)
+    if budget is not None:
+        return f"time budget: {budget:g}s (history: {config.getoption('--test-history')})"
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    selection = _state["selection"]
+    if hasattr(config, "workerinput") or not selection:
+        return
+    seconds, rates = selection["seconds"], selection["failure_rates"]
+    estimate = sum(seconds[n] for n in selection["selected"])
+    left_out = selection["left_out"]
+    terminalreporter.section("time budget")
+    terminalreporter.write_line(
+        f"budget {selection['budget']:g}s: {len(selection['selected'])}/{len(seconds)} "
+        f"tests selected, estimated {estimate:.1f}s of test time; "
+        f"{selection['covered']}/{selection['features']} "
+        f"modules + transitions covered")
+    if not left_out:
+        return
+    shown = left_out if config.getoption("verbose") > 0 else left_out[:10]
+    terminalreporter.write_line(f"left out ({len(left_out)}, most likely to fail first):")
+    for nodeid in shown:
+        terminalreporter.write_line(f"  {nodeid}  ~{seconds[nodeid]:.1f}s  "
+                                    f"p(fail) {rates[nodeid]:.2f}")
+    if len(shown) < len(left_out):
+        terminalreporter.write_line(f"  ... {len(left_out) - len(shown)} more (-v lists all)")
@@ -0,0 +1,63 @@
+# src/plugins/trace_recorder.py
+"""
+With `--trace-buffer N` (env TRACE_BUFFER; off by default) records a trace
+(src/utils/trace.py) for every test that uses a driver and writes it only when the test
+fails: reports/traces/<test>.zip. Passing tests never touch the disk, but every navigation
+and click costs a URL/DOM/console read while recording, so it is opt-in.
+"""
+import os
+import re
+
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from src.utils.trace import TraceRecorder
+
+TRACE_DIR = "reports/traces"
+_RECORDER = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    parser.addoption("--trace-buffer", action="store", type=int,
+                     default=int(os.getenv("TRACE_BUFFER") or 0),
+                     help="Record failure traces, keeping this many events per test "
+                          "(e.g. 200; default 0 = off)")
+    parser.addoption("--trace-dir", action="store", default=TRACE_DIR)
+    parser.addoption("--trace-no-dom", action="store_true",
+                     help="Do not keep DOM snapshots in failure traces")
+
+
+def _drivers(item):
+    return [v for v in getattr(item, "funcargs", {}).values() if isinstance(v, WebDriver)]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    size = item.config.getoption("--trace-buffer")
+    drivers = _drivers(item) if size > 0 else []
+    if drivers:
+        recorder = TraceRecorder(drivers[0], size=size,
+                                 snapshots=not item.config.getoption("--trace-no-dom"))
+        item.stash[_RECORDER] = recorder.attach()
+    yield
+    if drivers:
+        item.stash[_RECORDER].detach()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    recorder = item.stash.get(_RECORDER, None)
+    if recorder is None or report.when != "call" or not report.failed:
+        return
+
+    # browser je još živ (teardown fixture-a tek slijedi) -> finalni snimak + screenshot
+    recorder.capture(screenshot=True)
+    recorder.note("failure", longrepr=str(report.longrepr)[-2000:])
+    folder = item.config.getoption("--trace-dir")
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, re.sub(r"[^\w.-]+", "_", item.nodeid).strip("_") + ".zip")
+    recorder.flush(path, meta={"nodeid": item.nodeid, "duration": report.duration})
+    report.sections.append(("trace",
+                            f"failure trace: {path}  (python -m tools.trace_viewer {path})"))
@@ -0,0 +1,89 @@
+# src/plugins/traffic_replay.py
+"""
+Runs the suite through the record/replay proxy (src/replay/proxy.py).
+
+    pytest --record-traffic traffic/saucedemo.qat          # real --base-url, responses archived
+    pytest --replay-traffic traffic/saucedemo.qat          # offline, served from the archive
+    pytest --replay-traffic traffic/saucedemo.qat --replay-latency recorded
+
+`base_url` then points at the proxy, so every page object goes through it. Each xdist worker
+replays from its own proxy (the archive is memory-mapped, so the pages are shared); recording
+needs a single worker (-n 1 or -p no:xdist). Requests missing from the archive are listed in
+the terminal summary.
+"""
+import os
+
+import pytest
+
+from src.replay.proxy import TrafficProxy, parse_latency
+
+_misses = set()
+
+
+def pytest_addoption(parser):
+    parser.addoption("--record-traffic", action="store", default=None, metavar="ARCHIVE",
+                     help="Proxy --base-url and record every response into ARCHIVE")
+    parser.addoption("--replay-traffic", action="store",
+                     default=os.getenv("REPLAY_TRAFFIC") or None, metavar="ARCHIVE",
+                     help="Serve the target from ARCHIVE instead of the network")
+    parser.addoption("--replay-latency", action="store", type=parse_latency, default="0",
+                     help="Replay delay per response in ms, "
+                          "or 'recorded' for the recorded upstream time")
+
+
+def pytest_configure(config):
+    _misses.clear()
+    if hasattr(config, "workerinput"):
+        return  # kontroler je već provjerio opcije, prije pokretanja workera
+    record, replay = config.getoption("--record-traffic"), config.getoption("--replay-traffic")
+    if record and replay:
+        raise pytest.UsageError("--record-traffic and --replay-traffic cannot be combined")
+    if record and (config.getoption("numprocesses", None) or 0) > 1:
+        raise pytest.UsageError("--record-traffic needs a single worker (-n 1 or -p no:xdist)")
+    if replay and not os.path.exists(replay):
+        raise pytest.UsageError(f"--replay-traffic: {replay} does not exist "
+                                "(record it with --record-traffic)")
+
+
+def pytest_unconfigure(config):
+    _misses.clear()
+
+
+@pytest.fixture(scope="session")
+def traffic_proxy(pytestconfig):
+    """The running record/replay proxy, or None when neither option is given."""
+    record = pytestconfig.getoption("--record-traffic")
+    replay = pytestconfig.getoption("--replay-traffic")
+    if not (record or replay):
+        yield None
+        return
+    if record:
+        proxy = TrafficProxy(record, "record", upstream=pytestconfig.getoption("--base-url"))
+    else:
+        proxy = TrafficProxy(replay, "replay",
+                             latency_ms=pytestconfig.getoption("--replay-latency"))
+    with proxy:
+        yield proxy
+    _misses.update(proxy.misses)
+
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, "workerinput") and _misses:
+        session.config.workeroutput["traffic_misses"] = sorted(_misses)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    _misses.update(getattr(node, "workeroutput", {}).get("traffic_misses", []))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or not _misses:
+        return
+    terminalreporter.section("traffic replay")
+    archive = config.getoption("--replay-traffic")
+    terminalreporter.write_line(f"{len(_misses)} request(s) not in {archive}:")
+    for miss in sorted(_misses)[:10]:
+        terminalreporter.write_line(f"  {miss}")
+    if len(_misses) > 10:
+        terminalreporter.write_line(f"  ... {len(_misses) - 10} more")
@@ -0,0 +1,60 @@
+# src/plugins/transition_coverage.py
+"""
+Page-transition coverage (src/utils/page_graph.py): which `@transition` edges reachable from
+the login page did the run walk?
+
+    pytest --transition-coverage            # report at the end of the run
+    pytest --require-transition-coverage    # ... and fail the run if an edge was never walked
+"""
+import pytest
+
+from src.utils.page_graph import exercised, reachable, transition_graph, unexercised
+
+
+def pytest_addoption(parser):
+    parser.addoption("--transition-coverage", action="store_true",
+                     help="Report page transitions (src/pages) that no test walked")
+    parser.addoption("--require-transition-coverage", action="store_true",
+                     help="Like --transition-coverage, and fail the run if any reachable "
+                          "transition was not walked")
+
+
+def _is_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def _enabled(config) -> bool:
+    return (config.getoption("--transition-coverage")
+            or config.getoption("--require-transition-coverage"))
+
+
+def _missing():
+    return unexercised(reachable(transition_graph()), exercised.snapshot())
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if _is_worker(config):
+        config.workeroutput["page_transitions"] = exercised.snapshot()
+    elif (config.getoption("--require-transition-coverage") and session.exitstatus == 0
+          and _missing()):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    edges = getattr(node, "workeroutput", {}).get("page_transitions")
+    if edges:
+        exercised.merge(edges)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if _is_worker(config) or not _enabled(config):
+        return
+    edges = reachable(transition_graph())
+    missing = unexercised(edges, exercised.snapshot())
+    terminalreporter.section("page transitions")
+    walked = len(edges) - len(missing)
+    terminalreporter.write_line(f"{walked}/{len(edges)} reachable transitions walked")
+    for page, method, target in missing:
+        terminalreporter.write_line(f"  not walked: {page}.{method} -> {target}")
@@ -0,0 +1,59 @@
+# src/plugins/webdriver_transport.py
+"""
+WebDriver transport of the `driver` fixture (src/utils/transport.py).
+
+    pytest --webdriver-transport pooled     # env WEBDRIVER_TRANSPORT; default: stock (selenium)
+
+With `pooled` every command of the fixture's drivers goes through a keep-alive connection
+pool to the local driver, and the run ends with a per-command breakdown: encode, transport,
+driver and decode time (mean ms) plus how many commands opened a new connection. Workers send
+their numbers to the controller.
+"""
+import os
+
+import pytest
+
+from src.utils.driver_factory import TRANSPORTS
+from src.utils.transport import transport_stats
+
+
+def pytest_addoption(parser):
+    parser.addoption("--webdriver-transport", action="store", choices=TRANSPORTS,
+                     default=os.getenv("WEBDRIVER_TRANSPORT", "stock"),
+                     help="stock: selenium's RemoteConnection; "
+                          "pooled: keep-alive pool with per-command timing")
+
+
+def pytest_configure(config):
+    transport_stats.reset()
+
+
+def pytest_unconfigure(config):
+    transport_stats.reset()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    data = getattr(node, "workeroutput", {}).get("transport_stats")
+    if data:
+        transport_stats.merge(data)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if hasattr(config, "workerinput"):
+        config.workeroutput["transport_stats"] = transport_stats.snapshot()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if hasattr(config, "workerinput") or config.getoption("--webdriver-transport") != "pooled":
+        return
+    totals = transport_stats.totals()
+    if not totals:
+        return
+    terminalreporter.section("webdriver transport")
+    terminalreporter.write_line(
+        f"{totals['n']} commands, {totals['new_connections']} new connections; total "
+        + ", ".join(f"{f} {totals[f]:.3f}s" for f in transport_stats.FIELDS))
+    for line in transport_stats.format_table():
+        terminalreporter.write_line("  " + line)
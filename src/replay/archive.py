@@ -0,0 +1,140 @@
+# src/replay/archive.py
+"""
+Compact on-disk archive of recorded HTTP traffic.
+
+Layout of one file:
+
+    b"QATRAFFIC1\\n" | index length (8 bytes, big endian) | index JSON | bodies
+
+The index holds the metadata (upstream, one entry per request: method, path, status, headers,
+recorded time, body offset/length); bodies are stored once per distinct content. `Archive`
+memory-maps the file, so replayed bodies are served straight from the page cache and every
+xdist worker shares the same pages. `to_har` exports an archive as HAR 1.2 for DevTools.
+"""
+import base64
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+MAGIC = b"QATRAFFIC1\n"
+_LENGTH = struct.Struct(">Q")
+
+
+def request_key(method: str, path: str) -> str:
+    return f"{method.upper()} {path}"
+
+
+class ArchiveWriter:
+    """Collects responses in memory (thread safe); `save` writes the archive in one go."""
+
+    def __init__(self, upstream: str):
+        self.upstream = upstream
+        self.entries = {}
+        self._blobs = {}
+        self._lock = threading.Lock()
+
+    def add(self, method: str, path: str, status: int, headers: list, body: bytes, elapsed: float):
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            self._blobs.setdefault(digest, body)
+            # isti zahtjev više puta -> zadnji odgovor
+            self.entries[request_key(method, path)] = {
+                "method": method.upper(), "path": path, "status": status,
+                "headers": [list(h) for h in headers], "elapsed": round(elapsed, 4), "body": digest,
+            }
+
+    def save(self, path: str):
+        with self._lock:
+            offsets, blob, position = {}, [], 0
+            for digest, body in self._blobs.items():
+                offsets[digest] = (position, len(body))
+                blob.append(body)
+                position += len(body)
+            entries = []
+            for entry in self.entries.values():
+                offset, length = offsets[entry["body"]]
+                entries.append({**{k: v for k, v in entry.items() if k != "body"},
+                                "offset": offset, "length": length})
+        index = json.dumps({"upstream": self.upstream, "entries": entries},
+                           separators=(",", ":")).encode()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(_LENGTH.pack(len(index)))
+            f.write(index)
+            for body in blob:
+                f.write(body)
+        os.replace(tmp, path)
+        return path
+
+
+class Archive:
+    """Read-only, memory-mapped view of a saved archive."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a traffic archive")
+        start = len(MAGIC) + _LENGTH.size
+        (size,) = _LENGTH.unpack(self._map[len(MAGIC):start])
+        index = json.loads(self._map[start:start + size])
+        self._bodies = start + size
+        self._view = memoryview(self._map)
+        self.upstream = index["upstream"]
+        self.entries = {request_key(e["method"], e["path"]): e for e in index["entries"]}
+
+    def lookup(self, method: str, path: str):
+        return self.entries.get(request_key(method, path))
+
+    def body(self, entry) -> memoryview:
+        offset = self._bodies + entry["offset"]
+        return self._view[offset:offset + entry["length"]]
+
+    def close(self):
+        try:
+            if getattr(self, "_view", None) is not None:
+                self._view.release()
+                self._view = None
+            self._map.close()
+        except BufferError:
+            # neki odgovor se još šalje; mapa se zatvori kad ga GC pokupi
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def to_har(archive: Archive) -> dict:
+    """HAR 1.2 of everything in the archive (bodies base64 encoded)."""
+    entries = []
+    for e in archive.entries.values():
+        headers = [{"name": k, "value": v} for k, v in e["headers"]]
+        content_type = next((v for k, v in e["headers"] if k.lower() == "content-type"), "")
+        entries.append({
+            "startedDateTime": "1970-01-01T00:00:00.000Z",
+            "time": e["elapsed"] * 1000,
+            "request": {"method": e["method"], "url": archive.upstream + e["path"],
+                        "httpVersion": "HTTP/1.1", "headers": [], "queryString": [],
+                        "cookies": [], "headersSize": -1, "bodySize": 0},
+            "response": {"status": e["status"], "statusText": "", "httpVersion": "HTTP/1.1",
+                         "headers": headers, "cookies": [], "redirectURL": "",
+                         "headersSize": -1, "bodySize": e["length"],
+                         "content": {"size": e["length"], "mimeType": content_type,
+                                     "encoding": "base64",
+                                     "text": base64.b64encode(archive.body(e)).decode()}},
+            "cache": {},
+            "timings": {"send": 0, "wait": e["elapsed"] * 1000, "receive": 0},
+        })
+    return {"log": {"version": "1.2", "creator": {"name": "qa-traffic-archive", "version": "1"},
+                    "entries": entries}}
@@ -0,0 +1,220 @@
+# src/replay/proxy.py
+"""
+Record/replay proxy for running the suite against captured saucedemo.com traffic.
+
+    python -m src.replay.proxy record --upstream https://www.saucedemo.com \
+        --archive traffic/saucedemo.qat
+    python -m src.replay.proxy replay --archive traffic/saucedemo.qat --latency 20
+    python -m src.replay.proxy export --archive traffic/saucedemo.qat --har reports/saucedemo.har
+
+The proxy serves the target's origin on loopback (the browser opens `proxy.url` instead of the
+real site), so same-origin pages, bundles, images and API calls all pass through it:
+
+- record: every request is forwarded upstream and the response (status, headers, raw possibly
+  compressed bytes) is kept; the archive (src/replay/archive.py) is written on `stop()`
+- replay: responses come from the memory-mapped archive, byte for byte, no network;
+  `latency_ms` adds a fixed delay per response, `latency_ms="recorded"` replays the recorded
+  upstream time. Requests that were never recorded get 404 and are listed in `misses`.
+
+Third-party HTTPS hosts (analytics, fonts) are not routed through the proxy.
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from src.replay.archive import Archive, ArchiveWriter, to_har
+
+MODES = ("record", "replay")
+# hop-by-hop i zaglavlja koja proxy sam postavlja
+_SKIP_HEADERS = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "te",
+                 "trailer", "upgrade", "content-length", "strict-transport-security", "alt-svc"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "QATrafficProxy/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _path(self) -> str:
+        # i apsolutni URI (kad je proxy postavljen kao HTTP proxy) i obična putanja
+        parts = urlsplit(self.path)
+        return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    def _respond(self, status: int, headers, body):
+        self.send_response(status)
+        for name, value in headers:
+            if name.lower() not in _SKIP_HEADERS:
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _handle(self):
+        proxy = self.server.proxy
+        length = int(self.headers.get("Content-Length") or 0)
+        request_body = self.rfile.read(length) if length else None
+        path = self._path()
+        if proxy.mode == "record":
+            status, headers, body = proxy.forward(self.command, path, self.headers, request_body)
+        else:
+            entry = proxy.archive.lookup(self.command, path)
+            if entry is None:
+                proxy.misses.append(f"{self.command} {path}")
+                self._respond(404, [("X-Replay-Miss", "1"), ("Content-Type", "text/plain")],
+                              b"not recorded")
+                return
+            delay = entry["elapsed"] if proxy.latency_ms == "recorded" else proxy.latency_ms / 1000
+            if delay:
+                time.sleep(delay)
+            status, headers, body = entry["status"], entry["headers"], proxy.archive.body(entry)
+        self._respond(status, headers, body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = do_OPTIONS = do_HEAD = _handle
+
+
+class TrafficProxy:
+    """Loopback record/replay proxy on a background thread; `url` replaces the target's base URL."""
+
+    def __init__(self, archive_path: str, mode: str = "replay", upstream: str = None,
+                 host: str = "127.0.0.1", port: int = 0, latency_ms=0):
+        if mode not in MODES:
+            raise ValueError(f"unknown proxy mode '{mode}' (expected record or replay)")
+        if mode == "record" and not upstream:
+            raise ValueError("record mode needs the upstream URL")
+        self.archive_path = archive_path
+        self.mode = mode
+        self.upstream = upstream.rstrip("/") if upstream else None
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.archive = None
+        self.writer = None
+        self.misses = []
+        self._local = threading.local()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            parts = urlsplit(self.upstream)
+            cls = (http.client.HTTPSConnection if parts.scheme == "https"
+                   else http.client.HTTPConnection)
+            conn = self._local.conn = cls(parts.netloc, timeout=30)
+        return conn
+
+    def forward(self, method: str, path: str, request_headers, body):
+        """
+        Send a request upstream (keep-alive per thread), record it and return
+        (status, headers, body).
+        """
+        headers = {k: v for k, v in request_headers.items()
+                   if k.lower() not in _SKIP_HEADERS | {"host"}}
+        headers["Host"] = urlsplit(self.upstream).netloc
+        start = time.perf_counter()
+        for attempt in (1, 2):
+            conn = self._connection()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                # upstream zatvorio keep-alive konekciju -> jednom ponovo
+                conn.close()
+                self._local.conn = None
+                if attempt == 2:
+                    raise
+        elapsed = time.perf_counter() - start
+        response_headers = [(k, self._rewrite(k, v)) for k, v in response.getheaders()]
+        self.writer.add(method, path, response.status, response_headers, data, elapsed)
+        return response.status, response_headers, data
+
+    def _rewrite(self, name: str, value: str) -> str:
+        # redirect na upstream mora ostati na proxyju
+        if name.lower() == "location" and value.startswith(self.upstream):
+            return self.url + value[len(self.upstream):]
+        return value
+
+    def start(self):
+        if self.mode == "record":
+            self.writer = ArchiveWriter(self.upstream)
+        else:
+            self.archive = Archive(self.archive_path)
+            self.upstream = self.archive.upstream
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.proxy = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="traffic-proxy",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self.writer is not None:
+            self.writer.save(self.archive_path)
+        if self.archive is not None:
+            self.archive.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def parse_latency(value: str):
+    return "recorded" if value == "recorded" else float(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record or replay target traffic on loopback")
+    parser.add_argument("mode", choices=MODES + ("export",))
+    parser.add_argument("--archive", required=True)
+    parser.add_argument("--upstream", default="https://www.saucedemo.com",
+                        help="record mode: the real target")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=parse_latency, default=0,
+                        help="replay: ms per response or 'recorded'")
+    parser.add_argument("--har", default=None, help="export: write the archive as HAR 1.2 here")
+    args = parser.parse_args(argv)
+
+    if args.mode == "export":
+        if not args.har:
+            parser.error("export needs --har")
+        with Archive(args.archive) as archive, open(args.har, "w", encoding="utf-8") as f:
+            json.dump(to_har(archive), f)
+        return
+
+    proxy = TrafficProxy(args.archive, args.mode, args.upstream, args.host, args.port,
+                         args.latency).start()
+    print(f"{args.mode} proxy for {proxy.upstream} on {proxy.url} (Ctrl+C to stop)")
+    try:
+        proxy._thread.join()
+    except KeyboardInterrupt:
+        proxy.stop()
+        if args.mode == "record":
+            print(f"{len(proxy.writer.entries)} responses written to {args.archive}")
+        elif proxy.misses:
+            print(f"{len(proxy.misses)} requests were not in the archive")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# src/standin/server.py
+"""
+Loopback stand-in of saucedemo.com for benchmarks and load runs.
+
+    with StandinServer() as shop:
+        LoginPage(driver, shop.url).open_login()...
+
+or from the shell:  python -m src.standin.server --port 8000
+"""
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from src.standin import site
+from src.utils.catalog import load_catalog
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "StandinShop/1.0"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, body: bytes, content_type: str, cache: bool = False):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "max-age=3600" if cache else "no-store")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        assets = self.server.assets
+        if path in site.ROUTES:
+            self._send(assets["pages"][site.ROUTES[path]], "text/html; charset=utf-8")
+        elif path == "/catalog.js":
+            self._send(assets["catalog_js"], "application/javascript; charset=utf-8", cache=True)
+        elif path == "/catalog.json":
+            self._send(assets["catalog_json"], "application/json", cache=True)
+        elif path == "/static/shop.js":
+            self._send(assets["script"], "application/javascript; charset=utf-8", cache=True)
+        elif path == "/static/shop.css":
+            self._send(assets["css"], "text/css; charset=utf-8", cache=True)
+        elif path.startswith("/static/img/"):
+            label = path.rsplit("/", 1)[-1].split(".")[0][:18]
+            self._send(site.IMAGE.format(label=label).encode(), "image/svg+xml", cache=True)
+        else:
+            self.send_error(404)
+
+    do_HEAD = do_GET
+
+
+class StandinServer:
+    """Serves the stand-in shop on a background thread; `url` is its base URL."""
+
+    def __init__(self, catalog=None, host: str = "127.0.0.1", port: int = 0, glitch_ms: int = 1500):
+        self.catalog = catalog if catalog is not None else load_catalog()
+        self.host = host
+        self.port = port
+        self.glitch_ms = glitch_ms
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def _assets(self) -> dict:
+        catalog_json = json.dumps(self.catalog, ensure_ascii=False)
+        config = json.dumps({"glitchMs": self.glitch_ms})
+        return {
+            "pages": {
+                page: site.SHELL.format(page=page, config=config).encode()
+                for page in set(site.ROUTES.values())
+            },
+            "catalog_json": catalog_json.encode(),
+            "catalog_js": f"window.CATALOG = {catalog_json};".encode(),
+            "script": site.SCRIPT.encode(),
+            "css": site.CSS.encode(),
+        }
+
+    def start(self):
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.assets = self._assets()
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="standin-shop", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the stand-in shop")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--catalog", default=None, help="catalog JSON (default: src/data/catalog.json)"
+    )
+    parser.add_argument(
+        "--glitch-ms", type=int, default=1500, help="login delay for performance_glitch_user"
+    )
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog(args.catalog) if args.catalog else None
+    server = StandinServer(catalog, args.host, args.port, args.glitch_ms).start()
+    print(f"stand-in shop on {server.url} (Ctrl+C to stop)")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
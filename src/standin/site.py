@@ -0,0 +1,342 @@
+# src/standin/site.py
+"""Static assets of the stand-in shop: one HTML shell, one script and one stylesheet."""
+
+ROUTES = {
+    "/": "login",
+    "/index.html": "login",
+    "/inventory.html": "inventory",
+    "/inventory-item.html": "item",
+    "/cart.html": "cart",
+    "/checkout-step-one.html": "step-one",
+    "/checkout-step-two.html": "step-two",
+    "/checkout-complete.html": "complete",
+}
+
+SHELL = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Swag Labs</title>
+<link rel="stylesheet" href="/static/shop.css">
+</head>
+<body data-page="{page}">
+<div id="root"></div>
+<script>window.STANDIN = {config};</script>
+<script src="/catalog.js"></script>
+<script src="/static/shop.js"></script>
+</body>
+</html>
+"""
+
+IMAGE = """<svg xmlns="http://www.w3.org/2000/svg" width="240" height="240"
+viewBox="0 0 240 240">
+<rect width="240" height="240" fill="#e2231a"/>
+<text x="120" y="128" font-size="20" text-anchor="middle" fill="#fff">{label}</text></svg>
+"""
+
+CSS = """
+body { font-family: sans-serif; margin: 0; }
+.primary_header {
+  display: flex; justify-content: space-between; align-items: center; padding: 12px;
+}
+.header_secondary_container { display: flex; justify-content: space-between; padding: 0 12px; }
+.shopping_cart_link { display: inline-block; min-width: 40px; min-height: 24px; }
+.shopping_cart_badge { background: #e2231a; color: #fff; border-radius: 50%; padding: 2px 7px; }
+.inventory_list { display: flex; flex-wrap: wrap; }
+.inventory_item { width: 280px; margin: 8px; border: 1px solid #ddd; padding: 8px; }
+.inventory_item img { width: 120px; height: 120px; }
+.error-message-container h3 { background: #e2231a; color: #fff; padding: 8px; }
+.cart_item { border-bottom: 1px solid #ddd; padding: 8px; }
+"""
+
+SCRIPT = r"""
+(function () {
+  "use strict";
+  var cfg = window.STANDIN || {};
+  var catalog = window.CATALOG || [];
+  var page = document.body.getAttribute("data-page");
+  var root = document.getElementById("root");
+  var USERS = ["standard_user", "locked_out_user", "problem_user",
+               "performance_glitch_user", "error_user", "visual_user"];
+  var PASSWORD = "secret_sauce";
+
+  function esc(s) {
+    return String(s).replace(/[&<>"']/g, function (c) {
+      return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+    });
+  }
+  function slug(name) { return name.toLowerCase().replace(/ /g, "-"); }
+  function money(v) { return "$" + v.toFixed(2); }
+  function byId(id) {
+    for (var i = 0; i < catalog.length; i++) { if (catalog[i].id === id) { return catalog[i]; } }
+    return null;
+  }
+  function user() {
+    var m = document.cookie.match(/(?:^|; )session-username=([^;]*)/);
+    return m ? decodeURIComponent(m[1]) : "";
+  }
+  function cart() { return JSON.parse(localStorage.getItem("cart-contents") || "[]"); }
+  function saveCart(ids) { localStorage.setItem("cart-contents", JSON.stringify(ids)); }
+  function inCart(id) { return cart().indexOf(id) !== -1; }
+  function toggle(id) {
+    var ids = cart(), i = ids.indexOf(id);
+    if (i === -1) { ids.push(id); } else { ids.splice(i, 1); }
+    saveCart(ids);
+  }
+  function go(path) { window.location.href = path; }
+  function onClick(id, path) {
+    document.getElementById(id).addEventListener("click", function () { go(path); });
+  }
+
+  function badge(n) {
+    return '<span class="shopping_cart_badge" data-test="shopping-cart-badge">' + n + '</span>';
+  }
+  function header(title) {
+    var n = cart().length;
+    return '<div class="primary_header" data-test="primary-header">' +
+      '<div id="menu_button_container">' +
+      '<button id="react-burger-menu-btn">Open Menu</button></div>' +
+      '<div class="app_logo">Swag Labs</div>' +
+      '<div id="shopping_cart_container" class="shopping_cart_container">' +
+      '<a class="shopping_cart_link" data-test="shopping-cart-link" href="/cart.html">' +
+      (n ? badge(n) : '') +
+      '</a></div></div>' +
+      '<div class="header_secondary_container">' +
+      '<span class="title" data-test="title">' + title + '</span>' +
+      (page === "inventory" ?
+        '<span class="select_container">' +
+        '<select class="product_sort_container" data-test="product-sort-container">' +
+        '<option value="az">Name (A to Z)</option><option value="za">Name (Z to A)</option>' +
+        '<option value="lohi">Price (low to high)</option>' +
+        '<option value="hilo">Price (high to low)</option>' +
+        '</select></span>' : '') +
+      '</div>';
+  }
+  function refreshBadge() {
+    var link = document.querySelector(".shopping_cart_link"), n = cart().length;
+    link.innerHTML = n ? badge(n) : '';
+  }
+  function cartButton(p, detail) {
+    var added = inCart(p.id), action = added ? "remove" : "add-to-cart";
+    var dt = detail ? action : action + "-" + slug(p.name);
+    return '<button class="btn btn_small btn_inventory ' +
+      (added ? 'btn_secondary' : 'btn_primary') +
+      '" data-test="' + esc(dt) + '" id="' + esc(dt) + '" name="' + esc(dt) +
+      '" data-id="' + p.id + '">' +
+      (added ? 'Remove' : 'Add to cart') + '</button>';
+  }
+  function bindCartButtons(scope, detail) {
+    scope.addEventListener("click", function (ev) {
+      var btn = ev.target.closest("button[data-id]");
+      if (!btn) { return; }
+      var id = Number(btn.getAttribute("data-id"));
+      toggle(id);
+      btn.outerHTML = cartButton(byId(id), detail);
+      refreshBadge();
+    });
+  }
+  function card(p) {
+    var href = '/inventory-item.html?id=' + p.id;
+    return '<div class="inventory_item" data-test="inventory-item">' +
+      '<div class="inventory_item_img"><a href="' + href + '" id="item_' + p.id + '_img_link">' +
+      '<img alt="' + esc(p.name) + '" class="inventory_item_img" ' +
+      'src="/static/img/' + esc(p.img) + '"></a></div>' +
+      '<div class="inventory_item_description" data-test="inventory-item-description">' +
+      '<div class="inventory_item_label">' +
+      '<a href="' + href + '" id="item_' + p.id + '_title_link">' +
+      '<div class="inventory_item_name" data-test="inventory-item-name">' +
+      esc(p.name) + '</div></a>' +
+      '<div class="inventory_item_desc" data-test="inventory-item-desc">' +
+      esc(p.desc) + '</div></div>' +
+      '<div class="pricebar"><div class="inventory_item_price" data-test="inventory-item-price">' +
+      money(p.price) + '</div>' + cartButton(p, false) + '</div></div></div>';
+  }
+  function sorted(mode) {
+    // stabilan sort iz id redoslijeda: jednaki ključevi ostaju po id-u (kao saucedemo)
+    var items = catalog.slice().sort(function (a, b) { return a.id - b.id; });
+    var cmp = {
+      az: function (a, b) { return a.name < b.name ? -1 : a.name > b.name ? 1 : 0; },
+      za: function (a, b) { return a.name < b.name ? 1 : a.name > b.name ? -1 : 0; },
+      lohi: function (a, b) { return a.price - b.price; },
+      hilo: function (a, b) { return b.price - a.price; }
+    }[mode];
+    items.sort(cmp);
+    return items;
+  }
+  function cartRows() {
+    return cart().map(byId).filter(Boolean).map(function (p) {
+      return '<div class="cart_item" data-test="inventory-item">' +
+        '<div class="cart_quantity">1</div>' +
+        '<div class="cart_item_label"><a href="/inventory-item.html?id=' + p.id + '">' +
+        '<div class="inventory_item_name" data-test="inventory-item-name">' +
+        esc(p.name) + '</div></a>' +
+        '<div class="inventory_item_desc">' + esc(p.desc) + '</div>' +
+        '<div class="item_pricebar"><div class="inventory_item_price">' +
+        money(p.price) + '</div>' +
+        (page === "cart" ? cartButton(p, false) : '') + '</div></div></div>';
+    }).join("");
+  }
+  function showError(container, message) {
+    container.innerHTML = '<h3 data-test="error">' + esc(message) +
+      '<button class="error-button" data-test="error-button">x</button></h3>';
+  }
+
+  var render = {
+    login: function () {
+      root.innerHTML = '<div class="login_wrapper"><div class="login_logo">Swag Labs</div>' +
+        '<form id="login-form">' +
+        '<input class="form_input" placeholder="Username" type="text" data-test="username" ' +
+        'id="user-name" name="user-name">' +
+        '<input class="form_input" placeholder="Password" type="password" data-test="password" ' +
+        'id="password" name="password">' +
+        '<div class="error-message-container"></div>' +
+        '<input type="submit" class="submit-button btn_action" data-test="login-button" ' +
+        'id="login-button" value="Login">' +
+        '</form></div>';
+      document.getElementById("login-form").addEventListener("submit", function (ev) {
+        ev.preventDefault();
+        var u = document.getElementById("user-name").value;
+        var p = document.getElementById("password").value;
+        var box = document.querySelector(".error-message-container");
+        if (!u) { return showError(box, "Epic sadface: Username is required"); }
+        if (!p) { return showError(box, "Epic sadface: Password is required"); }
+        if (USERS.indexOf(u) === -1 || p !== PASSWORD) {
+          return showError(box, "Epic sadface: Username and password do not match " +
+                                "any user in this service");
+        }
+        if (u === "locked_out_user") {
+          return showError(box, "Epic sadface: Sorry, this user has been locked out.");
+        }
+        document.cookie = "session-username=" + encodeURIComponent(u) + "; path=/";
+        setTimeout(function () { go("/inventory.html"); },
+                   u === "performance_glitch_user" ? (cfg.glitchMs || 0) : 0);
+      });
+    },
+    inventory: function () {
+      root.innerHTML = header("Products") +
+        '<div id="inventory_container">' +
+        '<div class="inventory_list" data-test="inventory-list"></div></div>';
+      var list = root.querySelector(".inventory_list");
+      function fill(mode) { list.innerHTML = sorted(mode).map(card).join(""); }
+      fill("az");
+      bindCartButtons(list, false);
+      root.querySelector(".product_sort_container").addEventListener("change", function (ev) {
+        fill(ev.target.value);
+      });
+    },
+    item: function () {
+      var id = Number(new URLSearchParams(location.search).get("id"));
+      var p = byId(id);
+      root.innerHTML = header("") +
+        '<div id="inventory_item_container" class="inventory_item_container">' +
+        '<button id="back-to-products" data-test="back-to-products">Back to products</button>' +
+        (p ? '<div class="inventory_details">' +
+          '<img class="inventory_details_img" alt="' + esc(p.name) +
+          '" src="/static/img/' + esc(p.img) + '">' +
+          '<div class="inventory_details_name large_size" data-test="inventory-item-name">' +
+          esc(p.name) + '</div>' +
+          '<div class="inventory_details_desc large_size" data-test="inventory-item-desc">' +
+          esc(p.desc) + '</div>' +
+          '<div class="inventory_details_price" data-test="inventory-item-price">' +
+          money(p.price) + '</div>' +
+          cartButton(p, true) + '</div>'
+          : '<div class="inventory_details_name large_size">ITEM NOT FOUND</div>') + '</div>';
+      bindCartButtons(root.querySelector("#inventory_item_container"), true);
+      onClick("back-to-products", "/inventory.html");
+    },
+    cart: function () {
+      root.innerHTML = header("Your Cart") +
+        '<div id="cart_contents_container" class="cart_contents_container">' +
+        '<div class="cart_list" data-test="cart-list"><div class="cart_quantity_label">QTY</div>' +
+        '<div class="cart_desc_label">Description</div>' + cartRows() + '</div>' +
+        '<div class="cart_footer">' +
+        '<button id="continue-shopping" data-test="continue-shopping">Continue Shopping</button>' +
+        '<button class="btn btn_action btn_medium checkout_button" data-test="checkout" ' +
+        'id="checkout">Checkout</button>' +
+        '</div></div>';
+      root.querySelector(".cart_list").addEventListener("click", function (ev) {
+        var btn = ev.target.closest("button[data-id]");
+        if (btn) {
+          toggle(Number(btn.getAttribute("data-id")));
+          btn.closest(".cart_item").remove();
+          refreshBadge();
+        }
+      });
+      onClick("continue-shopping", "/inventory.html");
+      onClick("checkout", "/checkout-step-one.html");
+    },
+    "step-one": function () {
+      root.innerHTML = header("Checkout: Your Information") +
+        '<div class="checkout_info_container"><form id="checkout-form">' +
+        '<div class="checkout_info">' +
+        '<input class="form_input" placeholder="First Name" type="text" data-test="firstName" ' +
+        'id="first-name" name="firstName">' +
+        '<input class="form_input" placeholder="Last Name" type="text" data-test="lastName" ' +
+        'id="last-name" name="lastName">' +
+        '<input class="form_input" placeholder="Zip/Postal Code" type="text" ' +
+        'data-test="postalCode" id="postal-code" name="postalCode">' +
+        '<div class="error-message-container"></div></div>' +
+        '<div class="checkout_buttons">' +
+        '<button type="button" id="cancel" data-test="cancel">Cancel</button>' +
+        '<input type="submit" class="submit-button btn btn_primary cart_button btn_action" ' +
+        'data-test="continue" id="continue" value="Continue">' +
+        '</div></form></div>';
+      onClick("cancel", "/cart.html");
+      document.getElementById("checkout-form").addEventListener("submit", function (ev) {
+        ev.preventDefault();
+        var box = document.querySelector(".error-message-container");
+        var required = [["first-name", "First Name"], ["last-name", "Last Name"],
+                        ["postal-code", "Postal Code"]];
+        for (var i = 0; i < required.length; i++) {
+          if (!document.getElementById(required[i][0]).value) {
+            return showError(box, "Error: " + required[i][1] + " is required");
+          }
+        }
+        go("/checkout-step-two.html");
+      });
+    },
+    "step-two": function () {
+      var total = cart().map(byId).filter(Boolean)
+        .reduce(function (s, p) { return s + p.price; }, 0);
+      var tax = Math.round(total * 8) / 100;
+      root.innerHTML = header("Checkout: Overview") +
+        '<div id="checkout_summary_container" class="checkout_summary_container">' +
+        '<div class="cart_list">' + cartRows() + '</div><div class="summary_info">' +
+        '<div class="summary_subtotal_label" data-test="subtotal-label">Item total: ' +
+        money(total) + '</div>' +
+        '<div class="summary_tax_label" data-test="tax-label">Tax: ' + money(tax) + '</div>' +
+        '<div class="summary_total_label" data-test="total-label">Total: ' +
+        money(total + tax) + '</div>' +
+        '<div class="cart_footer"><button id="cancel" data-test="cancel">Cancel</button>' +
+        '<button class="btn btn_action btn_medium cart_button" data-test="finish" ' +
+        'id="finish">Finish</button>' +
+        '</div></div></div>';
+      onClick("cancel", "/inventory.html");
+      document.getElementById("finish").addEventListener("click", function () {
+        saveCart([]);
+        go("/checkout-complete.html");
+      });
+    },
+    complete: function () {
+      root.innerHTML = header("Checkout: Complete!") +
+        '<div id="checkout_complete_container" class="checkout_complete_container">' +
+        '<h2 class="complete-header" data-test="complete-header">Thank you for your order!</h2>' +
+        '<div class="complete-text" data-test="complete-text">' +
+        'Your order has been dispatched, and will arrive ' +
+        'just as fast as the pony can get there!</div>' +
+        '<button id="back-to-products" data-test="back-to-products">Back Home</button></div>';
+      onClick("back-to-products", "/inventory.html");
+    }
+  };
+
+  if (page !== "login" && !user()) {
+    render.login();
+    showError(document.querySelector(".error-message-container"),
+              "Epic sadface: You can only access '" + location.pathname +
+              "' when you are logged in.");
+    return;
+  }
+  render[page]();
+})();
+"""
@@ -0,0 +1,139 @@
+# src/utils/budget.py
+"""
+Time-budgeted test selection: the subset of tests worth the most that fits in N seconds.
+
+- `TestHistory` keeps per test its last duration, decayed run/failure counts (recent runs
+  weigh more) and the page transitions it walked (JSON file, updated after every run)
+- a test's value is its failure probability plus `COVERAGE_WEIGHT` for every feature (its
+  module, each transition it walks) that no test selected before it covers
+- `select_within` picks greedily by value per second (lazy greedy: values only shrink as
+  coverage grows) and orders the pick most-likely-to-fail first
+- tests without history count as likely failures, so new tests get picked early
+"""
+import heapq
+import json
+import os
+import re
+from dataclasses import dataclass
+
+from src.utils.sharding import DURATIONS_PATH, DurationHistory
+
+HISTORY_PATH = ".qa-cache/test-history.json"
+DECAY = 0.9
+COVERAGE_WEIGHT = 0.5
+# Beta prior: test bez historije ima vjerovatnoću pada 0.5, svaki prolaz je smanjuje
+PRIOR_FAILURES = 0.5
+PRIOR_RUNS = 1.0
+MIN_SECONDS = 0.05
+
+_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_budget(value: str) -> float:
+    """'120s', '2m', '1.5h' or '90' -> seconds."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*", str(value).lower())
+    if not match or float(match.group(1)) <= 0:
+        raise ValueError(f"time budget must look like 120s, 2m or 1h, got '{value}'")
+    return float(match.group(1)) * _UNITS[match.group(2)]
+
+
+class TestHistory:
+    """nodeid -> {"duration", "runs", "failures", "edges"} of past runs."""
+
+    __test__ = False  # nije test klasa za pytest
+
+    def __init__(self, path: str = HISTORY_PATH):
+        self.path = path
+        self.tests = {}
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.tests = json.load(f)
+
+    def record(self, nodeid: str, duration: float, failed: bool, edges=()):
+        entry = self.tests.setdefault(nodeid, {"duration": 0.0, "runs": 0.0, "failures": 0.0,
+                                               "edges": []})
+        entry["duration"] = round(duration, 3)
+        entry["runs"] = round(entry["runs"] * DECAY + 1, 4)
+        entry["failures"] = round(entry["failures"] * DECAY + (1 if failed else 0), 4)
+        entry["edges"] = sorted({tuple(e) for e in entry["edges"]} | {tuple(e) for e in edges})
+
+    def failure_rate(self, nodeid: str) -> float:
+        entry = self.tests.get(nodeid, {})
+        return (entry.get("failures", 0.0) + PRIOR_FAILURES) / (entry.get("runs", 0.0) + PRIOR_RUNS)
+
+    def durations(self, nodeids, fallback_path: str = DURATIONS_PATH) -> dict:
+        """Recorded durations; the rest estimated like the sharding does (module mean, median)."""
+        known = DurationHistory(fallback_path)
+        known.update({n: e["duration"] for n, e in self.tests.items() if e.get("runs")})
+        return known.estimate(nodeids)
+
+    def features(self, nodeid: str) -> set:
+        """What running this test covers: its module and every transition it walked."""
+        found = {("module", nodeid.split("::")[0])}
+        edges = self.tests.get(nodeid, {}).get("edges", [])
+        found.update(("transition",) + tuple(e) for e in edges)
+        return found
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.tests, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+@dataclass
+class Selection:
+    budget: float
+    selected: list
+    left_out: list
+    seconds: dict
+    failure_rates: dict
+    features: int = 0
+    covered: int = 0
+
+    @property
+    def selected_seconds(self) -> float:
+        return sum(self.seconds[n] for n in self.selected)
+
+    def as_dict(self) -> dict:
+        return {"budget": self.budget, "selected": self.selected, "left_out": self.left_out,
+                "seconds": self.seconds, "failure_rates": self.failure_rates,
+                "features": self.features, "covered": self.covered}
+
+
+def select_within(nodeids, history: TestHistory, budget: float,
+                  durations: dict = None) -> Selection:
+    """Tests with the most failure-detection and coverage value whose time fits `budget`."""
+    nodeids = list(nodeids)
+    seconds = durations if durations is not None else history.durations(nodeids)
+    rates = {n: history.failure_rate(n) for n in nodeids}
+    features = {n: history.features(n) for n in nodeids}
+    order = {n: i for i, n in enumerate(nodeids)}
+    covered, chosen = set(), []
+    remaining = budget
+
+    def score(nodeid):
+        gain = rates[nodeid] + COVERAGE_WEIGHT * len(features[nodeid] - covered)
+        return gain / max(seconds[nodeid], MIN_SECONDS)
+
+    heap = [(-score(n), order[n], n) for n in nodeids]
+    heapq.heapify(heap)
+    while heap:
+        _, i, nodeid = heapq.heappop(heap)
+        if seconds[nodeid] > remaining:
+            continue  # preostalo vrijeme samo opada -> neće stati ni kasnije
+        current = -score(nodeid)
+        if heap and current > heap[0][0] + 1e-12:
+            heapq.heappush(heap, (current, i, nodeid))  # vrijednost pala, nije više prvi
+            continue
+        chosen.append(nodeid)
+        covered |= features[nodeid]
+        remaining -= seconds[nodeid]
+
+    chosen.sort(key=lambda n: (-rates[n], seconds[n], order[n]))
+    picked = set(chosen)
+    left_out = sorted((n for n in nodeids if n not in picked), key=lambda n: (-rates[n], order[n]))
+    all_features = set().union(*features.values()) if features else set()
+    return Selection(budget, chosen, left_out, {n: round(seconds[n], 3) for n in nodeids}, rates,
+                     len(all_features), len(covered))
@@ -0,0 +1,147 @@
+# src/utils/catalog.py
+import json
+import os
+import random
+
+CATALOG_PATH = "src/data/catalog.json"
+
+
+def data_test_id(name: str, action: str = "add-to-cart") -> str:
+    """SauceDemo-style data-test id: 'Sauce Labs Onesie' -> 'add-to-cart-sauce-labs-onesie'."""
+    return f"{action}-{name.lower().replace(' ', '-')}"
+
+
+def load_catalog(path: str = CATALOG_PATH) -> list:
+    """Products as dicts with id, name, price, desc and img."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# mode -> (ključ, opadajuće); isto kao dropdown na listingu
+SORT_MODES = {
+    "az": ("name", False),
+    "za": ("name", True),
+    "lohi": ("price", False),
+    "hilo": ("price", True),
+}
+
+
+def sorted_catalog(products, mode: str) -> list:
+    """
+    Listing order for `mode`: a stable sort of the catalog (id order), so products with equal
+    names/prices keep their catalog order — the same as the shop's JS `Array.sort`.
+    """
+    key, reverse = SORT_MODES[mode]
+    by_id = sorted(products, key=lambda p: p["id"])
+    return sorted(by_id, key=lambda p: p[key], reverse=reverse)
+
+
+def order_violations(products, mode: str) -> list:
+    """
+    (index, reason) for every adjacent pair of `products` (as listed) that breaks `mode`:
+    'order' if the sort key goes the wrong way, 'tie' if equal keys are not in catalog order.
+    """
+    key, reverse = SORT_MODES[mode]
+    keys = [p[key] for p in products]
+    ids = [p["id"] for p in products]
+    violations = []
+    for i, (a, b, id_a, id_b) in enumerate(zip(keys, keys[1:], ids, ids[1:])):
+        if (a < b) if reverse else (a > b):
+            violations.append((i, "order"))
+        elif a == b and id_a is not None and id_b is not None and id_a > id_b:
+            violations.append((i, "tie"))
+    return violations
+
+
+class CatalogIndex:
+    """
+    The shop's products by name, built once per run (src/plugins/catalog_index.py): prices,
+    ids, data-test ids and expected sort orders without reading the listing again.
+    """
+
+    def __init__(self, products, source: str = ""):
+        self.products = [{"id": p.get("id"), "name": p["name"], "price": p["price"]}
+                         for p in products]
+        self.source = source
+        self._by_name = {p["name"]: p for p in self.products}
+
+    def __len__(self):
+        return len(self.products)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    @property
+    def names(self) -> list:
+        return [p["name"] for p in self.products]
+
+    def get(self, name: str) -> dict:
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise KeyError(f"product '{name}' is not in the catalog ({self.source})") from None
+
+    def price(self, name: str) -> float:
+        return self.get(name)["price"]
+
+    def total(self, names) -> float:
+        """Item total of `names` (as the checkout overview shows it, before tax)."""
+        return round(sum(self.price(n) for n in names), 2)
+
+    def add_to_cart_id(self, name: str) -> str:
+        self.get(name)
+        return data_test_id(name)
+
+    def sorted_names(self, mode: str) -> list:
+        return [p["name"] for p in sorted_catalog(self.products, mode)]
+
+    def save(self, path: str):
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"source": self.source, "products": self.products}, f)
+        os.replace(tmp, path)  # drugi workeri nikad ne vide pola fajla
+
+    @classmethod
+    def load(cls, path: str) -> "CatalogIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["products"], data["source"])
+
+
+_NOUNS = ["Backpack", "Bike Light", "T-Shirt", "Fleece Jacket", "Onesie", "Cap", "Mug", "Socks"]
+_ADJECTIVES = ["Classic", "Sleek", "Rugged", "Lightweight", "Water-Resistant", "Limited Edition",
+               "Organic Cotton", "Reflective", "Oversized", "Everyday"]
+# BMP znakovi (bez surogata), da JS i Python porede imena isto
+_UNICODE = ["Čarape", "Ñandú", "Ölçek", "Ёлка", "Σακίδιο", "日本の帽子", "Café", "Straße"]
+
+
+def synthetic_catalog(size: int, seed: int = 0, long_names: bool = False,
+                      duplicate_prices: float = 0.0, unicode: bool = False) -> list:
+    """
+    `size` generated products in catalog format, ids 0..size-1, names unique (they end in the id).
+
+    long_names:       names of ~120 characters (several adjectives) instead of ~30
+    duplicate_prices: share of products priced from a pool of 5 prices (ties when sorting)
+    unicode:          every third name starts with a non-ASCII word
+    """
+    rnd = random.Random(seed)
+    shared_prices = [rnd.randrange(199, 9999) / 100 for _ in range(5)]
+    products = []
+    for i in range(size):
+        words = [rnd.choice(_NOUNS)]
+        if long_names:
+            words = rnd.sample(_ADJECTIVES, 6) + words
+        if unicode and i % 3 == 0:
+            words.insert(0, rnd.choice(_UNICODE))
+        if rnd.random() < duplicate_prices:
+            price = rnd.choice(shared_prices)
+        else:
+            price = rnd.randrange(199, 9999) / 100
+        products.append({
+            "id": i,
+            "name": f"Sauce Labs {' '.join(words)} {i:06d}",
+            "price": price,
+            "desc": f"Synthetic product #{i}.",
+            "img": "sauce-backpack.jpg",
+        })
+    return products
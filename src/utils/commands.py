@@ -0,0 +1,60 @@
+# src/utils/commands.py
+"""
+Hooks on WebDriver commands.
+
+Every WebDriver/WebElement call ends in `driver.execute(command, params)`; listeners added here
+are called after each command with `(command, params, elapsed_seconds, error)`.
+"""
+import time
+from collections import Counter
+
+
+def add_command_listener(driver, listener):
+    listeners = driver.__dict__.get("_command_listeners")
+    if listeners is None:
+        listeners = driver._command_listeners = []
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                response = original(driver_command, params)
+            except Exception as e:
+                elapsed = time.perf_counter() - start
+                for fn in list(listeners):
+                    fn(driver_command, params, elapsed, e)
+                raise
+            elapsed = time.perf_counter() - start
+            for fn in list(listeners):
+                fn(driver_command, params, elapsed, None)
+            return response
+
+        driver.execute = execute
+    listeners.append(listener)
+    return listener
+
+
+def remove_command_listener(driver, listener):
+    listeners = driver.__dict__.get("_command_listeners", [])
+    if listener in listeners:
+        listeners.remove(listener)
+
+
+class CommandCounter:
+    """Listener that counts commands (total and per command name) and their time."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.seconds = 0.0
+
+    def __call__(self, command, params, elapsed, error):
+        self.counts[command] += 1
+        self.seconds += elapsed
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def reset(self):
+        self.counts.clear()
+        self.seconds = 0.0
@@ -0,0 +1,166 @@
+# src/utils/driver_factory.py
+"""
+Local Chrome/Firefox sessions with named launch profiles.
+
+    default  what the suite always used: headless, window size, --disable-gpu
+    fast     default + no extensions/background networking/component updates/sync/background
+             throttling, throwaway profile dir on tmpfs (/dev/shm when available)
+    shell    fast on chrome-headless-shell (path in CHROME_HEADLESS_SHELL or `binary`)
+
+Transports: `stock` is selenium's RemoteConnection, `pooled` sends the commands through
+src/utils/transport.py (keep-alive pool + per-command timing).
+"""
+import os
+import shutil
+import tempfile
+import warnings
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+
+from src.utils.transport import install_transport
+
+PROFILES = ("default", "fast", "shell")
+TRANSPORTS = ("stock", "pooled")
+
+FAST_CHROME_ARGS = [
+    "--disable-extensions",
+    "--disable-component-extensions-with-background-pages",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--password-store=basic",
+]
+
+FAST_FIREFOX_PREFS = {
+    "app.update.auto": False,
+    "app.update.enabled": False,
+    "extensions.update.enabled": False,
+    "extensions.getAddons.cache.enabled": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.homepage_override.mstone": "ignore",
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "browser.cache.disk.enable": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "dom.min_background_timeout_value": 0,
+    "services.sync.enabled": False,
+}
+
+
+def parse_window_size(size: str):
+    return tuple(int(x) for x in size.split(",")) if "," in size else (1440, 900)
+
+
+def tmpfs_dir(prefix: str) -> str:
+    """Fresh directory on /dev/shm (RAM) when it exists, else in the system temp dir."""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+    return tempfile.mkdtemp(prefix=prefix, dir=base)
+
+
+def chrome_options(profile: str = "default", headed: bool = False, window_size=(1440, 900),
+                   user_data_dir: str = None, binary: str = None) -> ChromeOptions:
+    w, h = window_size
+    opts = ChromeOptions()
+    if headed and profile == "shell":
+        # pytest.ini ima --headed u addopts -> upozorenje, ne greška
+        warnings.warn("profile 'shell' is always headless (chrome-headless-shell has no window); "
+                      "--headed is ignored", stacklevel=2)
+    if not headed and profile != "shell":
+        opts.add_argument("--headless=new")
+    opts.add_argument(f"--window-size={w},{h}")
+    opts.add_argument("--disable-gpu")
+    # console logovi za failure trace (driver.get_log("browser"))
+    opts.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+    if profile in ("fast", "shell"):
+        for arg in FAST_CHROME_ARGS:
+            opts.add_argument(arg)
+        if user_data_dir:
+            opts.add_argument(f"--user-data-dir={user_data_dir}")
+    if profile == "shell":
+        binary = binary or os.getenv("CHROME_HEADLESS_SHELL")
+        if not binary:
+            raise ValueError("profile 'shell' needs chrome-headless-shell: "
+                             "set CHROME_HEADLESS_SHELL")
+        opts.binary_location = binary
+    return opts
+
+
+def firefox_options(profile: str = "default", headed: bool = False,
+                    profile_dir: str = None) -> FirefoxOptions:
+    if profile == "shell":
+        raise ValueError("profile 'shell' is Chrome-only (chrome-headless-shell)")
+    opts = FirefoxOptions()
+    if not headed:
+        opts.add_argument("-headless")
+    if profile == "fast":
+        for name, value in FAST_FIREFOX_PREFS.items():
+            opts.set_preference(name, value)
+        if profile_dir:
+            opts.add_argument("-profile")
+            opts.add_argument(profile_dir)
+    return opts
+
+
+def _remove_on_quit(drv, path: str):
+    original = drv.quit
+
+    def quit():
+        try:
+            original()
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+
+    drv.quit = quit
+
+
+def build_driver(browser: str = "chrome", headed: bool = False, window_size=(1440, 900),
+                 implicit_wait: float = 2, profile: str = "default", transport: str = "stock"):
+    """Start a local Chrome/Firefox session configured the same way as the `driver` fixture."""
+    if profile not in PROFILES:
+        raise ValueError(f"unknown browser profile '{profile}' "
+                         f"(expected one of {', '.join(PROFILES)})")
+    if transport not in TRANSPORTS:
+        raise ValueError(f"unknown transport '{transport}' "
+                         f"(expected one of {', '.join(TRANSPORTS)})")
+    scratch = tmpfs_dir(f"qa-{browser}-") if profile != "default" else None
+    try:
+        if browser == "firefox":
+            opts = firefox_options(profile, headed, scratch)
+            service = FirefoxService(executable_path=GeckoDriverManager().install())
+            drv = webdriver.Firefox(service=service, options=opts)
+        else:
+            opts = chrome_options(profile, headed, window_size, scratch)
+            service = ChromeService(ChromeDriverManager().install())
+            drv = webdriver.Chrome(service=service, options=opts)
+    except Exception:
+        if scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+        raise
+    if scratch:
+        _remove_on_quit(drv, scratch)
+    if transport == "pooled":
+        # chromedriver/geckodriver slušaju samo TCP -> pool na localhost, bez Unix socketa
+        install_transport(drv)
+
+    drv.implicitly_wait(implicit_wait)
+    return drv
@@ -0,0 +1,160 @@
+# src/utils/element_checks.py
+"""
+Bulk element assertions: many (selector, property, predicate) checks in one script call.
+
+    report = check_elements(driver, [
+        Check(".inventory_item_name", "text", nonempty),
+        Check(".inventory_item_price", "text", contains("$")),
+        Check("img", "naturalHeight", positive),
+    ], scope=".inventory_item")
+    report.assert_ok()
+
+With `scope` every check runs inside each element matching it (e.g. each product card); without
+it, once on the page. The browser only reads the values — one round trip for the whole page —
+and the predicates run here, so a failure names the scope element, selector, property, the
+value that was read and the predicate it failed.
+
+Properties: "displayed" (rendered, not hidden, non-zero size), "text" (rendered text, trimmed),
+"attr:<name>" (HTML attribute) or any DOM property ("value", "complete", "naturalHeight", ...).
+"""
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+BULK_CHECK_JS = """/* bulkCheck */
+var scopeSelector = arguments[0], specs = arguments[1];
+var scopes = scopeSelector ? document.querySelectorAll(scopeSelector) : [document.documentElement];
+
+function displayed(el) {
+    for (var n = el; n && n.nodeType === 1; n = n.parentElement) {
+        var style = window.getComputedStyle(n);
+        if (style.display === 'none' || style.visibility === 'hidden'
+            || parseFloat(style.opacity) === 0) return false;
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+function read(el, prop) {
+    if (prop === 'displayed') return displayed(el);
+    if (prop === 'text') return (el.innerText || '').trim();
+    if (prop.indexOf('attr:') === 0) return el.getAttribute(prop.slice(5));
+    var value = el[prop];
+    if (value === undefined || value === null || typeof value !== 'object') return value;
+    return String(value);
+}
+
+return Array.prototype.map.call(scopes, function (scope) {
+    return specs.map(function (spec) {
+        var el = spec[0] ? scope.querySelector(spec[0]) : scope;
+        return el ? [true, read(el, spec[1])] : [false, null];
+    });
+});"""
+
+
+# ----- predicates (ime funkcije ide u poruku greške) -----
+def _name(predicate) -> str:
+    return getattr(predicate, "__name__", repr(predicate))
+
+
+def truthy(value) -> bool:
+    return bool(value)
+
+
+def nonempty(value) -> bool:
+    return bool(value and str(value).strip())
+
+
+def positive(value) -> bool:
+    return value is not None and float(value) > 0
+
+
+def contains(part: str):
+    def predicate(value):
+        return value is not None and part in str(value)
+
+    predicate.__name__ = f"contains {part!r}"
+    return predicate
+
+
+def matches(pattern: str):
+    compiled = re.compile(pattern)
+
+    def predicate(value):
+        return value is not None and compiled.search(str(value)) is not None
+
+    predicate.__name__ = f"matches {pattern!r}"
+    return predicate
+
+
+@dataclass
+class Check:
+    selector: Optional[str]
+    prop: str
+    predicate: Callable[[Any], bool] = truthy
+    optional: bool = False  # element koji ne postoji nije greška
+
+    def describe(self) -> str:
+        return f"{self.selector or '<scope>'} {self.prop}"
+
+
+@dataclass
+class CheckResult:
+    index: int
+    check: Check
+    found: bool
+    value: Any
+    passed: bool
+    error: Optional[str] = None
+
+    def message(self, scope: Optional[str]) -> str:
+        where = f"{scope}[{self.index}] " if scope else ""
+        if not self.found:
+            return f"{where}{self.check.selector}: element not found"
+        reason = self.error or f"expected {_name(self.check.predicate)}"
+        return f"{where}{self.check.describe()} = {self.value!r}: {reason}"
+
+
+@dataclass
+class ElementReport:
+    scope: Optional[str]
+    count: int
+    results: list
+
+    @property
+    def failures(self) -> list:
+        return [r for r in self.results if not r.passed]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def values(self, selector: str, prop: str) -> list:
+        """Value of one check for every scope element, in page order."""
+        return [r.value for r in self.results
+                if r.check.selector == selector and r.check.prop == prop]
+
+    def assert_ok(self, min_count: int = 1):
+        problems = [r.message(self.scope) for r in self.failures]
+        if self.count < min_count:
+            problems.insert(0, f"expected at least {min_count} element(s) for "
+                               f"{self.scope or 'page'}, found {self.count}")
+        assert not problems, f"{len(problems)} element check(s) failed:\n  " + "\n  ".join(problems)
+        return self
+
+
+def check_elements(driver, checks, scope: str = None) -> ElementReport:
+    """Read every check's value in one script call and evaluate the predicates."""
+    checks = list(checks)
+    rows = driver.execute_script(BULK_CHECK_JS, scope, [[c.selector, c.prop] for c in checks])
+    results = []
+    for index, row in enumerate(rows):
+        for check, (found, value) in zip(checks, row):
+            if not found:
+                results.append(CheckResult(index, check, False, None, check.optional))
+                continue
+            try:
+                results.append(CheckResult(index, check, True, value, bool(check.predicate(value))))
+            except Exception as e:
+                results.append(CheckResult(index, check, True, value, False,
+                                           f"{type(e).__name__}: {e}"))
+    return ElementReport(scope, len(rows), results)
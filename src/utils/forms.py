@@ -0,0 +1,79 @@
+# src/utils/forms.py
+"""
+Fast form fill: set every field, submit and wait for the next page in one async script call.
+
+    fill_form(driver, {first: "Ema", last: "Test", zip_code: "71000"}, submit=continue_btn,
+              url_part="/checkout-step-two.html", ready_locators=[finish_btn],
+              error_locator=error_h3)
+
+Values are set through the element's native `value` setter followed by bubbling `input` and
+`change` events, so React's controlled inputs pick them up like typed text. No key events are
+sent: tests that check typing behaviour (special keys, per-keystroke validation) keep
+`BasePage.type`. The submit must stay in the page (client-side routing, as on saucedemo);
+a full page load would drop the script's callback.
+"""
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from src.utils.wait import DEFAULT_TIMEOUT, browser_locator
+
+FILL_FORM_JS = """/* fillForm */
+var fields = arguments[0], submit = arguments[1], urlPart = arguments[2], locators = arguments[3],
+    errorLocator = arguments[4], timeoutMs = arguments[5], done = arguments[arguments.length - 1];
+
+function find(loc) {
+    return loc[0] === 'xpath'
+        ? document.evaluate(loc[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE,
+                            null).singleNodeValue
+        : document.querySelector(loc[1]);
+}
+
+var missing = [];
+fields.forEach(function (field) {
+    var el = find(field);
+    if (!el) { missing.push(field[1]); return; }
+    // React prati vrijednost preko native settera; direktno el.value = ... ne bi vidio
+    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+    setter.call(el, field[2]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+var button = submit && find(submit);
+if (submit && !button) missing.push(submit[1]);
+if (missing.length || !submit) return done({missing: missing, ready: !missing.length, error: null});
+
+button.click();
+var deadline = Date.now() + timeoutMs;
+(function poll() {
+    var ready = (!urlPart || window.location.href.indexOf(urlPart) !== -1) && locators.every(find);
+    var error = errorLocator && find(errorLocator);
+    if (ready || error || Date.now() > deadline) {
+        var text = error ? (error.innerText || '').trim() : null;
+        return done({missing: [], ready: ready, error: text});
+    }
+    setTimeout(poll, 50);
+})();"""
+
+
+def fill_form(driver, fields: dict, submit=None, url_part=None, ready_locators=(),
+              error_locator=None, timeout: float = DEFAULT_TIMEOUT) -> dict:
+    """
+    `fields`: locator -> text. With `submit`, clicks it and waits in the browser until `url_part`
+    and `ready_locators` are there; raises TimeoutException (with the page's error text when
+    `error_locator` shows one) if they are not, NoSuchElementException if a field is missing.
+    """
+    args = [[*browser_locator(*locator), text] for locator, text in fields.items()]
+    result = driver.execute_async_script(
+        FILL_FORM_JS,
+        args,
+        list(browser_locator(*submit)) if submit else None,
+        url_part,
+        [list(browser_locator(*loc)) for loc in ready_locators],
+        list(browser_locator(*error_locator)) if error_locator else None,
+        int(timeout * 1000),
+    )
+    if result["missing"]:
+        raise NoSuchElementException(f"fast fill: no element for {', '.join(result['missing'])}")
+    if submit and not result["ready"]:
+        reason = result["error"] or f"{url_part or 'page'} not ready after {timeout}s"
+        raise TimeoutException(f"fast fill: submit did not reach the next page: {reason}")
+    return result
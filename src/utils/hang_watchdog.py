@@ -0,0 +1,149 @@
+# src/utils/hang_watchdog.py
+"""
+Wall-clock limit for one test at a time, enforced from a background thread.
+
+- `arm(name, seconds, drivers)` before the test, `disarm()` after it; `disarm()` +
+  `resume(deadline)` pause the same limit (the clock keeps running) while code that must not
+  be interrupted runs, e.g. pytest's reporting hooks between setup, call and teardown
+- when the limit passes, the thread records the test thread's stack, SIGKILLs every driver
+  process tree (chromedriver/geckodriver + browser + renderers) so blocked HTTP calls return,
+  and raises `TestTimeout` in the test thread (signal handler on the main thread, async
+  exception otherwise) so WebDriverWait loops and sleeps end too
+- `TestTimeout` is a BaseException: page-object `except Exception` blocks do not swallow it
+- a killed driver gets `_hung` set, so the browser pool drops it instead of reusing it
+"""
+import ctypes
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from src.utils.memory import descendants
+
+_SIGNAL = getattr(signal, "SIGUSR2", None)
+
+
+class TestTimeout(BaseException):
+    """The test ran past its watchdog limit."""
+
+    __test__ = False  # nije test klasa za pytest
+
+
+@dataclass
+class Deadline:
+    name: str
+    seconds: float
+    drivers: Callable[[], list]
+    thread_id: int
+    start: float = field(default_factory=time.monotonic)
+    fired: bool = False
+    raised: bool = False
+    stack: str = ""
+    killed: list = field(default_factory=list)
+
+    @property
+    def expires(self) -> float:
+        return self.start + self.seconds
+
+
+def kill_driver(driver) -> list:
+    """SIGKILL the driver's service process and all its children; returns the pids."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None:
+        return []  # remote driver: nema lokalnog procesa
+    pids = [process.pid] + descendants(process.pid)
+    for pid in reversed(pids):
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    return pids
+
+
+class HangWatchdog:
+    def __init__(self, poll: float = 0.25):
+        self.poll = poll
+        self._lock = threading.Lock()
+        self._current: Optional[Deadline] = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._previous_handler = None
+        self._signal_installed = False
+
+    # ----- lifecycle -----
+    def start(self):
+        if _SIGNAL is not None and threading.current_thread() is threading.main_thread():
+            self._previous_handler = signal.signal(_SIGNAL, self._on_signal)
+            self._signal_installed = True
+        self._thread = threading.Thread(target=self._run, name="hang-watchdog", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._signal_installed:
+            signal.signal(_SIGNAL, self._previous_handler or signal.SIG_DFL)
+            self._signal_installed = False
+
+    def deadline(self, name: str, seconds: float, drivers: Callable[[], list] = list) -> Deadline:
+        """A limit for the calling thread, not enforced until `resume`."""
+        return Deadline(name, seconds, drivers, threading.get_ident())
+
+    def arm(self, name: str, seconds: float, drivers: Callable[[], list] = list) -> Deadline:
+        return self.resume(self.deadline(name, seconds, drivers))
+
+    def resume(self, deadline: Deadline) -> Deadline:
+        # već istekao -> watchdog okida na sljedećem poll-u
+        with self._lock:
+            self._current = deadline
+        return deadline
+
+    def disarm(self) -> Optional[Deadline]:
+        with self._lock:
+            deadline, self._current = self._current, None
+        if deadline and deadline.fired and not deadline.raised and not self._uses_signal(deadline):
+            # izuzetak nije stigao do testa -> ne smije pasti u pytest kod poslije
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(deadline.thread_id), None)
+        return deadline
+
+    # ----- watchdog thread -----
+    def _run(self):
+        while not self._stop.wait(self.poll):
+            with self._lock:
+                deadline = self._current
+                if deadline is None or deadline.fired or time.monotonic() < deadline.expires:
+                    continue
+                deadline.fired = True
+            self._fire(deadline)
+
+    def _fire(self, deadline: Deadline):
+        frame = sys._current_frames().get(deadline.thread_id)
+        deadline.stack = "".join(traceback.format_stack(frame)) if frame else ""
+        for driver in deadline.drivers():
+            try:
+                driver._hung = f"killed by watchdog after {deadline.seconds:g}s"
+                deadline.killed.extend(kill_driver(driver))
+            except Exception:
+                pass
+        with self._lock:
+            if self._current is not deadline:
+                return  # test je u međuvremenu završio
+            if self._uses_signal(deadline):
+                signal.pthread_kill(deadline.thread_id, _SIGNAL)
+            else:
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(deadline.thread_id),
+                                                           ctypes.py_object(TestTimeout))
+
+    def _uses_signal(self, deadline: Deadline) -> bool:
+        return self._signal_installed and deadline.thread_id == threading.main_thread().ident
+
+    def _on_signal(self, signum, frame):
+        deadline = self._current
+        if deadline is None or not deadline.fired or deadline.raised:
+            return
+        deadline.raised = True
+        raise TestTimeout(f"{deadline.name} exceeded {deadline.seconds:g}s")
@@ -0,0 +1,119 @@
+# src/utils/memory.py
+"""
+Browser memory sampling and a watchdog for long-lived sessions.
+
+- `tree_rss_mb(pid)`: RSS of the driver process and all its children (browser, renderers),
+  from Linux /proc
+- `js_heap_mb(driver)`: used JS heap of the current page: CDP `Runtime.getHeapUsage` on
+  Chromium, `performance.memory` where only that exists, None elsewhere (Firefox)
+- `MemoryWatchdog`: samples a session between tests, keeps a timeline and says when a
+  session crossed its thresholds and should be restarted
+"""
+import os
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+_HEAP_JS = "var m = window.performance && performance.memory; return m ? m.usedJSHeapSize : null;"
+
+
+def _children() -> dict:
+    tree = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # comm može sadržavati razmake -> ppid je 2. polje poslije zadnje ')'
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        tree.setdefault(ppid, []).append(int(entry))
+    return tree
+
+
+def descendants(pid: int) -> list:
+    """Every child, grandchild, ... of `pid` (deepest last); empty where /proc is not available."""
+    if not os.path.isdir("/proc"):
+        return []
+    tree, stack, found = _children(), [pid], []
+    while stack:
+        children = tree.get(stack.pop(), [])
+        found.extend(children)
+        stack.extend(children)
+    return found
+
+
+def tree_rss_mb(pid: int):
+    """RSS (MB) of `pid` and all its descendants; None where /proc is not available."""
+    if not os.path.isdir("/proc"):
+        return None
+    tree, stack, total = _children(), [pid], 0
+    while stack:
+        p = stack.pop()
+        stack.extend(tree.get(p, []))
+        try:
+            with open(f"/proc/{p}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total / 1024
+
+
+def driver_rss_mb(driver):
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    return tree_rss_mb(process.pid) if process else None
+
+
+def js_heap_mb(driver):
+    try:
+        if hasattr(driver, "execute_cdp_cmd"):
+            return driver.execute_cdp_cmd("Runtime.getHeapUsage", {})["usedSize"] / 1024 / 1024
+        used = driver.execute_script(_HEAP_JS)
+    except WebDriverException:
+        return None
+    return used / 1024 / 1024 if used is not None else None
+
+
+class MemoryWatchdog:
+    """Timeline of memory samples; `check` returns why a session should be recycled, or None."""
+
+    def __init__(self, max_rss_mb: float = None, max_heap_mb: float = None):
+        self.max_rss_mb = max_rss_mb
+        self.max_heap_mb = max_heap_mb
+        self.timeline = []
+        self._start = time.time()
+
+    def check(self, driver, test: str = None, **labels):
+        rss, heap = driver_rss_mb(driver), js_heap_mb(driver)
+        reason = None
+        if self.max_rss_mb and rss is not None and rss > self.max_rss_mb:
+            reason = f"rss {rss:.0f}MB > {self.max_rss_mb:.0f}MB"
+        elif self.max_heap_mb and heap is not None and heap > self.max_heap_mb:
+            reason = f"js heap {heap:.0f}MB > {self.max_heap_mb:.0f}MB"
+        self.timeline.append({
+            "t": round(time.time() - self._start, 2), "test": test, **labels,
+            "rss_mb": round(rss, 1) if rss is not None else None,
+            "heap_mb": round(heap, 1) if heap is not None else None,
+            "recycled": reason,
+        })
+        return reason
+
+
+def summarize_timeline(timeline: list) -> dict:
+    """Samples, peaks, first/last RSS and recycle count of one worker's timeline."""
+    rss = [s["rss_mb"] for s in timeline if s["rss_mb"] is not None]
+    heap = [s["heap_mb"] for s in timeline if s["heap_mb"] is not None]
+    return {
+        "samples": len(timeline),
+        "recycles": sum(1 for s in timeline if s["recycled"]),
+        "peak_rss_mb": max(rss) if rss else None,
+        "first_rss_mb": rss[0] if rss else None,
+        "last_rss_mb": rss[-1] if rss else None,
+        "peak_heap_mb": max(heap) if heap else None,
+    }
@@ -0,0 +1,86 @@
+# src/utils/page_graph.py
+"""
+Page-transition graph of the page objects.
+
+A navigation method decorated with `@transition("CartPage")` (src/pages/base_page.py) is an
+edge from its page class to the target page. `transition_graph()` collects every edge declared
+in src/pages/, `reachable()` keeps the ones that can be reached from the entry page, and
+`exercised` records the edges that tests actually walked, so a run can list the transitions
+nobody covers.
+"""
+import importlib
+import pkgutil
+import threading
+from collections import deque
+
+ENTRY_PAGE = "LoginPage"
+
+
+class TransitionLog:
+    """Thread-safe set of (page, method, target) edges walked in this process."""
+
+    def __init__(self):
+        self._edges = set()
+        self._recent = set()
+        self._lock = threading.Lock()
+
+    def record(self, page: str, method: str, target: str):
+        with self._lock:
+            self._edges.add((page, method, target))
+            self._recent.add((page, method, target))
+
+    def drain(self) -> list:
+        """Edges walked since the last drain (one test's transitions)."""
+        with self._lock:
+            recent, self._recent = self._recent, set()
+        return sorted(recent)
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return sorted(self._edges)
+
+    def merge(self, edges):
+        with self._lock:
+            self._edges.update(tuple(e) for e in edges)
+
+    def clear(self):
+        with self._lock:
+            self._edges.clear()
+            self._recent.clear()
+
+
+exercised = TransitionLog()
+
+
+def transition_graph(package=None) -> list:
+    """[(page, method, target)] for every `@transition` method on the page classes, sorted."""
+    if package is None:
+        import src.pages as package
+    edges = set()
+    for mod in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package.__name__}.{mod.name}")
+        for cls in vars(module).values():
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            for name, fn in vars(cls).items():
+                target = getattr(fn, "transition_target", None)
+                if target:
+                    edges.add((cls.__name__, name, target))
+    return sorted(edges)
+
+
+def reachable(edges, start: str = ENTRY_PAGE) -> list:
+    """Edges whose source page can be reached from `start` (breadth first)."""
+    seen, queue = {start}, deque([start])
+    while queue:
+        page = queue.popleft()
+        for source, _, target in edges:
+            if source == page and target not in seen:
+                seen.add(target)
+                queue.append(target)
+    return [e for e in edges if e[0] in seen]
+
+
+def unexercised(edges, walked) -> list:
+    walked = {tuple(e) for e in walked}
+    return [e for e in edges if tuple(e) not in walked]
@@ -0,0 +1,172 @@
+# src/utils/profiling.py
+"""
+CPU profiles of page-object steps through the Chrome DevTools Profiler (CDP).
+
+    @profiled("sort")                      # on a page-object method
+    def sort(self, mode): ...
+
+    profiler = StepProfiler(driver).attach()
+    ...                                    # every @profiled step records one profile
+    profiler.detach()
+    profiler.save("reports/profiles/test_x")   # 01-login-submit.cpuprofile, ...
+
+Without an attached profiler (or on browsers without CDP) `@profiled` methods run unchanged.
+Profiles are the `.cpuprofile` format Chrome DevTools / speedscope open. `summarize` splits the
+step's sampled time into idle (waiting — network, timers), program/gc (browser internals),
+page JS and scripts without a URL (what WebDriver injects: our waits and polling), plus the
+top functions by self time.
+"""
+import functools
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from selenium.common.exceptions import WebDriverException
+
+DEFAULT_INTERVAL_US = 200
+_SPECIAL = {"(idle)": "idle", "(program)": "program", "(garbage collector)": "gc",
+            "(root)": "program"}
+
+
+@dataclass
+class StepProfile:
+    step: str
+    seconds: float
+    profile: Optional[dict]
+
+
+class StepProfiler:
+    """Profiles every `@profiled` step run on `driver` while attached."""
+
+    def __init__(self, driver, interval_us: int = DEFAULT_INTERVAL_US):
+        self.driver = driver
+        self.interval_us = interval_us
+        self.steps = []
+        self._running = False
+
+    @staticmethod
+    def supported(driver) -> bool:
+        return hasattr(driver, "execute_cdp_cmd")
+
+    def attach(self):
+        self.driver._step_profiler = self
+        try:
+            self.driver.execute_cdp_cmd("Profiler.enable", {})
+            self.driver.execute_cdp_cmd("Profiler.setSamplingInterval",
+                                        {"interval": self.interval_us})
+        except WebDriverException:
+            pass
+        return self
+
+    def detach(self):
+        self.driver.__dict__.pop("_step_profiler", None)
+        try:
+            self.driver.execute_cdp_cmd("Profiler.disable", {})
+        except WebDriverException:
+            pass
+
+    def run(self, step: str, fn):
+        # ugniježđeni korak (npr. sign_in -> login) ide u profil vanjskog
+        if self._running:
+            return fn()
+        try:
+            self.driver.execute_cdp_cmd("Profiler.start", {})
+        except WebDriverException:
+            return fn()
+        self._running = True
+        start = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            seconds = time.perf_counter() - start
+            self._running = False
+            try:
+                profile = self.driver.execute_cdp_cmd("Profiler.stop", {})["profile"]
+            except WebDriverException:
+                profile = None  # target se promijenio (full navigation) -> samo trajanje
+            self.steps.append(StepProfile(step, seconds, profile))
+
+    def save(self, folder: str) -> list:
+        """One compact .cpuprofile per step that has a profile; returns the paths."""
+        os.makedirs(folder, exist_ok=True)
+        paths = []
+        for i, s in enumerate(self.steps, 1):
+            if s.profile is None:
+                continue
+            name = re.sub(r"[^\w]+", "-", s.step).strip("-")
+            path = os.path.join(folder, f"{i:02d}-{name}.cpuprofile")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(s.profile, f, separators=(",", ":"))
+            paths.append(path)
+        return paths
+
+
+def profiled(step: str):
+    """Page-object method decorator: profile the call when the driver has a StepProfiler."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.driver.__dict__.get("_step_profiler")
+            if profiler is None:
+                return method(self, *args, **kwargs)
+            return profiler.run(step, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorate
+
+
+def self_times(profile: dict) -> dict:
+    """node id -> self time in ms; a sample lasts until the next one (the last until endTime)."""
+    samples, deltas = profile.get("samples", []), profile.get("timeDeltas", [])
+    times = {}
+    stamp = profile.get("startTime", 0)
+    stamps = []
+    for delta in deltas:
+        stamp += delta
+        stamps.append(stamp)
+    for i, node_id in enumerate(samples):
+        end = stamps[i + 1] if i + 1 < len(stamps) else profile.get("endTime", stamps[i])
+        times[node_id] = times.get(node_id, 0.0) + max(end - stamps[i], 0) / 1000
+    return times
+
+
+def summarize(profile: dict, top: int = 10) -> dict:
+    """
+    {"total_ms", "categories": {category: ms}, "top": [{function, location, self_ms, percent}]}
+    """
+    nodes = {n["id"]: n["callFrame"] for n in profile.get("nodes", [])}
+    categories = {"idle": 0.0, "program": 0.0, "gc": 0.0, "page js": 0.0, "injected": 0.0}
+    functions = {}
+    for node_id, ms in self_times(profile).items():
+        frame = nodes.get(node_id, {})
+        name = frame.get("functionName") or "(anonymous)"
+        if name in _SPECIAL:
+            categories[_SPECIAL[name]] += ms
+            continue
+        categories["page js" if frame.get("url") else "injected"] += ms
+        location = f"{frame.get('url') or '<script>'}:{frame.get('lineNumber', -1) + 1}"
+        functions[(name, location)] = functions.get((name, location), 0.0) + ms
+    total = sum(categories.values())
+    ranked = sorted(functions.items(), key=lambda kv: -kv[1])[:top]
+    return {
+        "total_ms": round(total, 1),
+        "categories": {k: round(v, 1) for k, v in categories.items()},
+        "top": [{"function": name, "location": location, "self_ms": round(ms, 1),
+                 "percent": round(100 * ms / total, 1) if total else 0.0}
+                for (name, location), ms in ranked],
+    }
+
+
+def format_summary(step: str, seconds: float, summary: Optional[dict]) -> str:
+    if summary is None:
+        return f"{step}: {seconds:.2f}s (no profile)"
+    split = "  ".join(f"{k} {v:.0f}ms" for k, v in summary["categories"].items() if v)
+    lines = [f"{step}: {seconds:.2f}s  {split}"]
+    for f in summary["top"]:
+        lines.append(f"  {f['self_ms']:>8.1f}ms {f['percent']:>5.1f}%  "
+                     f"{f['function']}  {f['location']}")
+    return "\n".join(lines)
@@ -0,0 +1,158 @@
+# src/utils/result_cache.py
+"""
+Content-hash cache of passing tests.
+
+A test's key is a SHA-256 over everything that can change its result:
+- the test module and, transitively, every project module it imports (page objects, utils, ...)
+- conftest.py, pytest.ini, plugins, src/data/users.json and src/data/catalog.json (shared by
+  every test)
+- for browser tests: the installed browser version and a fingerprint of the target site build
+
+`ResultCache` maps node ids to the key of their last pass; a test whose current key matches
+can be reported as "cached-pass" instead of being run again.
+"""
+import ast
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import urllib.request
+from functools import lru_cache
+
+CACHE_PATH = ".qa-cache/results.json"
+SHARED_INPUTS = ["conftest.py", "pytest.ini", "src/data/users.json", "src/data/catalog.json"]
+SHARED_DIRS = ["src/plugins"]
+PROJECT_PACKAGES = ("src", "tools", "benchmarks")
+
+_BROWSER_BINARIES = {
+    "chrome": ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"],
+    "firefox": ["firefox"],
+}
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _module_file(root: str, module: str):
+    base = os.path.join(root, *module.split("."))
+    for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _imports(path: str) -> set:
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(a.name for a in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module)
+            # `from src.pages import login_page` -> i podmoduli
+            names.update(f"{node.module}.{a.name}" for a in node.names)
+    return {n for n in names if n.split(".")[0] in PROJECT_PACKAGES}
+
+
+@lru_cache(maxsize=None)
+def module_closure(root: str, path: str) -> tuple:
+    """`path` plus every project file it imports, transitively (sorted, relative to `root`)."""
+    seen, stack = set(), [os.path.abspath(path)]
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        for module in _imports(current):
+            found = _module_file(root, module)
+            if found:
+                stack.append(os.path.abspath(found))
+    return tuple(sorted(os.path.relpath(p, root) for p in seen))
+
+
+@lru_cache(maxsize=None)
+def shared_digest(root: str) -> str:
+    h = hashlib.sha256()
+    files = [p for p in SHARED_INPUTS if os.path.isfile(os.path.join(root, p))]
+    for folder in SHARED_DIRS:
+        full = os.path.join(root, folder)
+        if os.path.isdir(full):
+            files += sorted(os.path.join(folder, f) for f in os.listdir(full) if f.endswith(".py"))
+    for rel in files:
+        h.update(rel.encode())
+        h.update(_file_digest(os.path.join(root, rel)).encode())
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def browser_version(browser: str) -> str:
+    """'Google Chrome 128.0.6613.84' etc. from the installed binary, 'unknown' if not found."""
+    for binary in _BROWSER_BINARIES.get(browser, [browser]):
+        path = shutil.which(binary)
+        if not path:
+            continue
+        try:
+            out = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=15)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if out.returncode == 0 and out.stdout.strip():
+            return out.stdout.strip()
+    return "unknown"
+
+
+@lru_cache(maxsize=None)
+def target_fingerprint(base_url: str):
+    """
+    Hash of the target's entry page (its hashed bundle names change with every build);
+    None when the target cannot be reached — then nothing counts as cached.
+    """
+    try:
+        with urllib.request.urlopen(base_url.rstrip("/") + "/", timeout=10) as resp:
+            return hashlib.sha256(resp.read()).hexdigest()
+    except Exception:
+        return None
+
+
+def cache_key(root: str, test_file: str, browser: str = None, base_url: str = None):
+    """Cache key of a test in `test_file`; browser tests add browser version and target build."""
+    h = hashlib.sha256(shared_digest(root).encode())
+    for rel in module_closure(root, test_file):
+        h.update(rel.encode())
+        h.update(_file_digest(os.path.join(root, rel)).encode())
+    if browser is not None:
+        fingerprint = target_fingerprint(base_url)
+        if fingerprint is None:
+            return None
+        h.update(browser_version(browser).encode())
+        h.update(fingerprint.encode())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """JSON file: node id -> key of its last passing run."""
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def is_cached_pass(self, nodeid: str, key: str) -> bool:
+        return key is not None and self.entries.get(nodeid) == key
+
+    def passed(self, nodeid: str, key: str):
+        if key is not None:
+            self.entries[nodeid] = key
+
+    def failed(self, nodeid: str):
+        self.entries.pop(nodeid, None)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
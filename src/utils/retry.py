@@ -0,0 +1,176 @@
+# src/utils/retry.py
+"""
+Retry engine for flaky WebDriver interactions.
+
+- retries only the exceptions it is told are transient (stale/intercepted by default)
+- every call is bound by an attempt limit and a wall-clock deadline
+- backoff is exponential with jitter and starts from the recovery time observed
+  for the same key (e.g. a locator), so slow re-renders get longer pauses
+- every retry is counted per key in `telemetry`
+"""
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    StaleElementReferenceException,
+)
+
+TRANSIENT = (
+    StaleElementReferenceException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+)
+
+# težina novog uzorka u eksponencijalnom prosjeku vremena oporavka
+_EWMA_ALPHA = 0.3
+
+
+@dataclass
+class RetryRecord:
+    calls: int = 0
+    retries: int = 0
+    failures: int = 0
+    retry_seconds: float = 0.0
+    recovery_ewma: Optional[float] = None
+    errors: Counter = field(default_factory=Counter)
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures,
+            "retry_seconds": round(self.retry_seconds, 4),
+            "recovery_ewma": self.recovery_ewma,
+            "errors": dict(self.errors),
+        }
+
+
+class RetryTelemetry:
+    """Thread-safe per-key retry counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = {}
+
+    def record(self, key: str) -> RetryRecord:
+        with self._lock:
+            return self._records.setdefault(key, RetryRecord())
+
+    def called(self, key: str, retry_seconds: float = 0.0, recovery: Optional[float] = None):
+        rec = self.record(key)
+        with self._lock:
+            rec.calls += 1
+            rec.retry_seconds += retry_seconds
+            if recovery is not None:
+                rec.recovery_ewma = (
+                    recovery
+                    if rec.recovery_ewma is None
+                    else (1 - _EWMA_ALPHA) * rec.recovery_ewma + _EWMA_ALPHA * recovery
+                )
+
+    def retried(self, key: str, error: BaseException):
+        rec = self.record(key)
+        with self._lock:
+            rec.retries += 1
+            rec.errors[type(error).__name__] += 1
+
+    def failed(self, key: str, error: BaseException, retry_seconds: float):
+        rec = self.record(key)
+        with self._lock:
+            rec.calls += 1
+            rec.failures += 1
+            rec.retry_seconds += retry_seconds
+            rec.errors[type(error).__name__] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {key: rec.as_dict() for key, rec in self._records.items()}
+
+    def merge(self, snapshot: dict):
+        """Add counters from another process' `snapshot()` (e.g. an xdist worker)."""
+        with self._lock:
+            for key, data in snapshot.items():
+                rec = self._records.setdefault(key, RetryRecord())
+                rec.calls += data["calls"]
+                rec.retries += data["retries"]
+                rec.failures += data["failures"]
+                rec.retry_seconds += data["retry_seconds"]
+                rec.errors.update(data["errors"])
+                if rec.recovery_ewma is None:
+                    rec.recovery_ewma = data["recovery_ewma"]
+
+    def flaky(self) -> list:
+        """(key, record) pairs that needed at least one retry, most retried first."""
+        with self._lock:
+            items = [(k, r) for k, r in self._records.items() if r.retries or r.failures]
+        return sorted(items, key=lambda kv: (kv[1].retries, kv[1].retry_seconds), reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+
+
+telemetry = RetryTelemetry()
+
+
+class Retry:
+    def __init__(
+        self,
+        retry_on=TRANSIENT,
+        attempts: int = 4,
+        deadline: float = 3.0,
+        base_delay: float = 0.05,
+        max_delay: float = 1.0,
+        stats: RetryTelemetry = telemetry,
+    ):
+        self.retry_on = tuple(retry_on)
+        self.attempts = attempts
+        self.deadline = deadline
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = stats
+
+    def delay(self, key: str, attempt: int) -> float:
+        """Backoff before attempt `attempt + 1`: adaptive base, exponential growth, equal jitter."""
+        observed = self.stats.record(key).recovery_ewma
+        base = max(self.base_delay, observed / 2) if observed else self.base_delay
+        delay = min(self.max_delay, base * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def call(self, fn, *args, key: str = "anonymous", retry_on=None, **kwargs):
+        retry_on = tuple(retry_on) if retry_on is not None else self.retry_on
+        start = time.monotonic()
+        first_failure = None
+        attempt = 0
+        while True:
+            attempt += 1
+            attempt_start = time.monotonic()
+            try:
+                result = fn(*args, **kwargs)
+            except retry_on as e:
+                now = time.monotonic()
+                if first_failure is None:
+                    first_failure = now
+                pause = self.delay(key, attempt)
+                if attempt >= self.attempts or (now - start) + pause > self.deadline:
+                    self.stats.failed(key, e, now - start)
+                    raise
+                self.stats.retried(key, e)
+                time.sleep(pause)
+                continue
+
+            if first_failure is None:
+                self.stats.called(key)
+            else:
+                self.stats.called(
+                    key,
+                    retry_seconds=attempt_start - start,
+                    recovery=time.monotonic() - first_failure,
+                )
+            return result
@@ -0,0 +1,78 @@
+# src/utils/sharding.py
+"""
+Duration-aware sharding: split one run over N machines so that every shard takes about as long.
+
+- `DurationHistory` remembers the last measured duration of every test (JSON file)
+- `partition` hands tests out longest first, each to the shard with the least work so far
+  (LPT); tests without history are estimated from their module, else from the median
+- every machine computes the same split as long as it sees the same collection and history
+"""
+import heapq
+import json
+import os
+import statistics
+
+DURATIONS_PATH = ".qa-cache/durations.json"
+DEFAULT_SECONDS = 1.0
+
+
+def parse_shard(value: str):
+    """'2/4' -> (2, 4); shards are numbered from 1."""
+    try:
+        index, total = (int(x) for x in value.split("/"))
+    except ValueError:
+        raise ValueError(f"shard must look like i/N, got '{value}'") from None
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"shard {value}: need 1 <= i <= N")
+    return index, total
+
+
+def shard_name(index: int, total: int) -> str:
+    return f"shard-{index}-of-{total}"
+
+
+class DurationHistory:
+    """nodeid -> seconds of its last run (setup + call + teardown)."""
+
+    def __init__(self, path: str = DURATIONS_PATH):
+        self.path = path
+        self.durations = {}
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.durations = json.load(f)
+
+    def update(self, durations: dict):
+        self.durations.update({k: round(v, 3) for k, v in durations.items()})
+
+    def estimate(self, nodeids) -> dict:
+        """Known durations, else the mean of the same module, else the median of all, else 1s."""
+        known = self.durations
+        overall = statistics.median(known.values()) if known else DEFAULT_SECONDS
+        by_module = {}
+        for nodeid, seconds in known.items():
+            by_module.setdefault(nodeid.split("::")[0], []).append(seconds)
+        estimates = {}
+        for nodeid in nodeids:
+            if nodeid in known:
+                estimates[nodeid] = known[nodeid]
+            else:
+                module = by_module.get(nodeid.split("::")[0])
+                estimates[nodeid] = statistics.fmean(module) if module else overall
+        return estimates
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.durations, f, indent=1, sort_keys=True)
+
+
+def partition(nodeids, durations: dict, shards: int) -> list:
+    """`shards` lists of node ids with balanced total duration; each keeps collection order."""
+    order = {nodeid: i for i, nodeid in enumerate(nodeids)}
+    heap = [(0.0, i) for i in range(shards)]
+    buckets = [[] for _ in range(shards)]
+    for nodeid in sorted(nodeids, key=lambda n: (-durations.get(n, DEFAULT_SECONDS), order[n])):
+        load, i = heapq.heappop(heap)
+        buckets[i].append(nodeid)
+        heapq.heappush(heap, (load + durations.get(nodeid, DEFAULT_SECONDS), i))
+    return [sorted(bucket, key=order.__getitem__) for bucket in buckets]
@@ -0,0 +1,43 @@
+# src/utils/stats.py
+import math
+import statistics
+
+
+def percentile(values, q: float) -> float:
+    """Linear-interpolated percentile, q in [0, 100]."""
+    data = sorted(values)
+    if not data:
+        return float("nan")
+    pos = (len(data) - 1) * q / 100
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return data[lo] + (data[hi] - data[lo]) * (pos - lo)
+
+
+def summarize(values) -> dict:
+    data = list(values)
+    if not data:
+        return {"n": 0}
+    mean = statistics.fmean(data)
+    stdev = statistics.stdev(data) if len(data) > 1 else 0.0
+    return {
+        "n": len(data),
+        "min": min(data),
+        "median": statistics.median(data),
+        "p95": percentile(data, 95),
+        "max": max(data),
+        "mean": mean,
+        "stdev": stdev,
+        "cv": stdev / mean if mean else 0.0,
+    }
+
+
+def growth_exponents(sizes, values) -> list:
+    """
+    Local exponent k of `value ~ size**k` between consecutive points: ~1 linear, >1 super-linear.
+    """
+    points = [(n, v) for n, v in zip(sizes, values) if n > 0 and v > 0]
+    return [
+        math.log(v2 / v1) / math.log(n2 / n1)
+        for (n1, v1), (n2, v2) in zip(points, points[1:])
+        if n2 != n1
+    ]
@@ -0,0 +1,119 @@
+# src/utils/timeouts.py
+"""
+Learned wait timeouts per (persona, page, locator).
+
+- every successful `Wait` records how long the element took, keyed like
+  'performance_glitch_user|InventoryPage[css selector=.title]'
+- with enough samples the timeout becomes p99 × factor, clamped to [floor, ceiling]; keys
+  without history keep the default (10s)
+- a slow persona gets its own, longer samples, so its budget grows on its own; a locator that
+  normally shows up in 200ms fails after the floor instead of after 10s
+- off until `enabled`; src/plugins/adaptive_timeouts.py loads, merges (xdist) and saves it
+"""
+import json
+import os
+import threading
+import weakref
+
+TIMEOUTS_PATH = ".qa-cache/wait-durations.json"
+DEFAULT_PERSONA = "anonymous"
+MAX_SAMPLES = 100
+MIN_SAMPLES = 5
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile (no interpolation: p99 of 20 samples is the largest)."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class WaitHistory:
+    """Thread-safe key -> recent wait durations (seconds)."""
+
+    def __init__(self, path: str = TIMEOUTS_PATH, factor: float = 3.0, floor: float = 1.0,
+                 ceiling: float = 30.0, pct: float = 99, enabled: bool = False):
+        self.path = path
+        self.factor = factor
+        self.floor = floor
+        self.ceiling = ceiling
+        self.pct = pct
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._new = {}
+
+    def load(self):
+        if self.path and os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                with self._lock:
+                    self._samples = json.load(f)
+        return self
+
+    def observe(self, key: str, seconds: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            for store in (self._samples, self._new):
+                samples = store.setdefault(key, [])
+                samples.append(round(seconds, 3))
+                del samples[:-MAX_SAMPLES]
+
+    def timeout(self, key: str, default: float) -> float:
+        if not self.enabled:
+            return default
+        with self._lock:
+            samples = list(self._samples.get(key, ()))
+        if len(samples) < MIN_SAMPLES:
+            return default
+        return min(self.ceiling, max(self.floor, percentile(samples, self.pct) * self.factor))
+
+    def new_samples(self) -> dict:
+        """Samples recorded in this process (what an xdist worker hands to the controller)."""
+        with self._lock:
+            return {k: list(v) for k, v in self._new.items()}
+
+    def merge(self, samples: dict):
+        with self._lock:
+            for key, values in samples.items():
+                merged = self._samples.setdefault(key, [])
+                merged.extend(values)
+                del merged[:-MAX_SAMPLES]
+                self._new.setdefault(key, []).extend(values)
+
+    def learned(self, default: float) -> dict:
+        """key -> timeout for every key with enough samples."""
+        with self._lock:
+            keys = [k for k, v in self._samples.items() if len(v) >= MIN_SAMPLES]
+        return {k: round(self.timeout(k, default), 2) for k in keys}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            data = dict(self._samples)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._new.clear()
+
+
+wait_history = WaitHistory()
+# driver -> persona; ništa se ne postavlja na sam WebDriver, unos nestaje s driverom
+_personas = weakref.WeakKeyDictionary()
+
+
+def set_persona(driver, username: str):
+    """Record the user the driver's session logged in as (LoginPage.login)."""
+    _personas[driver] = username or DEFAULT_PERSONA
+
+
+def clear_persona(driver):
+    """Forget the persona, e.g. when the browser pool hands the session to the next test."""
+    _personas.pop(driver, None)
+
+
+def persona_of(driver) -> str:
+    return _personas.get(driver, DEFAULT_PERSONA)
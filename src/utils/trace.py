@@ -0,0 +1,154 @@
+# src/utils/trace.py
+"""
+Failure-only trace recorder.
+
+`TraceRecorder` is a command listener (`src/utils/commands.py`) that keeps the last N events of
+a session in an in-memory ring buffer: WebDriver commands, URLs, zlib-compressed DOM snapshots
+and browser console logs. Nothing touches the disk until `flush()` — the trace plugin calls it
+only for failing tests — which writes one compact zip:
+
+    timeline.json       events in order (snapshots referenced by file name)
+    dom/<seq>.html      DOM after navigations and clicks
+    failure.png         screenshot at the moment of failure (if the browser is still alive)
+
+`load_trace()` reads an archive back; `tools/trace_viewer.py` steps through it.
+"""
+import json
+import time
+import zipfile
+import zlib
+from collections import deque
+
+from selenium.webdriver.remote.command import Command
+
+from src.utils.commands import add_command_listener, remove_command_listener
+
+# poslije ovih komandi stranica se vjerovatno promijenila -> snimak DOM-a
+SNAPSHOT_AFTER = {
+    Command.GET,
+    Command.CLICK_ELEMENT,
+    Command.GO_BACK,
+    Command.GO_FORWARD,
+    Command.REFRESH,
+}
+# komande koje recorder sam šalje ili koje samo zagušuju timeline
+IGNORED = {Command.GET_PAGE_SOURCE, Command.GET_LOG, Command.SCREENSHOT, Command.GET_CURRENT_URL}
+_MAX_PARAM = 200
+
+
+def _short(params):
+    """Params without noise: atoms named by marker comment, elements by id, long strings cut."""
+    out = {}
+    for key, value in (params or {}).items():
+        if key == "sessionId" or (key == "value" and "text" in params):
+            continue
+        if key == "script" and value.startswith("/*"):
+            value = value[: value.index("*/") + 2]
+        elif isinstance(value, list):
+            value = [getattr(v, "id", v) for v in value]
+            value = json.dumps(value, default=str)[:_MAX_PARAM]
+        elif isinstance(value, dict):
+            value = json.dumps(value, default=str)[:_MAX_PARAM]
+        if isinstance(value, str) and len(value) > _MAX_PARAM:
+            value = value[:_MAX_PARAM] + "…"
+        out[key] = value
+    return out
+
+
+class TraceRecorder:
+    def __init__(self, driver, size: int = 200, snapshots: bool = True, console: bool = True):
+        self.driver = driver
+        self.events = deque(maxlen=size)
+        self.snapshots = snapshots
+        self.console = console
+        self.start = time.monotonic()
+        self._seq = 0
+        self._busy = False
+
+    # ----- recording -----
+    def attach(self):
+        add_command_listener(self.driver, self)
+        return self
+
+    def detach(self):
+        remove_command_listener(self.driver, self)
+
+    def _add(self, kind: str, **data):
+        self._seq += 1
+        self.events.append({"seq": self._seq, "t": round(time.monotonic() - self.start, 4),
+                            "kind": kind, **data})
+
+    def __call__(self, command, params, elapsed, error):
+        if self._busy or command in IGNORED:
+            return
+        self._add(
+            "command",
+            command=command,
+            params=_short(params),
+            ms=round(elapsed * 1000, 1),
+            error=(f"{type(error).__name__}: {str(error).splitlines()[0] if str(error) else ''}"
+                   if error else None),
+        )
+        if error is None and command in SNAPSHOT_AFTER:
+            self.capture()
+
+    def capture(self, screenshot: bool = False):
+        """URL, DOM snapshot and new console lines, read without re-entering the buffer."""
+        self._busy = True
+        try:
+            try:
+                self._add("url", url=self.driver.current_url)
+            except Exception:
+                return
+            if self.snapshots:
+                try:
+                    self._add("dom", html=zlib.compress(self.driver.page_source.encode("utf-8"), 6))
+                except Exception:
+                    pass
+            if self.console:
+                try:
+                    for entry in self.driver.get_log("browser"):
+                        self._add("console", level=entry.get("level"), message=entry.get("message"))
+                except Exception:
+                    # Firefox/geckodriver nema log endpoint
+                    self.console = False
+            if screenshot:
+                try:
+                    self._add("screenshot", png=self.driver.get_screenshot_as_png())
+                except Exception:
+                    pass
+        finally:
+            self._busy = False
+
+    def note(self, message: str, **data):
+        """Free-form marker in the timeline (test phase, assertion text, ...)."""
+        self._add("note", message=message, **data)
+
+    # ----- output -----
+    def flush(self, path: str, meta: dict = None) -> str:
+        timeline = []
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for event in self.events:
+                event = dict(event)
+                if event["kind"] == "dom":
+                    name = f"dom/{event['seq']:05d}.html"
+                    zf.writestr(name, zlib.decompress(event.pop("html")))
+                    event["file"] = name
+                elif event["kind"] == "screenshot":
+                    name = "failure.png"
+                    zf.writestr(name, event.pop("png"), compress_type=zipfile.ZIP_STORED)
+                    event["file"] = name
+                timeline.append(event)
+            zf.writestr("timeline.json",
+                        json.dumps({"meta": meta or {}, "events": timeline}, indent=1))
+        return path
+
+    def buffered_bytes(self) -> int:
+        return sum(len(e.get("html", b"")) + len(e.get("png", b"")) for e in self.events)
+
+
+def load_trace(path: str):
+    """(meta, events, archive) — `archive.read(event['file'])` gives a snapshot or screenshot."""
+    zf = zipfile.ZipFile(path)
+    data = json.loads(zf.read("timeline.json"))
+    return data["meta"], data["events"], zf
@@ -0,0 +1,255 @@
+# src/utils/transport.py
+"""
+WebDriver command transport with a persistent connection pool and per-command timing.
+
+    stats = install_transport(driver)                       # after the session exists
+    stats = install_transport(driver, unix_socket="/run/driver.sock")
+    print(stats.format_table())
+
+Selenium's `RemoteConnection` builds headers, trims the params for a debug log line and goes
+through a `PoolManager` (URL parsing + pool lookup) on every command, with one pooled
+connection and the global socket timeout. `install_transport` replaces `execute` of the
+driver's connection with:
+
+- one `HTTPConnectionPool` pinned to the driver's host (or a Unix-domain socket), keep-alive,
+  `pool_size` connections, separate connect/read timeouts, headers built once
+- the same request/response handling as selenium (error responses, PNG bodies, redirects)
+- a `CommandTiming` per command: encode (params -> JSON), connect (new connections only),
+  wait (request out -> response headers), read (body), decode (JSON -> dict)
+
+`wait` includes the driver's own work; the driver share is `wait` minus the round trip of a
+`/status` request measured when the transport is installed, the rest counts as transport.
+"""
+import json
+import socket
+import string
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urljoin, urlsplit
+
+from selenium.webdriver.remote import utils
+from selenium.webdriver.remote.errorhandler import ErrorCode
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from urllib3 import HTTPConnectionPool, Retry, Timeout
+from urllib3.connection import HTTPConnection
+
+CALIBRATION_PINGS = 5
+_local = threading.local()
+
+
+@dataclass
+class CommandTiming:
+    command: str
+    encode: float = 0.0
+    connect: float = 0.0
+    wait: float = 0.0
+    read: float = 0.0
+    decode: float = 0.0
+    new_connection: bool = False
+
+
+class TransportStats:
+    """Per-command sums of the timing breakdown; thread-safe, mergeable across workers."""
+
+    FIELDS = ("encode", "transport", "driver", "decode")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.commands = {}
+
+    def record(self, timing: CommandTiming, rtt: float):
+        driver = max(timing.wait - rtt, 0.0)
+        transport = timing.connect + timing.wait - driver + timing.read
+        with self._lock:
+            row = self.commands.setdefault(
+                timing.command, dict.fromkeys(("n", "new_connections") + self.FIELDS, 0))
+            row["n"] += 1
+            row["new_connections"] += timing.new_connection
+            row["encode"] += timing.encode
+            row["transport"] += transport
+            row["driver"] += driver
+            row["decode"] += timing.decode
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {name: dict(row) for name, row in self.commands.items()}
+
+    def merge(self, commands: dict):
+        with self._lock:
+            for name, row in commands.items():
+                mine = self.commands.setdefault(name, dict.fromkeys(row, 0))
+                for key, value in row.items():
+                    mine[key] = mine.get(key, 0) + value
+
+    def reset(self):
+        with self._lock:
+            self.commands.clear()
+
+    def totals(self) -> dict:
+        total = {}
+        for row in self.snapshot().values():
+            for key, value in row.items():
+                total[key] = total.get(key, 0) + value
+        return total
+
+    def format_table(self, limit: int = 15) -> list:
+        """Lines: per command count, new connections and mean ms per part, most total time first."""
+        rows = sorted(self.snapshot().items(), key=lambda kv: -sum(kv[1][f] for f in self.FIELDS))
+        lines = [f"{'command':<28}{'n':>7}{'new conn':>9}{'encode':>9}{'transport':>10}"
+                 f"{'driver':>9}{'decode':>9}"]
+        for name, row in rows[:limit]:
+            means = "".join(f"{row[f] / row['n'] * 1000:>{9 if f != 'transport' else 10}.3f}"
+                            for f in self.FIELDS)
+            lines.append(f"{name:<28}{row['n']:>7}{row['new_connections']:>9}{means}")
+        return lines
+
+
+transport_stats = TransportStats()
+
+
+class _TimedConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _local.connect = getattr(_local, "connect", 0.0) + time.perf_counter() - start
+
+
+class _UnixConnection(_TimedConnection):
+    def __init__(self, *args, socket_path: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+
+class _Pool(HTTPConnectionPool):
+    ConnectionCls = _TimedConnection
+
+
+class _UnixPool(HTTPConnectionPool):
+    ConnectionCls = _UnixConnection
+
+
+class PooledTransport:
+    """Keep-alive pool to one driver endpoint; `request` returns selenium's response dict."""
+
+    def __init__(self, url: str, pool_size: int = 4, connect_timeout: float = 5.0,
+                 read_timeout: float = 120.0, unix_socket: str = None):
+        parts = urlsplit(url)
+        self.url = url
+        self.prefix = parts.path.rstrip("/")
+        self.unix_socket = unix_socket
+        options = dict(maxsize=pool_size, block=False,
+                       timeout=Timeout(connect=connect_timeout, read=read_timeout),
+                       retries=Retry(total=1, connect=1, read=0, redirect=0, status=0))
+        if unix_socket:
+            self.pool = _UnixPool("localhost", socket_path=unix_socket, **options)
+        else:
+            self.pool = _Pool(parts.hostname, parts.port, **options)
+        self.headers = RemoteConnection.get_remote_connection_headers(parts, keep_alive=True)
+        self.rtt = 0.0
+
+    def request(self, method: str, path: str, body: str = None, timing: CommandTiming = None):
+        timing = timing or CommandTiming(path)
+        _local.connect = 0.0
+        start = time.perf_counter()
+        response = self.pool.urlopen(method, self.prefix + path, body=body, headers=self.headers,
+                                     preload_content=False, redirect=False)
+        headers_in = time.perf_counter()
+        try:
+            data = response.read()
+        finally:
+            response.release_conn()
+        done = time.perf_counter()
+        timing.connect = _local.connect
+        timing.new_connection = _local.connect > 0
+        timing.wait = headers_in - start - timing.connect
+        timing.read = done - headers_in
+        if 300 <= response.status < 304:
+            location = urljoin(self.url, response.headers.get("location", ""))
+            return self.request("GET", urlsplit(location).path[len(self.prefix):], None, timing)
+        start = time.perf_counter()
+        try:
+            return _decode(response.status, response.headers.get("Content-Type", ""), data)
+        finally:
+            timing.decode = time.perf_counter() - start
+
+    def calibrate(self, pings: int = CALIBRATION_PINGS) -> float:
+        """Round trip of the cheapest request the driver answers (GET /status), best of `pings`."""
+        waits = []
+        for _ in range(pings):
+            timing = CommandTiming("status")
+            try:
+                self.request("GET", "/status", timing=timing)
+            except Exception:
+                return self.rtt
+            waits.append(timing.wait)
+        self.rtt = min(waits)
+        return self.rtt
+
+    def close(self):
+        self.pool.close()
+
+
+def _decode(status: int, content_type: str, data: bytes) -> dict:
+    """What `RemoteConnection._request` returns for this response."""
+    text = data.decode("UTF-8")
+    if 399 < status <= 500:
+        return {"status": status, "value": text}
+    if any(part.strip().startswith("image/png") for part in content_type.split(";")):
+        return {"status": 0, "value": text}
+    try:
+        value = json.loads(text.strip())
+    except ValueError:
+        return {"status": ErrorCode.SUCCESS if 199 < status < 300 else ErrorCode.UNKNOWN_ERROR,
+                "value": text.strip()}
+    if "value" not in value:
+        value["value"] = None
+    return value
+
+
+def install_transport(driver, pool_size: int = 4, connect_timeout: float = 5.0,
+                      read_timeout: float = 120.0, unix_socket: str = None,
+                      stats: TransportStats = transport_stats) -> TransportStats:
+    """Send the commands of `driver` through a `PooledTransport`, timing them in `stats`."""
+    conn = driver.command_executor
+    transport = PooledTransport(conn._url, pool_size, connect_timeout, read_timeout, unix_socket)
+    transport.calibrate()
+    commands = conn._commands
+    original_close = conn.close
+
+    def execute(command, params):
+        timing = CommandTiming(command)
+        start = time.perf_counter()
+        method, template = commands[command]
+        path = string.Template(template).substitute(params)
+        if isinstance(params, dict):
+            for word in template.split("/"):
+                if word.startswith("$"):
+                    params.pop(word[1:], None)
+        body = utils.dump_json(params) if method in ("POST", "PUT") else None
+        timing.encode = time.perf_counter() - start
+        try:
+            return transport.request(method, path, body, timing)
+        finally:
+            stats.record(timing, transport.rtt)
+
+    def close():
+        transport.close()
+        original_close()
+
+    conn.execute = execute
+    conn.close = close
+    driver._transport = transport
+    return stats
@@ -0,0 +1,166 @@
+# src/utils/viewport.py
+"""
+Viewport emulation: switch device metrics in a running session and measure the layout.
+
+    report = sweep(driver, BREAKPOINTS, [".title", ".inventory_item", ".shopping_cart_link"])
+    assert not report.problems(), report.problems()
+
+`emulate` sets width, height, device pixel ratio and the mobile flag through CDP
+(`Emulation.setDeviceMetricsOverride`) on Chromium: no window resize, no window-manager round
+trip, the page and login stay as they are. Browsers without CDP fall back to
+`set_window_size` (DPR and mobile are then not emulated). `sweep` goes through the breakpoints
+with one emulation call and one measuring script per breakpoint, then resets the override
+(or the window size).
+"""
+from dataclasses import dataclass, field
+
+from selenium.common.exceptions import WebDriverException
+
+LAYOUT_JS = """/* layoutMetrics */
+var selectors = arguments[0];
+function displayed(el) {
+    for (var n = el; n && n.nodeType === 1; n = n.parentElement) {
+        var style = window.getComputedStyle(n);
+        if (style.display === 'none' || style.visibility === 'hidden'
+            || parseFloat(style.opacity) === 0) return false;
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+var elements = {};
+selectors.forEach(function (selector) {
+    var found = document.querySelectorAll(selector), visible = 0, right = 0, first = null;
+    for (var i = 0; i < found.length; i++) {
+        if (!displayed(found[i])) continue;
+        var r = found[i].getBoundingClientRect();
+        visible++;
+        right = Math.max(right, r.right + window.scrollX);
+        if (!first) {
+            first = {x: r.left + window.scrollX, y: r.top + window.scrollY,
+                     width: r.width, height: r.height};
+        }
+    }
+    elements[selector] = {count: found.length, visible: visible, right: right, first: first};
+});
+return {
+    width: window.innerWidth,
+    height: window.innerHeight,
+    dpr: window.devicePixelRatio,
+    scrollWidth: document.documentElement.scrollWidth,
+    elements: elements
+};"""
+
+
+@dataclass(frozen=True)
+class Viewport:
+    name: str
+    width: int
+    height: int
+    dpr: float = 1.0
+    mobile: bool = False
+
+
+BREAKPOINTS = [
+    Viewport("desktop", 1440, 900),
+    Viewport("laptop", 1280, 800),
+    Viewport("tablet", 768, 1024, dpr=2.0, mobile=True),
+    Viewport("large-mobile", 414, 896, dpr=3.0, mobile=True),
+    Viewport("mobile", 375, 667, dpr=2.0, mobile=True),
+    Viewport("small-mobile", 320, 568, dpr=2.0, mobile=True),
+]
+
+
+@dataclass
+class LayoutMetrics:
+    viewport: Viewport
+    width: int
+    height: int
+    dpr: float
+    scroll_width: int
+    elements: dict = field(default_factory=dict)
+
+    @property
+    def where(self) -> str:
+        return f"{self.viewport.name} {self.viewport.width}x{self.viewport.height}"
+
+    def visibility_problems(self) -> list:
+        """Elements missing or not displayed."""
+        found = []
+        for selector, m in self.elements.items():
+            if not m["count"]:
+                found.append(f"{self.where}: [visibility] {selector} not found")
+            elif m["visible"] < m["count"]:
+                hidden = m["count"] - m["visible"]
+                found.append(f"{self.where}: [visibility] {selector} {hidden} of "
+                             f"{m['count']} not visible")
+        return found
+
+    def overflow_problems(self) -> list:
+        """Displayed elements past the right edge, horizontal page scroll."""
+        found = []
+        for selector, m in self.elements.items():
+            if m["visible"] and m["right"] > self.width + 1:
+                found.append(f"{self.where}: [overflow] {selector} extends to {m['right']:.0f}px, "
+                             f"viewport is {self.width}px")
+        if self.scroll_width > self.width + 1:
+            found.append(f"{self.where}: [overflow] page scrolls horizontally "
+                         f"({self.scroll_width}px > {self.width}px)")
+        return found
+
+    def problems(self) -> list:
+        return self.visibility_problems() + self.overflow_problems()
+
+
+@dataclass
+class SweepReport:
+    results: list
+
+    def __getitem__(self, name: str) -> LayoutMetrics:
+        return next(r for r in self.results if r.viewport.name == name)
+
+    def problems(self) -> list:
+        return [p for r in self.results for p in r.problems()]
+
+
+def emulate(driver, viewport: Viewport):
+    """Apply `viewport` to the current session (CDP device metrics, else window size)."""
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": viewport.width, "height": viewport.height,
+                "deviceScaleFactor": viewport.dpr, "mobile": viewport.mobile,
+            })
+            return
+        except WebDriverException:
+            pass
+    driver.set_window_size(viewport.width, viewport.height)
+
+
+def clear_emulation(driver):
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+        except WebDriverException:
+            pass
+
+
+def measure(driver, viewport: Viewport, selectors) -> LayoutMetrics:
+    data = driver.execute_script(LAYOUT_JS, list(selectors))
+    return LayoutMetrics(viewport, data["width"], data["height"], data["dpr"], data["scrollWidth"],
+                         data["elements"])
+
+
+def sweep(driver, viewports, selectors) -> SweepReport:
+    """Emulate every viewport in turn and measure `selectors`; the override is cleared after."""
+    results = []
+    # bez CDP-a se mijenja prozor -> vrati ga na kraju
+    window = None if hasattr(driver, "execute_cdp_cmd") else driver.get_window_size()
+    try:
+        for viewport in viewports:
+            emulate(driver, viewport)
+            results.append(measure(driver, viewport, selectors))
+    finally:
+        clear_emulation(driver)
+        if window:
+            driver.set_window_size(window["width"], window["height"])
+    return SweepReport(results)
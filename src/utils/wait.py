@@ -1,19 +1,99 @@
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from src.utils.timeouts import WaitHistory, persona_of, wait_history
+
 DEFAULT_TIMEOUT = 10
 
+# URL + svi lokatori provjereni u jednom skriptu (jedan round trip po pokušaju)
+READY_JS = """/* pageReady */
+var urlPart = arguments[0], locators = arguments[1];
+if (urlPart && window.location.href.indexOf(urlPart) === -1) return false;
+for (var i = 0; i < locators.length; i++) {
+    var using = locators[i][0], value = locators[i][1];
+    var found = using === 'xpath'
+        ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE,
+                            null).singleNodeValue
+        : document.querySelector(value);
+    if (!found) return false;
+}
+return true;"""
+
+
+def browser_locator(by: str, value: str):
+    """(using, value) the way selenium sends it: ID/NAME/CLASS_NAME/TAG_NAME become CSS."""
+    if by == By.ID:
+        return "css selector", f'[id="{value}"]'
+    if by == By.NAME:
+        return "css selector", f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return "css selector", f".{value}"
+    if by == By.TAG_NAME:
+        return "css selector", value
+    return by, value
+
+
+def page_ready(url_part, locators):
+    """Condition: the URL contains `url_part` and every locator is present (checked in-page)."""
+    args = [list(browser_locator(*loc)) for loc in locators]
+
+    def condition(driver):
+        try:
+            return driver.execute_script(READY_JS, url_part, args)
+        except WebDriverException:
+            # stranica se upravo mijenja (document unloaded) -> sljedeći pokušaj
+            return False
+
+    return condition
+
 
 class Wait:
-    def __init__(self, driver, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(self, driver, timeout: int = DEFAULT_TIMEOUT, page: str = None,
+                 history: WaitHistory = wait_history):
         self.driver = driver
+        self.timeout = timeout
+        self.page = page
+        self.history = history
         self.wait = WebDriverWait(driver, timeout)
 
+    def key(self, what: str) -> str:
+        """History key, e.g. 'standard_user|InventoryPage[css selector=.title]'."""
+        return f"{persona_of(self.driver)}|{self.page or '-'}[{what}]"
+
+    def timeout_for(self, what: str) -> float:
+        return self.history.timeout(self.key(what), self.timeout)
+
+    def _until(self, condition, what: str):
+        # naučeni timeout po (persona, stranica, lokator); bez historije DEFAULT_TIMEOUT
+        if not self.history.enabled:
+            return self.wait.until(condition)
+        key = self.key(what)
+        start = time.monotonic()
+        timeout = self.history.timeout(key, self.timeout)
+        result = WebDriverWait(self.driver, timeout).until(condition)
+        self.history.observe(key, time.monotonic() - start)
+        return result
+
     def visible(self, locator):
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        return self._until(EC.visibility_of_element_located(locator), "%s=%s" % locator)
 
     def clickable(self, locator):
-        return self.wait.until(EC.element_to_be_clickable(locator))
+        return self._until(EC.element_to_be_clickable(locator), "%s=%s" % locator)
 
     def present(self, locator):
-        return self.wait.until(EC.presence_of_element_located(locator))
+        return self._until(EC.presence_of_element_located(locator), "%s=%s" % locator)
+
+    def all_present(self, locator):
+        # vraća čim postoji bar jedan -> isti ključ kao present
+        return self._until(EC.presence_of_all_elements_located(locator), "%s=%s" % locator)
+
+    def until(self, condition, what: str):
+        """Any condition, timed and keyed by `what` like the locator waits."""
+        return self._until(condition, what)
+
+    def ready(self, url_part, locators):
+        return self._until(page_ready(url_part, locators), "ready")
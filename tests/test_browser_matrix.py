@@ -0,0 +1,66 @@
+import json
+import os
+
+import pytest
+
+from src.plugins.browser_matrix import browser_of, group_of_worker, parse_browsers
+
+pytest_plugins = ["pytester"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestBrowserMatrix:
+    """Tests for --browsers parsing and worker/test grouping"""
+
+    def test_parse_browsers(self):
+        assert parse_browsers("chrome:3, firefox") == {"chrome": 3, "firefox": 1}
+        assert parse_browsers("") == {}
+        with pytest.raises(pytest.UsageError):
+            parse_browsers("chrome:0")
+
+    def test_browser_of_nodeid(self):
+        browsers = ["chrome", "firefox"]
+        login = "tests/test_login.py::TestLoginSuccess::test_login_success[firefox]"
+        sorting = ("tests/test_sort_and_filter.py::test_inventory_sorting"
+                   "[chrome-az-Sauce Labs Backpack]")
+        assert browser_of(login, browsers) == "firefox"
+        assert browser_of(sorting, browsers) == "chrome"
+        assert browser_of("tests/test_retry.py::TestRetry::test_x", browsers) is None
+
+    def test_workers_are_split_into_pools_in_order(self):
+        groups = {"chrome": 2, "firefox": 1}
+        pools = [group_of_worker(f"gw{i}", groups) for i in range(4)]
+        assert pools == ["chrome", "chrome", "firefox", None]
+
+    def test_each_worker_only_gets_its_own_browser(self, pytester, monkeypatch):
+        monkeypatch.setenv("PYTHONPATH", _ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+        pytester.makeconftest("""
+import pytest
+pytest_plugins = ["src.plugins.browser_matrix"]
+
+@pytest.fixture(scope="session")
+def browser_name(request):
+    return request.param
+""")
+        pytester.makepyfile(test_pools="""
+import json
+import os
+import pytest
+
+@pytest.mark.parametrize("n", range(6))
+def test_driver(browser_name, n):
+    with open(f"ran-{os.environ['PYTEST_XDIST_WORKER']}.jsonl", "a") as f:
+        f.write(json.dumps(browser_name) + "\\n")
+
+def test_no_browser():
+    pass
+""")
+        result = pytester.runpytest_subprocess("-n", "2", "--browsers", "chrome:1,firefox:1",
+                                               "-p", "no:cacheprovider")
+        result.assert_outcomes(passed=13)
+        ran = {}
+        for worker in ("gw0", "gw1"):
+            with open(pytester.path / f"ran-{worker}.jsonl") as f:
+                ran[worker] = [json.loads(line) for line in f]
+        assert ran == {"gw0": ["chrome"] * 6, "gw1": ["firefox"] * 6}
@@ -0,0 +1,146 @@
+import json
+import os
+import time
+
+import pytest
+
+from src.utils.budget import TestHistory, parse_budget, select_within
+
+pytest_plugins = ["pytester"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def history_with(tmp_path, runs):
+    """runs: nodeid -> list of (seconds, failed, edges), oldest first"""
+    history = TestHistory(str(tmp_path / "history.json"))
+    for nodeid, results in runs.items():
+        for seconds, failed, edges in results:
+            history.record(nodeid, seconds, failed, edges)
+    return history
+
+
+class TestTimeBudget:
+    """Tests for time-budgeted test selection"""
+
+    def test_parse_budget(self):
+        assert parse_budget("120s") == 120 and parse_budget("2m") == 120
+        assert parse_budget("1.5h") == 5400 and parse_budget("90") == 90
+        for bad in ("", "0s", "fast", "10d"):
+            with pytest.raises(ValueError):
+                parse_budget(bad)
+
+    def test_failure_rate_weighs_recent_runs(self, tmp_path):
+        history = history_with(tmp_path, {
+            "t.py::old_failure": [(1, True, ())] + [(1, False, ())] * 9,
+            "t.py::new_failure": [(1, False, ())] * 9 + [(1, True, ())],
+        })
+        assert history.failure_rate("t.py::new_failure") > history.failure_rate("t.py::old_failure")
+        assert history.failure_rate("t.py::never_ran") == 0.5
+
+    def test_fits_budget_and_runs_likely_failures_first(self, tmp_path):
+        edge = ("LoginPage", "login", "InventoryPage")
+        history = history_with(tmp_path, {
+            "t_login.py::stable": [(2, False, [edge])] * 5,
+            "t_login.py::flaky": [(2, False, [edge]), (2, True, [edge]), (2, True, [edge])],
+            "t_login.py::same_but_slow": [(8, False, [edge])] * 5,
+            "t_cart.py::cart": [(3, False, [("InventoryPage", "open_cart", "CartPage")])] * 5,
+        })
+        nodeids = list(history.tests) + ["t_new.py::brand_new"]
+        selection = select_within(nodeids, history, 7.5)
+
+        # novi test: median trajanja (2.5s), p(fail) 0.5; stable ne donosi ništa novo poslije flaky
+        assert selection.selected == ["t_login.py::flaky", "t_new.py::brand_new", "t_cart.py::cart"]
+        assert selection.selected_seconds == 7.5
+        assert selection.left_out == ["t_login.py::stable", "t_login.py::same_but_slow"]
+        assert (selection.covered, selection.features) == (5, 5)
+
+    def test_budget_for_everything_keeps_everything(self, tmp_path):
+        history = history_with(tmp_path, {f"t.py::t{i}": [(1, False, ())] for i in range(5)})
+        selection = select_within(list(history.tests), history, 100)
+        assert sorted(selection.selected) == sorted(history.tests) and selection.left_out == []
+
+    def test_plugin_records_history_then_selects(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeini("[pytest]\n")
+        pytester.makeconftest('pytest_plugins = ["src.plugins.time_budget"]\n')
+        pytester.makepyfile(test_lane="""
+import time
+
+def test_fails():
+    time.sleep(0.2)
+    assert False
+
+def test_slow():
+    time.sleep(1.0)
+
+def test_quick():
+    pass
+""")
+        result = pytester.runpytest("-p", "no:xdist", "--test-history", "history.json")
+        result.assert_outcomes(failed=1, passed=2)
+        history = json.loads((pytester.path / "history.json").read_text())
+        assert history["test_lane.py::test_fails"]["failures"] == 1
+        assert history["test_lane.py::test_slow"]["duration"] >= 1.0
+
+        result = pytester.runpytest("-p", "no:xdist", "-v", "--test-history", "history.json",
+                                    "--time-budget", "0.5s")
+        result.assert_outcomes(failed=1, passed=1, deselected=1)
+        result.stdout.fnmatch_lines([
+            "*test_fails FAILED*",
+            "*test_quick PASSED*",
+            "*time budget*",
+            "budget 0.5s: 2/3 tests selected*",
+            "left out (1, most likely to fail first):",
+            "  test_lane.py::test_slow  ~1.0s*",
+        ])
+
+    def test_bad_budget_is_a_usage_error(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeconftest('pytest_plugins = ["src.plugins.time_budget"]\n')
+        result = pytester.runpytest("-p", "no:xdist", "--time-budget", "soon")
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+
+    def test_gates_stay_ahead_of_their_dependents(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeini("[pytest]\nmarkers =\n    gate(name): gate\n    needs(*names): needs\n")
+        pytester.makeconftest('pytest_plugins = ["src.plugins.gates", "src.plugins.time_budget"]\n')
+        pytester.makepyfile(test_gated="""
+import pytest
+
+@pytest.mark.needs("login")
+def test_dep():
+    pass
+
+@pytest.mark.gate("login")
+def test_login():
+    pass
+""")
+        # test_dep pada češće -> budžet bi ga stavio prvog
+        (pytester.path / "history.json").write_text(json.dumps({
+            "test_gated.py::test_dep": {"duration": 0.1, "runs": 5, "failures": 4, "edges": []},
+            "test_gated.py::test_login": {"duration": 0.1, "runs": 5, "failures": 0, "edges": []},
+        }))
+        start = time.monotonic()
+        result = pytester.runpytest("-p", "no:xdist", "-v", "--test-history", "history.json",
+                                    "--time-budget", "10s", "--gate-timeout", "5")
+        assert time.monotonic() - start < 4
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(["*test_login PASSED*", "*test_dep PASSED*"])
+
+    def test_budget_applies_per_shard(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeini("[pytest]\n")
+        pytester.makeconftest(
+            'pytest_plugins = ["src.plugins.sharding", "src.plugins.time_budget"]\n')
+        pytester.makepyfile(test_many="\n".join(f"def test_{i}():\n    pass\n" for i in range(8)))
+        history = {f"test_many.py::test_{i}": {"duration": 10.0, "runs": 1, "failures": 0,
+                                               "edges": []}
+                   for i in range(8)}
+        (pytester.path / "history.json").write_text(json.dumps(history))
+        (pytester.path / "durations.json").write_text(json.dumps({n: 10.0 for n in history}))
+        result = pytester.runpytest("-p", "no:xdist", "--test-history", "history.json",
+                                    "--shard", "1/2", "--shard-durations", "durations.json",
+                                    "--time-budget", "20s")
+        result.assert_outcomes(passed=2, deselected=6)
+        result.stdout.fnmatch_lines(["budget 20s: 2/4 tests selected, estimated 20.0s*"])
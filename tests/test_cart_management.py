@@ -3,6 +3,8 @@ from src.pages.login_page import LoginPage
 from src.pages.inventory_page import InventoryPage
 from src.pages.cart_page import CartPage
 
+pytestmark = pytest.mark.needs("login")
+
 
 class TestCartOperations:
     """Tests for adding and removing items from cart"""
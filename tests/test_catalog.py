@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+
+from src.fake.driver import FakeDriver
+from src.pages.login_page import LoginPage
+from src.plugins.catalog_index import shared_index
+from src.utils.catalog import CatalogIndex, load_catalog, synthetic_catalog
+from src.utils.stats import growth_exponents
+
+
+class TestSyntheticCatalog:
+    """Tests for the large-catalog generator"""
+
+    def test_size_ids_and_unique_names(self):
+        catalog = synthetic_catalog(5_000)
+        assert [p["id"] for p in catalog] == list(range(5_000))
+        assert len({p["name"] for p in catalog}) == 5_000
+
+    def test_same_seed_same_catalog(self):
+        assert synthetic_catalog(100, seed=7) == synthetic_catalog(100, seed=7)
+        assert synthetic_catalog(100, seed=7) != synthetic_catalog(100, seed=8)
+
+    def test_shapes(self):
+        plain = synthetic_catalog(300)
+        shaped = synthetic_catalog(300, long_names=True, duplicate_prices=0.5, unicode=True)
+
+        def avg(catalog):
+            return sum(len(p["name"]) for p in catalog) / len(catalog)
+
+        assert avg(shaped) > 2 * avg(plain)
+        assert len({p["price"] for p in shaped}) < len({p["price"] for p in plain})
+        assert any(not p["name"].isascii() for p in shaped)
+        assert all(p["name"].isascii() for p in plain)
+
+
+class TestGrowthExponents:
+    """Tests for the scaling exponent used by the catalog benchmark"""
+
+    def test_linear_and_quadratic(self):
+        sizes = [100, 1_000, 10_000]
+        assert growth_exponents(sizes, [0.1, 1.0, 10.0]) == pytest.approx([1.0, 1.0])
+        assert growth_exponents(sizes, [0.01, 1.0, 100.0]) == pytest.approx([2.0, 2.0])
+
+
+class TestCatalogIndex:
+    """Tests for the run-wide catalog index"""
+
+    def test_lookups_totals_and_sort_orders(self):
+        index = CatalogIndex(load_catalog(), source="file")
+        assert len(index) == 6 and "Sauce Labs Onesie" in index
+        assert index.price("Sauce Labs Backpack") == 29.99
+        assert index.total(["Sauce Labs Backpack", "Sauce Labs Bike Light"]) == 39.98
+        assert index.add_to_cart_id("Sauce Labs Onesie") == "add-to-cart-sauce-labs-onesie"
+        assert index.sorted_names("lohi")[0] == "Sauce Labs Onesie"
+        assert index.sorted_names("za")[0] == "Test.allTheThings() T-Shirt (Red)"
+        with pytest.raises(KeyError, match="not in the catalog"):
+            index.price("Sauce Labs Toaster")
+
+    def test_matches_what_the_listing_shows(self, fake_driver):
+        login = LoginPage(fake_driver, fake_driver.shop.url).open_login()
+        inventory = login.sign_in("standard_user", "secret_sauce")
+        index = CatalogIndex(inventory.products(), source="ui")
+        from_file = CatalogIndex(load_catalog())
+        assert sorted(index.names) == sorted(from_file.names)
+        assert all(index.get(n) == from_file.get(n) for n in index.names)
+        for mode in ("az", "za", "lohi", "hilo"):
+            assert inventory.sort(mode).item_names() == index.sorted_names(mode)
+
+    def test_shared_index_is_built_once(self, tmp_path):
+        builds = []
+
+        def build():
+            builds.append(1)
+            return CatalogIndex(synthetic_catalog(50), source="synthetic")
+
+        results = []
+
+        def worker():
+            results.append(shared_index(str(tmp_path), build))
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(builds) == 1
+        assert len(results) == 6 and all(r.names == results[0].names for r in results)
+        assert not (tmp_path / "catalog-index.json.lock").exists()
+
+    def test_page_objects_use_the_index(self):
+        driver = FakeDriver()
+        index = CatalogIndex(load_catalog(), source="file")
+        login = LoginPage(driver, driver.shop.url).open_login()
+        inventory = login.sign_in("standard_user", "secret_sauce")
+        inventory.catalog = index
+        assert inventory.expected_names("hilo") == index.sorted_names("hilo")
+        driver.quit()
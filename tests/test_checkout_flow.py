@@ -6,21 +6,19 @@ from src.pages.checkout_info_page import CheckoutInfoPage
 from src.pages.checkout_overview_page import CheckoutOverviewPage
 from src.pages.checkout_complete_page import CheckoutCompletePage
 
+pytestmark = pytest.mark.needs("login")
+
 
 @pytest.mark.regression
+@pytest.mark.gate("checkout")
 def test_full_checkout_flow(driver, base_url, test_data):
-    LoginPage(driver, base_url).open_login().login(
+    inv = LoginPage(driver, base_url).open_login().sign_in(
         test_data["valid"]["username"], test_data["valid"]["password"]
     )
-    inv = InventoryPage(driver, base_url)
     for name in test_data["products"][:2]:
         assert inv.add_to_cart(name)
-    inv.open_cart()
-    CartPage(driver, base_url).checkout()
     info = test_data["checkout_info"]
-    CheckoutInfoPage(driver, base_url).fill(info["first"], info["last"], info["zip"])
-    CheckoutOverviewPage(driver, base_url).finish()
-    complete = CheckoutCompletePage(driver, base_url)
+    complete = inv.open_cart().checkout().fill(info["first"], info["last"], info["zip"]).finish()
     assert "Thank you for your order" in complete.success_text()
 
 
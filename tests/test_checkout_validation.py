@@ -6,6 +6,8 @@ from src.pages.checkout_info_page import CheckoutInfoPage
 from src.pages.checkout_overview_page import CheckoutOverviewPage
 from src.pages.checkout_complete_page import CheckoutCompletePage
 
+pytestmark = pytest.mark.needs("login", "checkout")
+
 
 class TestCheckoutValidation:
     """Tests for checkout form validation and error handling"""
@@ -107,7 +109,8 @@ class TestCheckoutValidation:
         CartPage(driver, base_url).checkout()
         
         info_page = CheckoutInfoPage(driver, base_url)
-        info_page.fill("Jean-Pierre", "O'Brien", "12345-6789")
+        # provjerava tipkanje, ne fast fill
+        info_page.fill("Jean-Pierre", "O'Brien", "12345-6789", fast=False)
         
         # Should proceed to next step
         assert "checkout-step-two" in driver.current_url.lower()
@@ -125,7 +128,8 @@ class TestCheckoutValidation:
         CartPage(driver, base_url).checkout()
         
         info_page = CheckoutInfoPage(driver, base_url)
-        info_page.fill("John123", "Doe456", "12345")
+        # provjerava tipkanje, ne fast fill
+        info_page.fill("John123", "Doe456", "12345", fast=False)
         
         assert "checkout-step-two" in driver.current_url.lower()
 
@@ -134,7 +138,7 @@ class TestCheckoutOverview:
     """Tests for checkout overview page"""
 
     @pytest.mark.regression
-    def test_overview_displays_item_summary(self, driver, base_url, test_data):
+    def test_overview_displays_item_summary(self, driver, base_url, test_data, catalog):
         """Test that overview page shows added items"""
         LoginPage(driver, base_url).open_login().login(
             test_data["valid"]["username"], test_data["valid"]["password"]
@@ -150,10 +154,10 @@ class TestCheckoutOverview:
         CheckoutInfoPage(driver, base_url).fill(info["first"], info["last"], info["zip"])
         
         overview = CheckoutOverviewPage(driver, base_url)
-        overview_items = driver.find_elements(overview._overview_item if hasattr(overview, '_overview_item') else None)
         
         # Document the behavior
         assert "checkout-step-two" in driver.current_url.lower()
+        assert overview.item_total() == catalog.total([product])
 
     @pytest.mark.regression
     def test_overview_finish_button_visible(self, driver, base_url, test_data):
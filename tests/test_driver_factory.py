@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from src.utils.driver_factory import FAST_CHROME_ARGS, chrome_options, firefox_options, tmpfs_dir
+from src.utils.memory import tree_rss_mb
+
+
+class TestLaunchProfiles:
+    """Tests for browser launch profiles (options only, no browser started)"""
+
+    def test_default_profile_is_unchanged(self):
+        opts = chrome_options("default", window_size=(800, 600))
+        assert opts.arguments == ["--headless=new", "--window-size=800,600", "--disable-gpu"]
+        # jedina dodana capability: browser console log za failure trace
+        assert opts.to_capabilities() == {
+            "browserName": "chrome",
+            "pageLoadStrategy": "normal",
+            "goog:loggingPrefs": {"browser": "ALL"},
+            "goog:chromeOptions": {"extensions": [], "args": opts.arguments},
+        }
+
+    def test_fast_profile_adds_flags_and_user_data_dir(self):
+        args = chrome_options("fast", user_data_dir="/dev/shm/x").arguments
+        assert set(FAST_CHROME_ARGS) <= set(args)
+        assert "--user-data-dir=/dev/shm/x" in args
+
+    def test_shell_profile_uses_headless_shell_binary(self, monkeypatch):
+        monkeypatch.setenv("CHROME_HEADLESS_SHELL", "/opt/chs/chrome-headless-shell")
+        opts = chrome_options("shell")
+        assert opts.binary_location == "/opt/chs/chrome-headless-shell"
+        assert "--headless=new" not in opts.arguments
+        with pytest.warns(UserWarning, match="--headed is ignored"):
+            chrome_options("shell", headed=True)
+        monkeypatch.delenv("CHROME_HEADLESS_SHELL")
+        with pytest.raises(ValueError):
+            chrome_options("shell")
+
+    def test_fast_firefox_profile(self):
+        opts = firefox_options("fast", profile_dir="/tmp/ff")
+        assert opts.preferences["app.update.auto"] is False
+        assert opts.arguments[-2:] == ["-profile", "/tmp/ff"]
+
+    def test_tmpfs_dir(self):
+        path = tmpfs_dir("qa-test-")
+        try:
+            assert os.path.isdir(path)
+            if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+                assert path.startswith("/dev/shm/")
+        finally:
+            os.rmdir(path)
+
+    @pytest.mark.skipif(not os.path.isdir("/proc"), reason="needs /proc")
+    def test_tree_rss_of_own_process(self):
+        assert tree_rss_mb(os.getpid()) > 1
@@ -0,0 +1,56 @@
+import pytest
+
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.utils.commands import add_command_listener
+from src.utils.element_checks import Check, check_elements, contains, matches, nonempty, positive
+
+
+@pytest.fixture
+def inventory(fake_driver):
+    LoginPage(fake_driver, fake_driver.shop.url).open_login().login("standard_user", "secret_sauce")
+    return InventoryPage(fake_driver, fake_driver.shop.url)
+
+
+class TestElementChecks:
+    """Tests for bulk in-browser element assertions (fake driver)"""
+
+    def test_whole_listing_in_one_round_trip(self, inventory, fake_driver):
+        inventory.wait_ready()
+        commands = []
+        add_command_listener(fake_driver,
+                             lambda command, params, elapsed, error: commands.append(command))
+        report = inventory.check_cards([
+            Check(".inventory_item_name", "text", nonempty),
+            Check(".inventory_item_price", "text", matches(r"^\$\d+\.\d{2}$")),
+            Check("img", "naturalHeight", positive),
+            Check("img", "attr:alt", nonempty),
+        ])
+        report.assert_ok()
+        assert report.count == 6
+        assert len(commands) == 2  # presence wait + jedan skript
+        assert report.values(".inventory_item_name", "text")[0] == "Sauce Labs Backpack"
+
+    def test_failures_name_element_value_and_predicate(self, inventory):
+        report = inventory.check_cards([
+            Check(".inventory_item_price", "text", contains("€")),
+            Check(".no-such-thing", "displayed"),
+            Check(".no-such-thing", "displayed", optional=True),
+        ])
+        assert not report.ok and len(report.failures) == 12
+        with pytest.raises(AssertionError) as e:
+            report.assert_ok()
+        message = str(e.value)
+        assert "12 element check(s) failed" in message
+        assert (".inventory_item[0] .inventory_item_price text = '$29.99': "
+                "expected contains '€'") in message
+        assert ".inventory_item[5] .no-such-thing: element not found" in message
+
+    def test_page_level_checks_and_predicate_errors(self, inventory, fake_driver):
+        report = check_elements(fake_driver, [
+            Check(".title", "text", contains("Products")),
+            Check(".title", "text", positive),
+        ])
+        assert report.count == 1
+        assert [r.passed for r in report.results] == [True, False]
+        assert report.failures[0].error.startswith("ValueError")
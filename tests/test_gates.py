@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SUITE = """
+import pytest
+
+LOGIN_OK = {ok}
+
+def test_cart():
+    pass
+
+pytestmark = pytest.mark.needs("login")
+
+@pytest.mark.gate("login")
+def test_login():
+    assert LOGIN_OK, "login button missing"
+
+def test_checkout():
+    pass
+"""
+
+
+@pytest.fixture
+def suite(pytester):
+    pytester.syspathinsert(_ROOT)
+    pytester.makeini("[pytest]\nmarkers =\n    gate(name): gate\n    needs(*names): needs\n")
+    pytester.makeconftest('pytest_plugins = ["src.plugins.gates"]\n')
+
+    def make(ok: bool):
+        pytester.makepyfile(test_shop=SUITE.format(ok=ok))
+        return pytester
+
+    return make
+
+
+class TestGates:
+    """Tests for gate/needs fail-fast markers"""
+
+    def test_gate_runs_first_and_failure_skips_dependents(self, suite):
+        result = suite(False).runpytest("-p", "no:xdist", "-v", "-rs")
+        result.assert_outcomes(failed=1, skipped=2)
+        result.stdout.fnmatch_lines([
+            "*test_login FAILED*",
+            "*gate 'login' failed: test_shop.py::test_login (AssertionError: login button missing*",
+        ])
+
+    def test_passing_gate_lets_dependents_run(self, suite):
+        suite(True).runpytest("-p", "no:xdist").assert_outcomes(passed=3)
+
+    def test_no_gates(self, suite):
+        suite(False).runpytest("-p", "no:xdist", "--no-gates").assert_outcomes(passed=2, failed=1)
+
+    def test_gate_result_reaches_other_workers(self, suite, monkeypatch):
+        monkeypatch.setenv("PYTHONPATH", _ROOT)
+        result = suite(False).runpytest_subprocess("-n", "2", "-rs")
+        result.assert_outcomes(failed=1, skipped=2)
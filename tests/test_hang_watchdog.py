@@ -0,0 +1,135 @@
+import os
+import subprocess
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.hang_watchdog import HangWatchdog, TestTimeout
+
+pytest_plugins = ["pytester"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def watchdog():
+    dog = HangWatchdog(poll=0.05).start()
+    yield dog
+    dog.stop()
+
+
+class TestHangWatchdog:
+    """Tests for the per-test wall-clock watchdog"""
+
+    def test_kills_driver_tree_and_interrupts_the_test(self, watchdog):
+        # "chromedriver" sa djetetom ("browser")
+        proc = subprocess.Popen(["sh", "-c", "sleep 60 & wait"])
+        driver = SimpleNamespace(service=SimpleNamespace(process=proc))
+        watchdog.arm("test_stuck", 0.3, lambda: [driver])
+        start = time.monotonic()
+        with pytest.raises(TestTimeout, match="test_stuck exceeded 0.3s"):
+            time.sleep(10)
+        deadline = watchdog.disarm()
+        assert time.monotonic() - start < 3
+        assert proc.wait(timeout=5) == -9
+        assert proc.pid in deadline.killed and len(deadline.killed) >= 2
+        assert "time.sleep(10)" in deadline.stack
+        assert driver._hung.startswith("killed by watchdog")
+
+    def test_disarmed_in_time_does_nothing(self, watchdog):
+        watchdog.arm("test_fast", 0.2)
+        deadline = watchdog.disarm()
+        time.sleep(0.4)
+        assert not deadline.fired
+
+
+class TestHangWatchdogPlugin:
+    """The plugin fails a hung test as TIMEOUT and the run goes on"""
+
+    def test_timeout_then_next_test_runs(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeini("[pytest]\nmarkers =\n    time_limit(seconds): limit\n    slow: slow\n")
+        pytester.makeconftest('pytest_plugins = ["src.plugins.hang_watchdog"]\n')
+        pytester.makepyfile(test_hang="""
+import time
+import pytest
+
+@pytest.mark.time_limit(0.5)
+def test_hangs():
+    while True:
+        time.sleep(0.1)
+
+@pytest.mark.slow
+def test_slow_marker():
+    time.sleep(5)
+
+def test_after():
+    pass
+""")
+        start = time.monotonic()
+        result = pytester.runpytest("-p", "no:xdist", "-v", "--marker-timeout", "slow=0.5")
+        assert time.monotonic() - start < 4
+        result.assert_outcomes(failed=2, passed=1)
+        result.stdout.fnmatch_lines([
+            "*test_hangs TIMEOUT*",
+            "*test_slow_marker TIMEOUT*",
+            "*test_after PASSED*",
+            "*TIMEOUT: exceeded 0.5s (time_limit marker) during call*",
+            "*watchdog timeouts*",
+            "*test_slow_marker: killed after 0.5s in call (--marker-timeout slow=0.5)*",
+        ])
+
+    def test_bad_marker_timeout_is_a_usage_error(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeconftest('pytest_plugins = ["src.plugins.hang_watchdog"]\n')
+        result = pytester.runpytest("-p", "no:xdist", "--marker-timeout", "smoke")
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+
+    def test_timeout_during_teardown(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeini("[pytest]\nmarkers =\n    time_limit(seconds): limit\n")
+        # spor reporting hook: limit istekne između faza, ne smije biti INTERNALERROR
+        pytester.makeconftest("""
+import time
+pytest_plugins = ["src.plugins.hang_watchdog"]
+
+def pytest_runtest_logreport(report):
+    if report.when == "call" and "slow_report" in report.nodeid:
+        time.sleep(0.8)
+""")
+        pytester.makepyfile(test_hang="""
+import time
+import pytest
+
+@pytest.fixture
+def stuck_teardown():
+    yield
+    while True:
+        time.sleep(0.1)
+
+@pytest.fixture
+def slow_teardown():
+    yield
+    time.sleep(1.5)
+
+@pytest.mark.time_limit(0.5)
+def test_teardown_hangs(stuck_teardown):
+    pass
+
+@pytest.mark.time_limit(0.5)
+def test_slow_report(slow_teardown):
+    pass
+
+def test_after():
+    pass
+""")
+        result = pytester.runpytest("-p", "no:xdist", "-v")
+        assert "INTERNALERROR" not in result.stdout.str()
+        result.assert_outcomes(passed=3, failed=2)
+        result.stdout.fnmatch_lines([
+            "*test_after PASSED*",
+            "*TIMEOUT: exceeded 0.5s (time_limit marker) during teardown*",
+            "*test_teardown_hangs: killed after 0.5s in teardown (time_limit marker)*",
+            "*test_slow_report: killed after 0.5s in teardown (time_limit marker)*",
+        ])
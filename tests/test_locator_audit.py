@@ -0,0 +1,30 @@
+from selenium.webdriver.common.by import By
+
+from tools.locator_audit import PAGES, collect_locators, rank, to_browser
+
+
+class TestLocatorAudit:
+    """Tests for the locator cost auditor (browser-free parts)"""
+
+    def test_collects_locators_of_every_page_class(self):
+        locators = collect_locators()
+        pages = {cls for cls, _, _, _ in locators}
+        assert pages == set(PAGES)
+        assert ("LoginPage", "_user", By.ID, "user-name") in locators
+        assert any(attr == "_card" and "%s" in value for _, attr, _, value in locators)
+
+    def test_to_browser_matches_selenium_translation(self):
+        assert to_browser(By.ID, "x") == ("css selector", '[id="x"]')
+        assert to_browser(By.CLASS_NAME, "x") == ("css selector", ".x")
+        assert to_browser(By.XPATH, "//a") == (By.XPATH, "//a")
+
+    def test_rank_orders_by_cost_and_keeps_only_cheaper_alternatives(self):
+        rows = rank([
+            {"locator": "A._a", "cost_us": 5.0,
+             "alternatives": [{"selector": "#a", "cost_us": 8.0}]},
+            {"locator": "B._b", "cost_us": 90.0,
+             "alternatives": [{"selector": ".b", "cost_us": 3.0}]},
+        ])
+        assert [r["locator"] for r in rows] == ["B._b", "A._a"]
+        assert rows[0]["best"]["selector"] == ".b" and rows[0]["speedup"] == 30.0
+        assert rows[1]["best"] is None
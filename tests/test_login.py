@@ -7,6 +7,7 @@ class TestLoginSuccess:
     """Tests for successful login scenarios"""
 
     @pytest.mark.smoke
+    @pytest.mark.gate("login")
     def test_login_success(self, driver, base_url, test_data):
         """Test successful login with valid credentials"""
         LoginPage(driver, base_url).open_login().login(
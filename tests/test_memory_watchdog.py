@@ -0,0 +1,65 @@
+import pytest
+
+import src.utils.memory as memory
+from src.fake.driver import FakeDriver
+from src.plugins.memory_watchdog import BrowserPool
+from src.utils.memory import MemoryWatchdog, summarize_timeline
+from src.utils.timeouts import DEFAULT_PERSONA, persona_of, set_persona
+
+
+@pytest.fixture
+def rss(monkeypatch):
+    """Driver RSS the watchdog will read, settable per test."""
+    value = {"mb": 300.0}
+    monkeypatch.setattr(memory, "driver_rss_mb", lambda driver: value["mb"])
+    return value
+
+
+class TestMemoryWatchdog:
+    """Tests for session reuse and memory-based recycling (fake driver)"""
+
+    def test_reused_session_is_reset_between_tests(self, rss):
+        pool = BrowserPool(MemoryWatchdog(max_rss_mb=1000), reuse=True)
+        first = pool.acquire("chrome", FakeDriver)
+        first.get(first.shop.url + "/")
+        first.add_cookie({"name": "session-username", "value": "standard_user"})
+        set_persona(first, "standard_user")
+        pool.release(first, "chrome", "t::one")
+        assert pool.acquire("chrome", FakeDriver) is first
+        assert first.get_cookies() == []
+        assert persona_of(first) == DEFAULT_PERSONA
+        pool.close()
+
+    def test_session_over_threshold_is_recycled(self, rss):
+        watchdog = MemoryWatchdog(max_rss_mb=1000)
+        pool = BrowserPool(watchdog, reuse=True)
+        first = pool.acquire("chrome", FakeDriver)
+        rss["mb"] = 1400.0
+        pool.release(first, "chrome", "t::leaky")
+        assert pool.acquire("chrome", FakeDriver) is not first
+        assert watchdog.timeline[-1]["recycled"] == "rss 1400MB > 1000MB"
+        assert watchdog.timeline[-1]["test"] == "t::leaky"
+        pool.close()
+
+    def test_session_killed_by_hang_watchdog_is_replaced(self, rss):
+        pool = BrowserPool(MemoryWatchdog(), reuse=True)
+        first = pool.acquire("chrome", FakeDriver)
+        first._hung = "killed by watchdog after 30s"
+        pool.release(first, "chrome", "t::hung")
+        assert pool.acquire("chrome", FakeDriver) is not first
+        pool.close()
+
+    def test_without_reuse_every_test_gets_a_new_session(self, rss):
+        pool = BrowserPool(MemoryWatchdog(), reuse=False)
+        first = pool.acquire("chrome", FakeDriver)
+        pool.release(first, "chrome", "t::one")
+        assert pool.acquire("chrome", FakeDriver) is not first
+        assert len(pool.watchdog.timeline) == 1
+
+    def test_timeline_summary(self):
+        timeline = [{"rss_mb": 300.0, "heap_mb": None, "recycled": None},
+                    {"rss_mb": 900.0, "heap_mb": 40.0, "recycled": "rss"},
+                    {"rss_mb": 310.0, "heap_mb": 12.0, "recycled": None}]
+        assert summarize_timeline(timeline) == {"samples": 3, "recycles": 1, "peak_rss_mb": 900.0,
+                                                "first_rss_mb": 300.0, "last_rss_mb": 310.0,
+                                                "peak_heap_mb": 40.0}
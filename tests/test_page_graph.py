@@ -0,0 +1,26 @@
+from src.utils.page_graph import TransitionLog, reachable, transition_graph, unexercised
+
+
+class TestPageGraph:
+    """Tests for the declared page-transition graph"""
+
+    def test_graph_has_the_checkout_path(self):
+        edges = transition_graph()
+        assert ("LoginPage", "sign_in", "InventoryPage") in edges
+        assert ("InventoryPage", "open_cart", "CartPage") in edges
+        assert ("CartPage", "checkout", "CheckoutInfoPage") in edges
+        assert ("CheckoutInfoPage", "fill", "CheckoutOverviewPage") in edges
+        assert ("CheckoutOverviewPage", "finish", "CheckoutCompletePage") in edges
+
+    def test_every_declared_transition_is_reachable_from_login(self):
+        edges = transition_graph()
+        assert reachable(edges) == edges
+
+    def test_reachable_and_unexercised(self):
+        edges = [("A", "go", "B"), ("B", "go", "C"), ("X", "go", "A")]
+        assert reachable(edges, "A") == [("A", "go", "B"), ("B", "go", "C")]
+        log = TransitionLog()
+        log.record("A", "go", "B")
+        log.merge([["B", "go", "C"]])
+        assert unexercised(reachable(edges, "A"), log.snapshot()) == []
+        assert unexercised(edges, [("A", "go", "B")]) == [("B", "go", "C"), ("X", "go", "A")]
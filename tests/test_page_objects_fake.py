@@ -0,0 +1,124 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+
+from src.fake.driver import FakeDriver
+from src.pages.cart_page import CartPage
+from src.pages.checkout_complete_page import CheckoutCompletePage
+from src.pages.checkout_info_page import CheckoutInfoPage
+from src.pages.checkout_overview_page import CheckoutOverviewPage
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.utils.commands import add_command_listener
+
+
+def logged_in(driver):
+    LoginPage(driver, driver.shop.url).open_login().login("standard_user", "secret_sauce")
+    return InventoryPage(driver, driver.shop.url)
+
+
+class TestFakeDriverPageObjects:
+    """Page objects against the in-memory fake driver (no browser)"""
+
+    def test_login_lands_on_inventory(self, fake_driver):
+        assert logged_in(fake_driver).is_loaded()
+        assert fake_driver.current_url.endswith("/inventory.html")
+        assert fake_driver.shop.user == "standard_user"
+
+    def test_login_errors(self, fake_driver):
+        page = LoginPage(fake_driver, fake_driver.shop.url).open_login()
+        assert "locked out" in page.login("locked_out_user", "secret_sauce").error_text()
+        assert "Username is required" in page.login("", "x").error_text()
+
+    def test_sort_orders_listing(self, fake_driver):
+        inventory = logged_in(fake_driver)
+        names = inventory.item_names()
+        assert names == sorted(names)
+        assert inventory.sort("za").item_names() == sorted(names, reverse=True)
+
+    def test_add_to_cart_updates_badge_and_storage(self, fake_driver):
+        inventory = logged_in(fake_driver)
+        assert inventory.cart_badge_count() == 0
+        assert inventory.add_to_cart("Sauce Labs Backpack")
+        assert inventory.add_to_cart("Sauce Labs Onesie")
+        assert inventory.cart_badge_count() == 2
+        assert len(fake_driver.shop.cart) == 2
+
+    def test_add_to_cart_falls_back_to_detail_page(self):
+        driver = FakeDriver(listing_buttons=False)
+        inventory = logged_in(driver)
+        assert inventory.add_to_cart("Sauce Labs Bike Light")
+        assert driver.current_url.endswith("/inventory.html")
+        assert inventory.cart_badge_count() == 1
+
+    def test_full_checkout(self, fake_driver):
+        inventory = logged_in(fake_driver)
+        inventory.add_to_cart("Sauce Labs Backpack")
+        cart = CartPage(fake_driver, fake_driver.shop.url)
+        inventory.open_cart()
+        assert len(cart.items()) == 1
+        cart.checkout()
+        CheckoutInfoPage(fake_driver, fake_driver.shop.url).fill("Ema", "Test", "71000")
+        CheckoutOverviewPage(fake_driver, fake_driver.shop.url).finish()
+        assert "Thank you" in CheckoutCompletePage(fake_driver, fake_driver.shop.url).success_text()
+        assert fake_driver.shop.cart == []
+
+    def test_transitions_return_the_next_page(self, fake_driver):
+        login = LoginPage(fake_driver, fake_driver.shop.url).open_login()
+        inventory = login.sign_in("standard_user", "secret_sauce")
+        assert isinstance(inventory, InventoryPage)
+        inventory.add_to_cart("Sauce Labs Backpack")
+        cart = inventory.open_cart()
+        assert isinstance(cart, CartPage) and len(cart.items()) == 1
+        complete = cart.checkout().fill("Ema", "Test", "71000").finish()
+        assert isinstance(complete, CheckoutCompletePage)
+        assert "Thank you" in complete.success_text()
+
+    def test_transition_waits_with_one_script_call(self, fake_driver):
+        cart = logged_in(fake_driver).open_cart()
+        commands = []
+        add_command_listener(fake_driver,
+                             lambda command, params, elapsed, error: commands.append(command))
+        cart.checkout()
+        # klik (find + isDisplayed/isEnabled + click), pa jedan readiness skript;
+        # nema find-a poslije klika
+        after_click = commands[commands.index(Command.CLICK_ELEMENT) + 1:]
+        assert after_click == [Command.W3C_EXECUTE_SCRIPT]
+
+    def test_fast_fill_submits_in_one_script_call(self, fake_driver):
+        info = logged_in(fake_driver).open_cart().checkout()
+        commands = []
+        add_command_listener(fake_driver,
+                             lambda command, params, elapsed, error: commands.append(command))
+        overview = info.fill("Ema", "Test", "71000", fast=True)
+        assert commands == [Command.W3C_EXECUTE_SCRIPT_ASYNC]
+        assert isinstance(overview, CheckoutOverviewPage)
+        assert fake_driver.current_url.endswith("/checkout-step-two.html")
+
+    def test_fast_fill_reports_the_form_error(self, fake_driver):
+        info = logged_in(fake_driver).open_cart().checkout()
+        with pytest.raises(TimeoutException, match="Postal Code is required"):
+            info.fill("Ema", "Test", "", fast=True)
+        assert fake_driver.current_url.endswith("/checkout-step-one.html")
+
+    def test_fast_fill_follows_the_option(self, fake_driver, monkeypatch):
+        info = logged_in(fake_driver).open_cart().checkout()
+        monkeypatch.setattr(CheckoutInfoPage, "fast_fill", True)
+        commands = []
+        add_command_listener(fake_driver,
+                             lambda command, params, elapsed, error: commands.append(command))
+        info.fill("Ema", "Test", "71000")
+        assert Command.SEND_KEYS_TO_ELEMENT not in commands
+
+    def test_navigation_makes_elements_stale(self, fake_driver):
+        logged_in(fake_driver)
+        title = fake_driver.find_element(By.CSS_SELECTOR, ".title")
+        fake_driver.refresh()
+        with pytest.raises(StaleElementReferenceException):
+            title.text
+
+    def test_unknown_script_needs_a_hook(self, fake_driver):
+        logged_in(fake_driver)
+        fake_driver.on_script("return document.title", lambda shop: "Swag Labs")
+        assert fake_driver.execute_script("return document.title") == "Swag Labs"
@@ -2,6 +2,9 @@ import pytest
 from src.pages.login_page import LoginPage
 from src.pages.inventory_page import InventoryPage
 from selenium.webdriver.common.by import By
+from src.utils.element_checks import Check, contains, nonempty
+
+pytestmark = pytest.mark.needs("login")
 
 
 class TestProductDetails:
@@ -25,32 +28,16 @@ class TestProductDetails:
             test_data["valid"]["username"], test_data["valid"]["password"]
         )
         inv = InventoryPage(driver, base_url)
-        
-        items = driver.find_elements(*inv._inventory_items)
-        
-        for item in items:
-            # Check for product name
-            try:
-                name = item.find_element(By.CSS_SELECTOR, ".inventory_item_name, [data-test='inventory-item-name']")
-                assert name.is_displayed(), "Product name not visible"
-                assert len(name.text.strip()) > 0, "Product name is empty"
-            except:
-                pytest.fail(f"Product name element not found in item")
-            
-            # Check for price
-            try:
-                price = item.find_element(By.CSS_SELECTOR, ".inventory_item_price")
-                assert price.is_displayed(), "Product price not visible"
-                assert "$" in price.text, "Price should contain currency symbol"
-            except:
-                pytest.fail("Product price element not found")
-            
-            # Check for image
-            try:
-                img = item.find_element(By.CSS_SELECTOR, "img")
-                assert img.is_displayed(), "Product image not visible"
-            except:
-                pytest.fail("Product image not found")
+        name = ".inventory_item_name, [data-test='inventory-item-name']"
+
+        # sve kartice u jednom pozivu; greška navodi karticu, selektor i pročitanu vrijednost
+        inv.check_cards([
+            Check(name, "displayed"),
+            Check(name, "text", nonempty),
+            Check(".inventory_item_price", "displayed"),
+            Check(".inventory_item_price", "text", contains("$")),
+            Check("img", "displayed"),
+        ]).assert_ok()
 
     @pytest.mark.regression
     def test_product_description_visible(self, driver, base_url, test_data):
@@ -59,16 +46,11 @@ class TestProductDetails:
             test_data["valid"]["username"], test_data["valid"]["password"]
         )
         inv = InventoryPage(driver, base_url)
-        
-        items = driver.find_elements(*inv._inventory_items)
-        
-        for item in items:
-            try:
-                desc = item.find_element(By.CSS_SELECTOR, ".inventory_item_desc")
-                assert desc.is_displayed(), "Product description not visible"
-                assert len(desc.text.strip()) > 0, "Product description is empty"
-            except:
-                pytest.fail("Product description element not found")
+
+        inv.check_cards([
+            Check(".inventory_item_desc", "displayed"),
+            Check(".inventory_item_desc", "text", nonempty),
+        ]).assert_ok()
 
     @pytest.mark.regression
     def test_known_product_names_displayed(self, driver, base_url, test_data):
@@ -0,0 +1,144 @@
+import json
+import os
+
+from src.fake.driver import FakeDriver
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.utils.profiling import StepProfiler, format_summary, self_times, summarize
+
+pytest_plugins = ["pytester"]
+
+# 4 uzorka po 1ms: idle, handler stranice (2x), naš polling skript bez URL-a
+PROFILE = {
+    "nodes": [
+        {"id": 1, "callFrame": {"functionName": "(root)", "url": "", "lineNumber": -1}},
+        {"id": 2, "callFrame": {"functionName": "(idle)", "url": "", "lineNumber": -1}},
+        {"id": 3, "callFrame": {"functionName": "sortProducts", "url": "https://shop/main.js",
+                                "lineNumber": 41}},
+        {"id": 4, "callFrame": {"functionName": "", "url": "", "lineNumber": 0}},
+    ],
+    "startTime": 0,
+    "endTime": 4000,
+    "samples": [2, 3, 3, 4],
+    "timeDeltas": [0, 1000, 1000, 1000],
+}
+
+
+class CdpFakeDriver(FakeDriver):
+    """Fake driver that answers the Profiler domain with a canned profile."""
+
+    def __init__(self):
+        super().__init__()
+        self.cdp = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append(cmd)
+        return {"profile": PROFILE} if cmd == "Profiler.stop" else {}
+
+
+class TestProfileSummary:
+    """Tests for .cpuprofile self-time summaries"""
+
+    def test_self_times_last_sample_runs_to_end(self):
+        assert self_times(PROFILE) == {2: 1.0, 3: 2.0, 4: 1.0}
+
+    def test_summary_splits_idle_page_and_injected(self):
+        summary = summarize(PROFILE)
+        assert summary["total_ms"] == 4.0
+        assert summary["categories"] == {"idle": 1.0, "program": 0.0, "gc": 0.0,
+                                         "page js": 2.0, "injected": 1.0}
+        top = summary["top"][0]
+        assert top["function"] == "sortProducts"
+        assert top["location"] == "https://shop/main.js:42"
+        assert top["percent"] == 50.0
+
+    def test_format_summary(self):
+        text = format_summary("sort", 0.5, summarize(PROFILE))
+        assert text.splitlines()[0] == "sort: 0.50s  idle 1ms  page js 2ms  injected 1ms"
+        assert "sortProducts" in text
+        assert format_summary("sort", 0.5, None) == "sort: 0.50s (no profile)"
+
+
+class TestStepProfiler:
+    """Tests for profiling page-object steps"""
+
+    def test_profiled_steps_without_profiler_run_unchanged(self, fake_driver):
+        page = LoginPage(fake_driver, fake_driver.shop.url).open_login()
+        page.login("standard_user", "secret_sauce")
+        assert InventoryPage(fake_driver, fake_driver.shop.url).is_loaded()
+
+    def test_records_one_profile_per_outer_step(self, tmp_path):
+        driver = CdpFakeDriver()
+        profiler = StepProfiler(driver).attach()
+        login = LoginPage(driver, driver.shop.url).open_login()
+        inventory = login.sign_in("standard_user", "secret_sauce")
+        inventory.sort("za")
+        profiler.detach()
+        assert [s.step for s in profiler.steps] == ["login submit", "inventory load", "sort"]
+        assert driver.cdp.count("Profiler.start") == 3
+        assert "_step_profiler" not in driver.__dict__
+
+        paths = profiler.save(str(tmp_path))
+        assert [os.path.basename(p) for p in paths] == [
+            "01-login-submit.cpuprofile", "02-inventory-load.cpuprofile", "03-sort.cpuprofile"]
+        with open(paths[0], "r", encoding="utf-8") as f:
+            assert json.load(f) == PROFILE
+        driver.quit()
+
+    def test_plain_login_flow_profiles_the_inventory_load(self):
+        driver = CdpFakeDriver()
+        profiler = StepProfiler(driver).attach()
+        LoginPage(driver, driver.shop.url).open_login().login("standard_user", "secret_sauce")
+        assert InventoryPage(driver, driver.shop.url).is_loaded()
+        assert [s.step for s in profiler.steps] == ["login submit", "inventory load"]
+        driver.quit()
+
+    def test_nested_step_stays_in_outer_profile(self):
+        driver = CdpFakeDriver()
+        profiler = StepProfiler(driver).attach()
+        page = LoginPage(driver, driver.shop.url).open_login()
+        profiler.run("whole login", lambda: page.login("standard_user", "secret_sauce"))
+        assert [s.step for s in profiler.steps] == ["whole login"]
+        driver.quit()
+
+
+class TestCpuProfilePlugin:
+    """Tests for --cpu-profile keeping only failing/over-budget profiles"""
+
+    def test_keeps_failing_test_profiles(self, pytester):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        pytester.syspathinsert(root)
+        pytester.makeini("[pytest]\n")
+        pytester.makeconftest(f"""
+import pytest
+from src.fake.driver import FakeDriver
+from src.utils.catalog import load_catalog
+
+pytest_plugins = ["src.plugins.cpu_profile"]
+
+class CdpFakeDriver(FakeDriver):
+    def execute_cdp_cmd(self, cmd, params):
+        return {{"profile": {PROFILE!r}}} if cmd == "Profiler.stop" else {{}}
+
+@pytest.fixture
+def driver():
+    drv = CdpFakeDriver(catalog=load_catalog({os.path.join(root, "src", "data", "catalog.json")!r}))
+    yield drv
+    drv.quit()
+""")
+        pytester.makepyfile(test_shop="""
+from src.pages.login_page import LoginPage
+
+def test_fast(driver):
+    LoginPage(driver, driver.shop.url).open_login().login("standard_user", "secret_sauce")
+
+def test_broken(driver):
+    LoginPage(driver, driver.shop.url).open_login().login("standard_user", "secret_sauce")
+    assert False
+""")
+        result = pytester.runpytest("-p", "no:xdist", "--cpu-profile",
+                                    "--cpu-profile-dir", "profiles")
+        result.assert_outcomes(passed=1, failed=1)
+        result.stdout.fnmatch_lines(["*cpu profiles*", "test_shop.py::test_broken  [[]failed[]]*",
+                                     "  login submit*top: sortProducts 2ms*"])
+        assert os.listdir(pytester.path / "profiles") == ["test_shop.py_test_broken"]
@@ -0,0 +1,73 @@
+import os
+
+from src.utils.result_cache import ResultCache, cache_key, module_closure, shared_digest
+
+pytest_plugins = ["pytester"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestResultCache:
+    """Tests for the content-hash cache of passing tests"""
+
+    def test_closure_follows_project_imports(self):
+        files = module_closure(_ROOT, os.path.join(_ROOT, "tests", "test_page_objects_fake.py"))
+        assert "src/pages/inventory_page.py" in files
+        assert "src/pages/base_page.py" in files  # preko inventory_page
+        assert "src/fake/dom.py" in files
+        assert not any(f.startswith("selenium") for f in files)
+
+    def test_key_changes_with_imported_module(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "helper.py").write_text("X = 1\n")
+        test_file = tmp_path / "test_a.py"
+        test_file.write_text("from src.helper import X\n")
+        before = cache_key(str(tmp_path), str(test_file))
+        module_closure.cache_clear()
+        (tmp_path / "src" / "helper.py").write_text("X = 2\n")
+        assert cache_key(str(tmp_path), str(test_file)) != before
+
+    def test_shared_inputs_include_ini_and_catalog(self, tmp_path):
+        (tmp_path / "src" / "data").mkdir(parents=True)
+        (tmp_path / "pytest.ini").write_text("[pytest]\n")
+        (tmp_path / "src" / "data" / "catalog.json").write_text("[]")
+        before = shared_digest(str(tmp_path))
+        shared_digest.cache_clear()
+        (tmp_path / "pytest.ini").write_text("[pytest]\naddopts = -x\n")
+        after_ini = shared_digest(str(tmp_path))
+        shared_digest.cache_clear()
+        (tmp_path / "src" / "data" / "catalog.json").write_text("[{}]")
+        assert len({before, after_ini, shared_digest(str(tmp_path))}) == 3
+
+    def test_only_passes_are_cached(self, tmp_path):
+        cache = ResultCache(str(tmp_path / "results.json"))
+        cache.passed("t::a", "k1")
+        cache.passed("t::b", None)
+        cache.save()
+        cache = ResultCache(str(tmp_path / "results.json"))
+        assert cache.is_cached_pass("t::a", "k1")
+        assert not cache.is_cached_pass("t::a", "k2")
+        assert not cache.is_cached_pass("t::b", None)
+        cache.failed("t::a")
+        assert not cache.is_cached_pass("t::a", "k1")
+
+    def test_unchanged_passing_test_is_cached_pass(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeini("[pytest]\n")
+        pytester.makeconftest('pytest_plugins = ["src.plugins.result_cache"]\n'
+                              'def pytest_addoption(parser):\n'
+                              '    parser.addoption("--base-url", default="")\n'
+                              '    parser.addoption("--browser", default="chrome")\n')
+        pytester.makepyfile(test_x="def test_ok():\n    pass\n\n"
+                                   "def test_bad():\n    assert False\n")
+        args = ["-p", "no:xdist", "--result-cache", "--summary-file", "summary.txt"]
+
+        pytester.runpytest(*args).assert_outcomes(passed=1, failed=1)
+        second = pytester.runpytest(*args)
+        second.assert_outcomes(failed=1)
+        second.stdout.fnmatch_lines(["*1 failed*1 cached*"])
+        pytester.runpytest(*args, "--force-full-run").assert_outcomes(passed=1, failed=1)
+
+        summary = (pytester.path / "summary.txt").read_text()
+        assert "1 failed, 1 cached" in summary
+        assert "FAILED test_x.py::test_bad" in summary
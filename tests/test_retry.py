@@ -0,0 +1,70 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+from src.utils.retry import Retry, RetryTelemetry
+
+
+class Flaky:
+    """Callable that raises `error` for the first `failures` calls."""
+
+    def __init__(self, failures, error=StaleElementReferenceException):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error("flaky")
+        return "ok"
+
+
+class TestRetry:
+    """Tests for the retry engine used by BasePage"""
+
+    def test_recovers_from_transient_error_and_counts_retries(self):
+        stats = RetryTelemetry()
+        fn = Flaky(2)
+        assert Retry(base_delay=0.001, stats=stats).call(fn, key="k") == "ok"
+        rec = stats.record("k")
+        assert fn.calls == 3
+        assert (rec.calls, rec.retries, rec.failures) == (1, 2, 0)
+        assert rec.errors["StaleElementReferenceException"] == 2
+        assert rec.recovery_ewma is not None
+
+    def test_non_transient_error_is_not_retried(self):
+        stats = RetryTelemetry()
+        fn = Flaky(1, NoSuchElementException)
+        with pytest.raises(NoSuchElementException):
+            Retry(stats=stats).call(fn, key="k")
+        assert fn.calls == 1
+        assert stats.record("k").retries == 0
+
+    def test_gives_up_after_attempts(self):
+        stats = RetryTelemetry()
+        fn = Flaky(10)
+        with pytest.raises(StaleElementReferenceException):
+            Retry(attempts=3, base_delay=0.001, stats=stats).call(fn, key="k")
+        assert fn.calls == 3
+        assert stats.record("k").failures == 1
+
+    def test_deadline_bounds_total_time(self):
+        fn = Flaky(10)
+        with pytest.raises(StaleElementReferenceException):
+            Retry(attempts=100, deadline=0.05, base_delay=0.02, stats=RetryTelemetry()).call(fn)
+        assert fn.calls < 10
+
+    def test_backoff_adapts_to_observed_recovery(self):
+        stats = RetryTelemetry()
+        retry = Retry(base_delay=0.01, max_delay=5, stats=stats)
+        assert retry.delay("k", 1) <= 0.01
+        stats.called("k", recovery=1.0)
+        assert 0.25 <= retry.delay("k", 1) <= 0.5
+
+    def test_merge_adds_worker_snapshots(self):
+        a, b = RetryTelemetry(), RetryTelemetry()
+        Retry(base_delay=0.001, stats=a).call(Flaky(1), key="k")
+        b.merge(a.snapshot())
+        b.merge(a.snapshot())
+        assert b.record("k").retries == 2
+        assert [key for key, _ in b.flaky()] == ["k"]
@@ -0,0 +1,57 @@
+import json
+import os
+
+import pytest
+
+from src.utils.sharding import DurationHistory, parse_shard, partition
+from tools.merge_shards import main as merge_main
+
+pytest_plugins = ["pytester"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestSharding:
+    """Tests for duration-aware sharding and shard merging"""
+
+    def test_parse_shard(self):
+        assert parse_shard("2/4") == (2, 4)
+        for bad in ("0/4", "5/4", "x", "1/0"):
+            with pytest.raises(ValueError):
+                parse_shard(bad)
+
+    def test_partition_balances_by_duration(self):
+        durations = {"a": 10.0, "b": 6.0, "c": 5.0, "d": 4.0, "e": 1.0}
+        shards = partition(list("abcde"), durations, 2)
+        loads = sorted(sum(durations[n] for n in s) for s in shards)
+        assert loads == [12.0, 14.0]  # LPT: najduži prvi, uvijek na najlakši shard
+        assert sorted(n for s in shards for n in s) == list("abcde")
+        assert all(s == sorted(s) for s in shards)  # redoslijed kolekcije ostaje
+
+    def test_unknown_tests_are_estimated_from_their_module(self, tmp_path):
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({"t_a.py::x": 4.0, "t_a.py::y": 2.0, "t_b.py::z": 10.0}))
+        estimates = DurationHistory(str(path)).estimate(["t_a.py::new", "t_c.py::new", "t_b.py::z"])
+        assert estimates == {"t_a.py::new": 3.0, "t_c.py::new": 4.0, "t_b.py::z": 10.0}
+
+    def test_shards_cover_the_suite_once_and_merge(self, pytester, monkeypatch):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeini("[pytest]\n")
+        pytester.makeconftest('pytest_plugins = ["src.plugins.sharding"]\n')
+        pytester.makepyfile(test_x="import pytest\n\n"
+                                   "@pytest.mark.parametrize('n', range(7))\n"
+                                   "def test_n(n):\n    assert n != 3\n")
+        for i in (1, 2, 3):
+            pytester.runpytest("-p", "no:xdist", "-p", "no:cacheprovider", "--shard", f"{i}/3")
+        shards = [json.loads((pytester.path / f"reports/shards/shard-{i}-of-3.json").read_text())
+                  for i in (1, 2, 3)]
+        ran = [t["nodeid"] for s in shards for t in s["tests"]]
+        assert sorted(ran) == sorted(f"test_x.py::test_n[{n}]" for n in range(7))
+        assert (pytester.path / "reports/shards/shard-2-of-3.xml").exists()
+
+        monkeypatch.chdir(pytester.path)
+        assert merge_main(["reports/shards", "--html", "merged.html", "--junit", "junit.xml",
+                           "--durations", "durations.json"]) == 1  # test_n[3] pada
+        assert "test_x.py::test_n[3]" in (pytester.path / "merged.html").read_text()
+        assert len(json.loads((pytester.path / "durations.json").read_text())) == 7
+        assert (pytester.path / "junit.xml").read_text().count("<testsuite ") == 3
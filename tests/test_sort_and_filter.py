@@ -1,9 +1,19 @@
 import pytest
 from src.pages.login_page import LoginPage
 from src.pages.inventory_page import InventoryPage
+from src.standin.server import StandinServer
+from src.utils.catalog import SORT_MODES, order_violations, synthetic_catalog
+
+
+@pytest.fixture(scope="module")
+def large_standin():
+    """Local stand-in shop with a synthetic 10,000-product catalog."""
+    with StandinServer(synthetic_catalog(10_000)) as server:
+        yield server
 
 
 @pytest.mark.regression
+@pytest.mark.needs("login")
 @pytest.mark.parametrize(
     "mode, expected_first",
     [
@@ -13,10 +23,26 @@ from src.pages.inventory_page import InventoryPage
         ("hilo", "Sauce Labs Fleece Jacket"),
     ],
 )
-def test_inventory_sorting(driver, base_url, test_data, mode, expected_first):
+def test_inventory_sorting(driver, base_url, test_data, catalog, mode, expected_first):
     LoginPage(driver, base_url).open_login().login(
         test_data["valid"]["username"], test_data["valid"]["password"]
     )
     inv = InventoryPage(driver, base_url)
     inv.sort(mode)
-    assert inv.item_names()[0] == expected_first
+    products = inv.products()
+    assert products[0]["name"] == expected_first
+    # cijeli redoslijed, ne samo prvi element (uklj. jednake cijene)
+    assert order_violations(products, mode) == []
+    assert [p["name"] for p in products] == inv.expected_names(mode)
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize("mode", list(SORT_MODES))
+def test_inventory_sorting_large_catalog(driver, large_standin, test_data, mode):
+    LoginPage(driver, large_standin.url).open_login().login(
+        test_data["valid"]["username"], test_data["valid"]["password"]
+    )
+    inv = InventoryPage(driver, large_standin.url)
+    products = inv.sort(mode).products()
+    assert len(products) == 10_000
+    assert order_violations(products, mode) == []
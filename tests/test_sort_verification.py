@@ -0,0 +1,55 @@
+import time
+
+from src.fake.driver import FakeDriver
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.utils.catalog import SORT_MODES, order_violations, sorted_catalog, synthetic_catalog
+from src.utils.commands import CommandCounter, add_command_listener
+
+
+def product(pid, name, price):
+    return {"id": pid, "name": name, "price": price}
+
+
+class TestOrderViolations:
+    """Tests for full-order sort checks"""
+
+    def test_sorted_catalog_has_no_violations(self):
+        catalog = synthetic_catalog(2_000)
+        for mode in SORT_MODES:
+            assert order_violations(sorted_catalog(catalog, mode), mode) == []
+
+    def test_misplaced_item_after_first_is_reported(self):
+        items = [product(0, "A", 1.0), product(1, "C", 2.0), product(2, "B", 3.0)]
+        assert order_violations(items, "az") == [(1, "order")]
+        assert order_violations(items, "lohi") == []
+
+    def test_equal_prices_must_keep_catalog_order(self):
+        items = [product(5, "B", 15.99), product(3, "A", 15.99), product(1, "C", 49.99)]
+        assert order_violations(items, "lohi") == [(0, "tie")]
+        items = [product(1, "C", 49.99), product(5, "B", 15.99), product(3, "A", 15.99)]
+        assert order_violations(items, "hilo") == [(1, "tie")]
+
+
+class TestProductsExtraction:
+    """InventoryPage.products() against the fake driver"""
+
+    def test_one_script_call_for_whole_listing(self):
+        driver = FakeDriver(catalog=synthetic_catalog(500))
+        LoginPage(driver, driver.shop.url).open_login().login("standard_user", "secret_sauce")
+        counter = add_command_listener(driver, CommandCounter())
+        products = InventoryPage(driver, driver.shop.url).products()
+        assert len(products) == 500
+        assert counter.counts["w3cExecuteScript"] == 1
+        assert counter.counts["findElement"] + counter.counts["findElements"] <= 1
+
+    def test_large_catalog_full_order(self):
+        driver = FakeDriver(catalog=synthetic_catalog(10_000))
+        LoginPage(driver, driver.shop.url).open_login().login("standard_user", "secret_sauce")
+        inv = InventoryPage(driver, driver.shop.url)
+        for mode in SORT_MODES:
+            start = time.perf_counter()
+            products = inv.sort(mode).products()
+            assert len(products) == 10_000
+            assert order_violations(products, mode) == [], mode
+            assert time.perf_counter() - start < 10
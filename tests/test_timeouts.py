@@ -0,0 +1,104 @@
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.utils.timeouts import WaitHistory, percentile, persona_of, set_persona
+from src.utils.wait import Wait
+
+KEY = "standard_user|InventoryPage[css selector=.title]"
+
+
+class TestWaitHistory:
+    """Tests for learned per-locator timeouts"""
+
+    def test_percentile_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 99) == 99
+        assert percentile(values, 50) == 50
+        assert percentile([0.2, 0.4], 99) == 0.4
+
+    def test_default_until_enabled_and_enough_samples(self):
+        history = WaitHistory(path=None)
+        history.observe(KEY, 0.2)
+        assert history.timeout(KEY, 10) == 10 and history.new_samples() == {}
+        history.enabled = True
+        for _ in range(4):
+            history.observe(KEY, 0.2)
+        assert history.timeout(KEY, 10) == 10
+        history.observe(KEY, 0.2)
+        assert history.timeout(KEY, 10) == pytest.approx(1.0)   # 0.6s ispod floor-a
+
+    def test_p99_times_factor_within_ceiling(self):
+        history = WaitHistory(path=None, factor=3, floor=1, ceiling=30, enabled=True)
+        for seconds in (2.0, 2.5, 3.0, 4.0, 5.0):
+            history.observe("performance_glitch_user|InventoryPage[ready]", seconds)
+            history.observe("standard_user|InventoryPage[ready]", seconds / 10)
+        assert history.timeout("performance_glitch_user|InventoryPage[ready]", 10) == 15.0
+        assert history.timeout("standard_user|InventoryPage[ready]", 10) == pytest.approx(1.5)
+        history.observe("performance_glitch_user|InventoryPage[ready]", 20.0)
+        assert history.timeout("performance_glitch_user|InventoryPage[ready]", 10) == 30
+
+    def test_merge_and_save_round_trip(self, tmp_path):
+        path = str(tmp_path / "waits.json")
+        worker = WaitHistory(path=path, enabled=True)
+        for _ in range(5):
+            worker.observe(KEY, 0.5)
+        controller = WaitHistory(path=path, enabled=True)
+        controller.merge(worker.new_samples())
+        controller.save()
+        loaded = WaitHistory(path=path, enabled=True).load()
+        assert loaded.learned(10) == {KEY: 1.5}
+        assert loaded.new_samples() == {}
+
+
+class TestAdaptiveWait:
+    """Wait with a learned timeout against the fake driver"""
+
+    def test_records_per_persona_and_page(self, fake_driver):
+        history = WaitHistory(path=None, enabled=True)
+        page = LoginPage(fake_driver, fake_driver.shop.url).open_login()
+        page.wait.history = history
+        page.login("standard_user", "secret_sauce")
+        assert persona_of(fake_driver) == "standard_user"
+        assert "_persona" not in vars(fake_driver)
+        inventory = InventoryPage(fake_driver, fake_driver.shop.url)
+        inventory.wait.history = history
+        inventory.is_loaded()
+        assert set(history.new_samples()) == {
+            "standard_user|LoginPage[id=user-name]",
+            "standard_user|LoginPage[id=password]",
+            "standard_user|LoginPage[id=login-button]",
+            KEY,
+        }
+
+    def test_missing_element_fails_after_learned_timeout(self, fake_driver):
+        history = WaitHistory(path=None, floor=0.3, enabled=True)
+        set_persona(fake_driver, "standard_user")
+        for _ in range(5):
+            history.observe("standard_user|InventoryPage[css selector=.missing]", 0.01)
+        wait = Wait(fake_driver, page="InventoryPage", history=history)
+        assert wait.timeout_for("css selector=.missing") == 0.3
+        start = time.monotonic()
+        with pytest.raises(TimeoutException):
+            wait.present((By.CSS_SELECTOR, ".missing"))
+        assert time.monotonic() - start < 2
+
+    def test_inventory_actions_record_their_waits(self, fake_driver):
+        history = WaitHistory(path=None, enabled=True)
+        login = LoginPage(fake_driver, fake_driver.shop.url).open_login()
+        login.login("standard_user", "secret_sauce")
+        inventory = InventoryPage(fake_driver, fake_driver.shop.url)
+        inventory.wait.history = history
+        inventory.sort("za")
+        assert inventory.add_to_cart("Sauce Labs Backpack")
+        assert {
+            "standard_user|InventoryPage[css selector=select[data-test='product-sort-container']]",
+            "standard_user|InventoryPage[css selector=.inventory_item]",
+            "standard_user|InventoryPage"
+            "[css selector=button[data-test='add-to-cart-sauce-labs-backpack']]",
+            "standard_user|InventoryPage[added]",
+        } <= set(history.new_samples())
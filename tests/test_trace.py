@@ -0,0 +1,83 @@
+import io
+import os
+
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.utils.trace import TraceRecorder, load_trace
+from tools.trace_viewer import run
+
+pytest_plugins = ["pytester"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestTraceRecorder:
+    """Tests for the failure-only trace recorder (on the fake driver)"""
+
+    def test_ring_buffer_is_bounded(self, fake_driver):
+        recorder = TraceRecorder(fake_driver, size=5).attach()
+        LoginPage(fake_driver, fake_driver.shop.url).open_login().login("standard_user",
+                                                                        "secret_sauce")
+        assert len(recorder.events) == 5
+        assert recorder.events[-1]["seq"] > 5
+
+    def test_flush_writes_timeline_and_snapshots(self, fake_driver, tmp_path):
+        recorder = TraceRecorder(fake_driver).attach()
+        LoginPage(fake_driver, fake_driver.shop.url).open_login().login("standard_user",
+                                                                        "secret_sauce")
+        InventoryPage(fake_driver, fake_driver.shop.url).add_to_cart("Sauce Labs Backpack")
+        recorder.capture(screenshot=True)
+        recorder.detach()
+
+        path = recorder.flush(str(tmp_path / "t.zip"), meta={"nodeid": "x"})
+        meta, events, archive = load_trace(path)
+        kinds = {e["kind"] for e in events}
+        assert meta == {"nodeid": "x"}
+        assert {"command", "url", "dom", "screenshot"} <= kinds
+        assert any(e.get("url", "").endswith("/inventory.html") for e in events)
+        dom = [e for e in events if e["kind"] == "dom"][-1]
+        assert b"shopping_cart_badge" in archive.read(dom["file"])
+        # recorderove vlastite komande nisu u timeline-u
+        assert not any(e.get("command") == "getPageSource" for e in events)
+
+    def test_viewer_steps_through_timeline(self, fake_driver, tmp_path):
+        recorder = TraceRecorder(fake_driver).attach()
+        LoginPage(fake_driver, fake_driver.shop.url).open_login()
+        recorder.note("failure", longrepr="AssertionError: boom")
+        path = recorder.flush(str(tmp_path / "t.zip"))
+
+        keys = iter(["n", "f", "d", "q"])
+        out = io.StringIO()
+        run(path, out=out, read=lambda prompt: next(keys))
+        text = out.getvalue()
+        assert "AssertionError: boom" in text
+        assert 'id="login-button"' in text
+
+    def test_plugin_records_only_when_asked(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeconftest('pytest_plugins = ["src.plugins.trace_recorder"]\n')
+        pytester.makepyfile(test_traced=f"""
+import pytest
+from src.fake.driver import FakeDriver
+from src.fake.shop import FakeShop
+from src.utils.catalog import load_catalog
+
+@pytest.fixture
+def driver():
+    catalog = load_catalog({os.path.join(_ROOT, "src", "data", "catalog.json")!r})
+    drv = FakeDriver(FakeShop(catalog=catalog))
+    yield drv
+    drv.quit()
+
+def test_fails(driver):
+    driver.get(driver.shop.url)
+    assert False
+""")
+        pytester.runpytest("-p", "no:xdist").assert_outcomes(failed=1)
+        assert not (pytester.path / "reports" / "traces").exists()
+
+        result = pytester.runpytest("-p", "no:xdist", "--trace-buffer", "50")
+        result.assert_outcomes(failed=1)
+        trace = pytester.path / "reports" / "traces" / "test_traced.py_test_fails.zip"
+        _, events, _ = load_trace(str(trace))
+        assert {"command", "url", "dom"} <= {e["kind"] for e in events}
@@ -0,0 +1,93 @@
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.replay.archive import Archive, to_har
+from src.replay.proxy import TrafficProxy
+from src.standin.server import StandinServer
+
+pytest_plugins = ["pytester"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _get(url: str):
+    with urllib.request.urlopen(url, timeout=10) as resp:
+        return resp.status, resp.headers.get("Content-Type"), resp.read()
+
+
+class TestTrafficReplay:
+    """Tests for the record/replay proxy against the stand-in shop"""
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        path = str(tmp_path / "shop.qat")
+        pages = ("/", "/inventory.html", "/static/shop.js", "/catalog.json")
+        with StandinServer(glitch_ms=0) as shop, \
+                TrafficProxy(path, "record", upstream=shop.url) as proxy:
+            recorded = {p: _get(proxy.url + p) for p in pages}
+            upstream = {p: _get(shop.url + p) for p in recorded}
+        assert recorded == upstream
+        return path, recorded
+
+    def test_replay_is_byte_identical_without_upstream(self, archive):
+        path, recorded = archive
+        with TrafficProxy(path, "replay") as proxy:
+            for p, response in recorded.items():
+                assert _get(proxy.url + p) == response
+
+    def test_unrecorded_request_is_a_miss(self, archive):
+        path, _ = archive
+        with TrafficProxy(path, "replay") as proxy:
+            with pytest.raises(urllib.error.HTTPError) as e:
+                _get(proxy.url + "/cart.html?x=1")
+            assert e.value.code == 404
+            assert proxy.misses == ["GET /cart.html?x=1"]
+
+    def test_latency_injection(self, archive):
+        path, _ = archive
+        with TrafficProxy(path, "replay", latency_ms=50) as proxy:
+            start = time.perf_counter()
+            _get(proxy.url + "/")
+            assert time.perf_counter() - start >= 0.05
+
+    def test_identical_bodies_are_stored_once(self, archive):
+        path, _ = archive
+        with Archive(path) as a:
+            pages = [a.lookup("GET", p) for p in ("/", "/inventory.html")]
+            assert pages[0]["offset"] != pages[1]["offset"]  # stranice se razlikuju po data-page
+            har = to_har(a)
+        files = {e["request"]["url"].rsplit("/", 1)[-1] for e in har["log"]["entries"]}
+        assert files >= {"shop.js", "catalog.json"}
+        json.dumps(har)
+
+    def test_plugin_lists_misses_in_the_summary(self, archive, pytester):
+        path, _ = archive
+        pytester.syspathinsert(_ROOT)
+        pytester.makeconftest('pytest_plugins = ["src.plugins.traffic_replay"]\n')
+        pytester.makepyfile(test_offline="""
+import urllib.error
+import urllib.request
+
+def test_miss(traffic_proxy):
+    try:
+        urllib.request.urlopen(traffic_proxy.url + "/cart.html?x=1", timeout=10)
+    except urllib.error.HTTPError as e:
+        assert e.code == 404
+""")
+        result = pytester.runpytest("-p", "no:xdist", f"--replay-traffic={path}")
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*traffic replay*", f"1 request(s) not in {path}:",
+                                     "  GET /cart.html?x=1"])
+
+    def test_recording_with_several_workers_is_a_usage_error(self, pytester, tmp_path):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeconftest('pytest_plugins = ["src.plugins.traffic_replay"]\n')
+        pytester.makepyfile(test_x="def test_x():\n    pass\n")
+        result = pytester.runpytest("-n", "2", f"--record-traffic={tmp_path / 'x.qat'}")
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*--record-traffic needs a single worker*"])
@@ -0,0 +1,105 @@
+import os
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from src.fake.server import FakeDriverServer
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.utils.transport import TransportStats, install_transport
+
+pytest_plugins = ["pytester"]
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def server(tmp_path):
+    with FakeDriverServer(unix_socket=str(tmp_path / "driver.sock")) as srv:
+        yield srv
+
+
+@pytest.fixture
+def remote(server):
+    drv = webdriver.Remote(RemoteConnection(server.url, keep_alive=True), options=ChromeOptions())
+    yield drv
+    drv.quit()
+
+
+def logged_in(driver, server):
+    LoginPage(driver, server.shop.url).open_login().login("standard_user", "secret_sauce")
+    return InventoryPage(driver, server.shop.url)
+
+
+class TestPooledTransport:
+    """Page objects over a real HTTP driver endpoint through the pooled transport"""
+
+    def test_page_objects_reuse_one_connection(self, server, remote):
+        stats = install_transport(remote, stats=TransportStats())
+        before = server.connections
+        inventory = logged_in(remote, server)
+        names = inventory.sort("za").item_names()
+        assert names == sorted(names, reverse=True)
+        assert server.connections == before  # sve preko konekcije iz kalibracije
+        totals = stats.totals()
+        assert totals["n"] > 10 and totals["new_connections"] == 0
+        assert {"findElement", "w3cExecuteScript", "clickElement"} <= set(stats.snapshot())
+        assert remote._transport.rtt > 0
+
+    def test_breakdown_adds_up(self, server, remote):
+        stats = install_transport(remote, stats=TransportStats())
+        for _ in range(20):
+            remote.title
+        row = stats.snapshot()["getTitle"]
+        assert row["n"] == 20
+        assert all(row[part] > 0 for part in ("encode", "transport", "decode"))
+        assert stats.format_table()[1].startswith("getTitle")
+
+    def test_errors_surface_like_the_stock_transport(self, server, remote):
+        logged_in(remote, server)
+        with pytest.raises(NoSuchElementException) as stock:
+            remote.find_element(By.CSS_SELECTOR, ".missing")
+        install_transport(remote, stats=TransportStats())
+        with pytest.raises(NoSuchElementException) as pooled:
+            remote.find_element(By.CSS_SELECTOR, ".missing")
+        assert pooled.value.msg == stock.value.msg
+
+    def test_unix_socket(self, server, remote):
+        stats = install_transport(remote, unix_socket=server.unix_socket, stats=TransportStats())
+        tcp = server._servers[0].connections
+        assert "inventory" in logged_in(remote, server).driver.current_url
+        assert server._servers[0].connections == tcp
+        assert server._servers[1].connections == 1
+        assert stats.totals()["n"] > 0
+
+    def test_plugin_prints_the_breakdown(self, pytester):
+        pytester.syspathinsert(_ROOT)
+        pytester.makeconftest('pytest_plugins = ["src.plugins.webdriver_transport"]\n')
+        pytester.makepyfile(test_remote=f"""
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from src.fake.server import FakeDriverServer
+from src.fake.shop import FakeShop
+from src.utils.catalog import load_catalog
+from src.utils.transport import install_transport
+
+def test_title():
+    shop = FakeShop(catalog=load_catalog({os.path.join(_ROOT, "src", "data", "catalog.json")!r}))
+    with FakeDriverServer(shop) as server:
+        drv = webdriver.Remote(server.url, options=Options())
+        install_transport(drv)
+        assert drv.title == "Swag Labs"
+        drv.quit()
+""")
+        result = pytester.runpytest("-p", "no:xdist", "--webdriver-transport", "pooled")
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines([
+            "*webdriver transport*",
+            "2 commands, 0 new connections; total encode *",
+            "  command*n*new conn*encode*transport*driver*decode",
+            "  getTitle * 1 * 0 *",
+        ])
@@ -4,6 +4,10 @@ from selenium.webdriver.support import expected_conditions as EC
 from src.pages.login_page import LoginPage
 from src.pages.inventory_page import InventoryPage
 from src.pages.cart_page import CartPage
+from src.utils.element_checks import Check, nonempty, positive
+from src.utils.viewport import BREAKPOINTS, sweep
+
+pytestmark = pytest.mark.needs("login")
 
 
 class TestProductImages:
@@ -16,123 +20,49 @@ class TestProductImages:
             test_data["valid"]["username"], test_data["valid"]["password"]
         )
         inv = InventoryPage(driver, base_url)
-        
-        # Wait for items to load
-        items = inv.driver.find_elements(By.CSS_SELECTOR, ".inventory_item")
-        assert len(items) > 0, "No items found on inventory page"
-        
-        # Check each product image
-        for item in items:
-            try:
-                img = item.find_element(By.CSS_SELECTOR, "img")
-                
-                # Verify image is visible
-                assert img.is_displayed(), "Product image is not displayed"
-                
-                # Verify image has src attribute
-                src = img.get_attribute("src")
-                assert src, "Product image has no src attribute"
-                
-                # Verify image is loaded (all = 1 means loaded)
-                is_loaded = driver.execute_script(
-                    "return arguments[0].complete && arguments[0].naturalHeight > 0", img
-                )
-                assert is_loaded, f"Image not loaded: {src}"
-            except Exception as e:
-                pytest.fail(f"Failed to verify product image: {str(e)}")
+
+        # vidljiva, ima src i učitana (complete + naturalHeight > 0), sve kartice u jednom pozivu
+        inv.check_cards([
+            Check("img", "displayed"),
+            Check("img", "src", nonempty),
+            Check("img", "complete"),
+            Check("img", "naturalHeight", positive),
+        ]).assert_ok()
+
+
+# veličine koje su stari testovi (set_window_size po testu) provjeravali na pravom sajtu;
+# ostale iz BREAKPOINTS se dodaju tek kad se provjere
+VERIFIED_SIZES = {"desktop", "tablet", "mobile"}
+VIEWPORTS = [v for v in BREAKPOINTS if v.name in VERIFIED_SIZES]
 
 
 class TestResponsiveness:
     """Test UI responsiveness across different viewport sizes"""
 
-    @pytest.fixture(params=[
-        (1440, 900),   # Desktop
-        (768, 1024),   # Tablet
-        (375, 667),    # Mobile
-    ])
-    def viewport_size(self, request):
-        return request.param
-
-    def test_inventory_page_responsive(self, driver, base_url, test_data, viewport_size):
-        """Test inventory page layout at different viewport sizes"""
-        width, height = viewport_size
-        driver.set_window_size(width, height)
-        
-        LoginPage(driver, base_url).open_login().login(
-            test_data["valid"]["username"], test_data["valid"]["password"]
-        )
-        inv = InventoryPage(driver, base_url)
-        
-        # Verify page title is visible
-        assert inv.is_loaded(), f"Inventory page not loaded at {width}x{height}"
-        
-        # Verify products are visible
-        items = driver.find_elements(By.CSS_SELECTOR, ".inventory_item")
-        assert len(items) > 0, f"No inventory items visible at {width}x{height}"
-        
-        # Verify cart link is visible
-        cart_link = driver.find_element(By.CSS_SELECTOR, ".shopping_cart_link")
-        assert cart_link.is_displayed(), f"Cart link not visible at {width}x{height}"
-
-    def test_product_items_layout_responsive(self, driver, base_url, test_data, viewport_size):
-        """Test product items layout responsiveness"""
-        width, height = viewport_size
-        driver.set_window_size(width, height)
-        
-        LoginPage(driver, base_url).open_login().login(
-            test_data["valid"]["username"], test_data["valid"]["password"]
-        )
-        inv = InventoryPage(driver, base_url)
-        
-        items = driver.find_elements(By.CSS_SELECTOR, ".inventory_item")
-        
-        for item in items[:3]:  # Check first 3 items
-            # Verify item and all sub-elements are visible
-            assert item.is_displayed(), f"Item not visible at {width}x{height}"
-            
-            # Verify product name is visible
-            name = item.find_element(By.CSS_SELECTOR, ".inventory_item_name, [data-test='inventory-item-name']")
-            assert name.is_displayed(), f"Product name not visible at {width}x{height}"
-            
-            # Verify image is visible
-            img = item.find_element(By.CSS_SELECTOR, "img")
-            assert img.is_displayed(), f"Product image not visible at {width}x{height}"
-            
-            # Verify price is visible
-            price = item.find_element(By.CSS_SELECTOR, ".inventory_item_price")
-            assert price.is_displayed(), f"Product price not visible at {width}x{height}"
+    LAYOUT = [
+        ".title",
+        ".inventory_item",
+        ".inventory_item_name",
+        ".inventory_item img",
+        ".inventory_item_price",
+        ".shopping_cart_link",
+        "select[data-test='product-sort-container']",
+    ]
 
-    def test_cart_page_responsive(self, driver, base_url, test_data, viewport_size):
-        """Test cart page header elements are responsive"""
-        width, height = viewport_size
-        driver.set_window_size(width, height)
-        
-        LoginPage(driver, base_url).open_login().login(
+    @pytest.fixture(scope="class")
+    def layout(self, class_driver, base_url, test_data):
+        """One login, every breakpoint emulated in the same session, measured once for the class"""
+        LoginPage(class_driver, base_url).open_login().login(
             test_data["valid"]["username"], test_data["valid"]["password"]
         )
-        
-        # Just verify we can navigate to inventory and header is visible
-        # without adding items (which can timeout on smaller viewports)
-        inv = InventoryPage(driver, base_url)
-        assert inv.is_loaded(), f"Inventory not loaded at {width}x{height}"
-        
-        # Verify cart link is accessible
-        cart_link = driver.find_element(By.CSS_SELECTOR, ".shopping_cart_link")
-        assert cart_link.is_displayed(), f"Cart link not visible at {width}x{height}"
+        assert InventoryPage(class_driver, base_url).is_loaded(), "Inventory page not loaded"
+        return sweep(class_driver, VIEWPORTS, self.LAYOUT)
 
-    def test_sort_dropdown_responsive(self, driver, base_url, test_data, viewport_size):
-        """Test sort dropdown accessibility at different viewport sizes"""
-        width, height = viewport_size
-        driver.set_window_size(width, height)
-        
-        LoginPage(driver, base_url).open_login().login(
-            test_data["valid"]["username"], test_data["valid"]["password"]
-        )
-        inv = InventoryPage(driver, base_url)
-        
-        # Verify sort dropdown is visible
-        sort_select = driver.find_element(By.CSS_SELECTOR, "select[data-test='product-sort-container']")
-        assert sort_select.is_displayed(), f"Sort dropdown not visible at {width}x{height}"
+    @pytest.mark.parametrize("viewport", VIEWPORTS, ids=lambda v: v.name)
+    def test_inventory_elements_visible(self, layout, viewport):
+        """Header, cards (name, image, price), cart link and sort dropdown are displayed"""
+        problems = layout[viewport.name].visibility_problems()
+        assert not problems, "\n".join(problems)
 
 
 class TestUIElementsVisibility:
@@ -0,0 +1,72 @@
+from src.fake.driver import FakeDriver
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.utils.viewport import BREAKPOINTS, LayoutMetrics, Viewport, sweep
+
+SELECTORS = [".title", ".inventory_item", ".shopping_cart_link"]
+
+
+def logged_in(driver):
+    LoginPage(driver, driver.shop.url).open_login().login("standard_user", "secret_sauce")
+    return InventoryPage(driver, driver.shop.url)
+
+
+class CdpFakeDriver(FakeDriver):
+    """Fake driver with a CDP endpoint that records Emulation calls"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append((cmd, params))
+        if cmd == "Emulation.setDeviceMetricsOverride":
+            self.command_executor.window.update(width=params["width"], height=params["height"])
+        return {}
+
+
+class TestViewportSweep:
+    """Tests for the in-session viewport sweep"""
+
+    def test_sweep_measures_every_breakpoint_and_restores_window(self, fake_driver):
+        logged_in(fake_driver)
+        report = sweep(fake_driver, BREAKPOINTS, SELECTORS)
+        assert [r.viewport.name for r in report.results] == [v.name for v in BREAKPOINTS]
+        assert report["small-mobile"].width == 320 and report["tablet"].height == 1024
+        assert report["mobile"].elements[".inventory_item"]["count"] == 6
+        assert report.problems() == []
+        assert fake_driver.get_window_size() == {"width": 1440, "height": 900}
+
+    def test_missing_and_hidden_elements_are_problems(self, fake_driver):
+        logged_in(fake_driver)
+        report = sweep(fake_driver, [Viewport("mobile", 375, 667)], SELECTORS + [".no_such_thing"])
+        assert report.problems() == ["mobile 375x667: [visibility] .no_such_thing not found"]
+
+        metrics = LayoutMetrics(Viewport("phone", 320, 568), 320, 568, 2.0, 400, {
+            ".title": {"count": 1, "visible": 0, "right": 0, "first": None},
+            ".inventory_item": {"count": 6, "visible": 6, "right": 390.4, "first": None},
+        })
+        assert metrics.visibility_problems() == [
+            "phone 320x568: [visibility] .title 1 of 1 not visible",
+        ]
+        assert metrics.overflow_problems() == [
+            "phone 320x568: [overflow] .inventory_item extends to 390px, viewport is 320px",
+            "phone 320x568: [overflow] page scrolls horizontally (400px > 320px)",
+        ]
+        assert metrics.problems() == metrics.visibility_problems() + metrics.overflow_problems()
+
+    def test_cdp_emulation_keeps_window_and_clears_override(self):
+        drv = CdpFakeDriver()
+        try:
+            logged_in(drv)
+            sweep(drv, BREAKPOINTS[2:4], SELECTORS)
+            assert drv.cdp_calls == [
+                ("Emulation.setDeviceMetricsOverride",
+                 {"width": 768, "height": 1024, "deviceScaleFactor": 2.0, "mobile": True}),
+                ("Emulation.setDeviceMetricsOverride",
+                 {"width": 414, "height": 896, "deviceScaleFactor": 3.0, "mobile": True}),
+                ("Emulation.clearDeviceMetricsOverride", {}),
+            ]
+            assert drv.current_url.endswith("/inventory.html")
+        finally:
+            drv.quit()
@@ -0,0 +1,37 @@
+# tools/gen_catalog.py
+"""
+Write a synthetic catalog for the stand-in shop.
+
+    python -m tools.gen_catalog --size 50000 --long-names --duplicate-prices 0.3 --unicode \\
+        --out reports/catalogs/50k.json
+    python -m src.standin.server --catalog reports/catalogs/50k.json
+"""
+import argparse
+import json
+import os
+
+from src.utils.catalog import synthetic_catalog
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--long-names", action="store_true")
+    parser.add_argument("--duplicate-prices", type=float, default=0.0,
+                        help="share of products with shared prices")
+    parser.add_argument("--unicode", action="store_true")
+    parser.add_argument("--out", required=True)
+    args = parser.parse_args(argv)
+
+    catalog = synthetic_catalog(args.size, args.seed, args.long_names, args.duplicate_prices,
+                                args.unicode)
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, ensure_ascii=False)
+    print(f"{len(catalog)} products -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
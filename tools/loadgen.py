@@ -0,0 +1,297 @@
+# tools/loadgen.py
+"""
+Synthetic load: N concurrent virtual users run the login -> add -> checkout journey
+through the page objects, each in its own browser.
+
+    python -m tools.loadgen --standin --profile linear:10:30 --duration 120
+    python -m tools.loadgen --base-url https://www.saucedemo.com --profile step:8:2:15 \\
+        --personas valid:0.7,problem:0.2,perf:0.1 --out reports/load/run.jsonl
+
+One of --standin or --base-url is required: there is no default target.
+
+Profiles (users over time):
+    constant:N          N users from the start
+    linear:N:RAMP       0 -> N users linearly over RAMP seconds
+    step:N:STEP:EVERY   add STEP users every EVERY seconds up to N
+
+Every --interval seconds one row per journey step (plus a `journey` row) is streamed to --out
+(.csv or .jsonl): active users, throughput, count, errors, error rate, p50/p95/p99 latency.
+"""
+import argparse
+import csv
+import json
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+
+from src.pages.cart_page import CartPage
+from src.pages.checkout_complete_page import CheckoutCompletePage
+from src.pages.checkout_info_page import CheckoutInfoPage
+from src.pages.checkout_overview_page import CheckoutOverviewPage
+from src.pages.inventory_page import InventoryPage
+from src.pages.login_page import LoginPage
+from src.standin.server import StandinServer
+from src.utils.driver_factory import build_driver
+from src.utils.stats import percentile
+
+STEPS = ["login", "add", "cart", "checkout", "fill", "finish"]
+FIELDS = ["elapsed", "active_users", "step", "count", "errors", "error_rate",
+          "throughput", "p50_ms", "p95_ms", "p99_ms"]
+
+
+def parse_profile(spec: str):
+    """Return f(elapsed_seconds) -> target number of users."""
+    kind, *nums = spec.split(":")
+    nums = [float(x) for x in nums]
+    if kind == "constant" and len(nums) == 1:
+        return lambda t: int(nums[0])
+    if kind == "linear" and len(nums) == 2:
+        users, ramp = nums
+        return lambda t: int(users if t >= ramp else users * t / ramp) or 1
+    if kind == "step" and len(nums) == 3:
+        users, step, every = nums
+        return lambda t: int(min(users, step * (1 + t // every)))
+    raise ValueError(f"bad profile '{spec}' (constant:N | linear:N:RAMP | step:N:STEP:EVERY)")
+
+
+def parse_personas(spec: str, users: dict) -> list:
+    """'valid:0.7,perf:0.3' -> [(credentials, weight), ...] keyed into users.json."""
+    personas = []
+    for part in spec.split(","):
+        key, _, weight = part.partition(":")
+        personas.append((users[key], float(weight or 1)))
+    return personas
+
+
+class Metrics:
+    """Latency samples per step, drained every interval by the reporter thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._window = defaultdict(list)
+        self._errors = defaultdict(int)
+        self.totals = defaultdict(list)
+        self.total_errors = defaultdict(int)
+        self.error_kinds = defaultdict(int)
+
+    def record(self, step: str, seconds: float, error: BaseException = None):
+        with self._lock:
+            if error is None:
+                self._window[step].append(seconds)
+                self.totals[step].append(seconds)
+            else:
+                self._errors[step] += 1
+                self.total_errors[step] += 1
+                self.error_kinds[f"{step}: {type(error).__name__}"] += 1
+
+    def drain(self):
+        with self._lock:
+            window, errors = self._window, self._errors
+            self._window, self._errors = defaultdict(list), defaultdict(int)
+        return window, errors
+
+
+def row(step, samples, errors, interval, elapsed, active):
+    count = len(samples)
+    total = count + errors
+    return {
+        "elapsed": round(elapsed, 1),
+        "active_users": active,
+        "step": step,
+        "count": count,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "throughput": round(count / interval, 3),
+        "p50_ms": round(percentile(samples, 50) * 1000, 1) if samples else None,
+        "p95_ms": round(percentile(samples, 95) * 1000, 1) if samples else None,
+        "p99_ms": round(percentile(samples, 99) * 1000, 1) if samples else None,
+    }
+
+
+class VirtualUser(threading.Thread):
+    def __init__(self, n, url, personas, data, metrics, browser):
+        super().__init__(name=f"vu-{n}", daemon=True)
+        self.url = url
+        self.personas = personas
+        self.data = data
+        self.metrics = metrics
+        self.browser = browser
+        self.stop_event = threading.Event()
+
+    def _step(self, name, fn):
+        start = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            self.metrics.record(name, time.perf_counter() - start, e)
+            raise
+        self.metrics.record(name, time.perf_counter() - start)
+
+    def journey(self, driver):
+        creds = random.choices([p for p, _ in self.personas], [w for _, w in self.personas])[0]
+        info = self.data["checkout_info"]
+        url = self.url
+        inv = InventoryPage(driver, url)
+
+        def login():
+            LoginPage(driver, url).open_login().login(creds["username"], creds["password"])
+            if not inv.is_loaded():
+                raise AssertionError("inventory not loaded")
+
+        def add():
+            for name in self.data["products"][:2]:
+                if not inv.add_to_cart(name):
+                    raise AssertionError(f"could not add {name}")
+
+        def finish():
+            CheckoutOverviewPage(driver, url).finish()
+            if "Thank you" not in CheckoutCompletePage(driver, url).success_text():
+                raise AssertionError("order not completed")
+
+        start = time.perf_counter()
+        try:
+            self._step("login", login)
+            self._step("add", add)
+            self._step("cart", inv.open_cart)
+            self._step("checkout", CartPage(driver, url).checkout)
+            self._step(
+                "fill",
+                lambda: CheckoutInfoPage(driver, url).fill(
+                    info["first"], info["last"], info["zip"]
+                ),
+            )
+            self._step("finish", finish)
+        except Exception as e:
+            self.metrics.record("journey", time.perf_counter() - start, e)
+        else:
+            self.metrics.record("journey", time.perf_counter() - start)
+        finally:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear()")
+
+    def run(self):
+        try:
+            driver = build_driver(self.browser)
+        except Exception as e:
+            self.metrics.record("session", 0.0, e)
+            return
+        try:
+            while not self.stop_event.is_set():
+                self.journey(driver)
+        finally:
+            driver.quit()
+
+
+class Reporter:
+    def __init__(self, out: str):
+        self.jsonl = out.endswith(".jsonl") or out.endswith(".json")
+        self.f = sys.stdout if out == "-" else open(out, "w", encoding="utf-8", newline="")
+        self.writer = None if self.jsonl else csv.DictWriter(self.f, fieldnames=FIELDS)
+        if self.writer:
+            self.writer.writeheader()
+
+    def write(self, rows):
+        for r in rows:
+            if self.jsonl:
+                self.f.write(json.dumps(r) + "\n")
+            else:
+                self.writer.writerow(r)
+        self.f.flush()
+
+    def close(self):
+        if self.f is not sys.stdout:
+            self.f.close()
+
+
+def run(url, profile, duration, interval, personas, data, browser, reporter) -> Metrics:
+    metrics = Metrics()
+    users = []
+    start = last = time.monotonic()
+    try:
+        while (now := time.monotonic()) - start < duration:
+            target = profile(now - start)
+            users = [u for u in users if u.is_alive()]
+            while len(users) < target:
+                u = VirtualUser(len(users) + 1, url, personas, data, metrics, browser)
+                u.start()
+                users.append(u)
+            for u in users[target:]:
+                u.stop_event.set()
+            if now - last >= interval:
+                window, errors = metrics.drain()
+                active = sum(1 for u in users if not u.stop_event.is_set())
+                reporter.write(
+                    row(
+                        step,
+                        window.get(step, []),
+                        errors.get(step, 0),
+                        now - last,
+                        now - start,
+                        active,
+                    )
+                    for step in STEPS + ["journey"]
+                )
+                last = now
+            time.sleep(0.1)
+    finally:
+        for u in users:
+            u.stop_event.set()
+        for u in users:
+            u.join(timeout=60)
+    return metrics
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    # bez podrazumijevanog cilja: opterećenje javnog sajta mora biti izričit izbor
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="shop to load, e.g. a staging deployment you own")
+    target.add_argument(
+        "--standin", action="store_true", help="start a local stand-in shop and target it"
+    )
+    parser.add_argument(
+        "--glitch-ms", type=int, default=1500, help="stand-in delay for performance_glitch_user"
+    )
+    parser.add_argument("--profile", default="constant:2")
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument(
+        "--interval", type=float, default=5, help="seconds between time-series rows"
+    )
+    parser.add_argument("--personas", default="valid:1,problem:0,perf:0")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--out", default="-", help="'-' (stdout CSV), *.csv or *.jsonl")
+    args = parser.parse_args(argv)
+
+    with open("src/data/users.json", "r", encoding="utf-8") as f:
+        data = json.load(f)
+    personas = [(p, w) for p, w in parse_personas(args.personas, data) if w > 0]
+    shop = StandinServer(glitch_ms=args.glitch_ms).start() if args.standin else None
+    url = shop.url if shop else args.base_url.rstrip("/")
+    reporter = Reporter(args.out)
+    try:
+        metrics = run(url, parse_profile(args.profile), args.duration, args.interval,
+                      personas, data, args.browser, reporter)
+    finally:
+        reporter.close()
+        if shop:
+            shop.stop()
+
+    print("\nstep        count  errors    p50ms    p95ms    p99ms", file=sys.stderr)
+    for step in STEPS + ["journey"]:
+        s = metrics.totals.get(step, [])
+        p = [f"{percentile(s, q) * 1000:8.0f}" if s else "       -" for q in (50, 95, 99)]
+        print(
+            f"{step:<10}{len(s):>7}{metrics.total_errors.get(step, 0):>8} {' '.join(p)}",
+            file=sys.stderr,
+        )
+    for kind, n in sorted(metrics.error_kinds.items(), key=lambda kv: -kv[1]):
+        print(f"  {n}× {kind}", file=sys.stderr)
+    return 1 if metrics.total_errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
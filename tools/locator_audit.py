@@ -0,0 +1,211 @@
+# tools/locator_audit.py
+"""
+Locator cost audit: how expensive is every locator declared on the page objects?
+
+    python -m tools.locator_audit                     # stand-in shop, ranked report
+    python -m tools.locator_audit --max-us 200        # exit 1 if a locator costs more than 200µs
+    python -m tools.locator_audit --base-url https://www.saucedemo.com --json reports/locators.json
+
+Every `(By.X, "...")` class attribute of the classes in src/pages/ is resolved on the page it
+belongs to, `--iterations` times inside the browser (no WebDriver round trip in the timing).
+For each one the browser also proposes cheaper CSS selectors built from the matched elements
+(id, data-test, shared classes) and keeps those that match exactly the same elements.
+Locators containing '%s' are templates; they are filled with a sample product name.
+"""
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import sys
+
+from selenium.webdriver.common.by import By
+
+import src.pages
+from benchmarks.page_objects import USERS, _session
+from src.pages.base_page import BasePage
+from src.standin.server import StandinServer
+from src.utils.driver_factory import build_driver
+from src.utils.wait import browser_locator as to_browser
+
+# stranica na kojoj se lokatori klase mogu naći: (path, proizvodi u korpi)
+PAGES = {
+    "LoginPage": ("/", None),
+    "InventoryPage": ("/inventory.html", []),
+    "CartPage": ("/cart.html", [4]),
+    "CheckoutInfoPage": ("/checkout-step-one.html", [4]),
+    "CheckoutOverviewPage": ("/checkout-step-two.html", [4]),
+    "CheckoutCompletePage": ("/checkout-complete.html", []),
+}
+SAMPLE_PRODUCT = USERS["products"][0]
+
+_STRATEGIES = {By.ID, By.CSS_SELECTOR, By.XPATH, By.CLASS_NAME, By.NAME, By.TAG_NAME}
+
+AUDIT_JS = r"""/* locatorAudit */
+var using = arguments[0], value = arguments[1], iterations = arguments[2];
+
+function resolve(u, v) {
+    if (u === 'xpath') {
+        var r = document.evaluate(v, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var out = [];
+        for (var i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+        return out;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(v));
+}
+function cost(u, v) {
+    resolve(u, v);
+    var t0 = performance.now();
+    for (var i = 0; i < iterations; i++) resolve(u, v);
+    return (performance.now() - t0) * 1000 / iterations;
+}
+function same(a, b) {
+    if (a.length !== b.length) return false;
+    for (var i = 0; i < a.length; i++) if (a[i] !== b[i]) return false;
+    return true;
+}
+function all(els, fn) {
+    for (var i = 0; i < els.length; i++) if (!fn(els[i])) return false;
+    return true;
+}
+function candidates(els) {
+    var out = [], first = els[0], tag = first.tagName.toLowerCase();
+    if (els.length === 1 && first.id) out.push('#' + CSS.escape(first.id));
+    var dt = first.getAttribute('data-test');
+    if (dt && all(els, function (e) { return e.getAttribute('data-test') === dt; })) {
+        out.push('[data-test="' + dt + '"]');
+        out.push(tag + '[data-test="' + dt + '"]');
+    }
+    Array.prototype.forEach.call(first.classList, function (cls) {
+        if (all(els, function (e) { return e.classList.contains(cls); })) {
+            out.push('.' + CSS.escape(cls));
+            out.push(tag + '.' + CSS.escape(cls));
+        }
+    });
+    return out;
+}
+
+var matched;
+try {
+    matched = resolve(using, value);
+} catch (e) {
+    return {error: String(e)};
+}
+var result = {matches: matched.length, cost_us: cost(using, value), alternatives: []};
+if (!matched.length) return result;
+candidates(matched).forEach(function (css) {
+    if (css === value) return;
+    var els;
+    try { els = resolve('css selector', css); } catch (e) { return; }
+    if (same(els, matched)) {
+        result.alternatives.push({selector: css, cost_us: cost('css selector', css)});
+    }
+});
+result.alternatives.sort(function (a, b) { return a.cost_us - b.cost_us; });
+return result;
+"""
+
+
+def collect_locators(package=src.pages) -> list:
+    """[(page class name, attribute, by, value)] for every locator tuple on a page class."""
+    found = []
+    for mod in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package.__name__}.{mod.name}")
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(cls, BasePage) or cls.__module__ != module.__name__:
+                continue
+            for attr, value in vars(cls).items():
+                if (isinstance(value, tuple) and len(value) == 2 and value[0] in _STRATEGIES
+                        and isinstance(value[1], str)):
+                    found.append((cls_name, attr, value[0], value[1]))
+    return sorted(found)
+
+
+def audit(driver, url: str, locators, iterations: int = 200) -> list:
+    rows = []
+    by_page = {}
+    for loc in locators:
+        by_page.setdefault(loc[0], []).append(loc)
+    for page, locs in by_page.items():
+        path, cart = PAGES.get(page, ("/", None))
+        if cart is None:
+            driver.get(url + path)
+            driver.delete_all_cookies()
+            driver.refresh()
+        else:
+            _session(driver, url, cart=cart)
+            driver.get(url + path)
+        for cls_name, attr, by, value in locs:
+            if "%s" in value:
+                value = value % SAMPLE_PRODUCT
+            using, selector = to_browser(by, value)
+            result = driver.execute_script(AUDIT_JS, using, selector, iterations)
+            rows.append({"locator": f"{cls_name}.{attr}", "using": by, "value": value, **result})
+    return rank(rows)
+
+
+def rank(rows: list) -> list:
+    """Most expensive first; `best`/`speedup` filled when a cheaper equivalent exists."""
+    for row in rows:
+        best = (row.get("alternatives") or [None])[0]
+        row["best"] = best if best and best["cost_us"] < row.get("cost_us", 0) else None
+        row["speedup"] = row["cost_us"] / max(best["cost_us"], 1e-3) if row["best"] else None
+    return sorted(rows, key=lambda r: r.get("cost_us", float("inf")), reverse=True)
+
+
+def print_report(rows: list):
+    print(f"{'locator':<38}{'using':<14}{'matches':>8}{'µs':>9}  cheaper equivalent")
+    for row in rows:
+        if "error" in row:
+            print(f"{row['locator']:<38}{row['using']:<14}{'-':>8}{'-':>9}  ERROR {row['error']}")
+            continue
+        best = row["best"]
+        hint = (f"{best['selector']}  ({best['cost_us']:.1f}µs, {row['speedup']:.1f}x)"
+                if best else "-")
+        print(f"{row['locator']:<38}{row['using']:<14}{row['matches']:>8}"
+              f"{row['cost_us']:>9.1f}  {hint}")
+        if row["matches"] == 0:
+            page = PAGES.get(row["locator"].split(".")[0], ("?",))[0]
+            print(f"{'':<38}^ matches nothing on {page}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--base-url", default=None,
+                        help="audit this URL instead of a fresh stand-in")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--max-us", type=float, default=None,
+                        help="fail if a locator costs more (µs)")
+    parser.add_argument("--json", default=None, help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    shop = None if args.base_url else StandinServer(glitch_ms=0).start()
+    url = (args.base_url or shop.url).rstrip("/")
+    driver = build_driver(args.browser, args.headed)
+    try:
+        rows = audit(driver, url, collect_locators(), args.iterations)
+    finally:
+        driver.quit()
+        if shop:
+            shop.stop()
+
+    print_report(rows)
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2, ensure_ascii=False)
+
+    if args.max_us is None:
+        return 0
+    slow = [r for r in rows if r.get("cost_us", 0) > args.max_us]
+    for row in slow:
+        print(f"SLOW {row['locator']}: {row['cost_us']:.1f}µs > {args.max_us:.0f}µs")
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+# tools/merge_shards.py
+"""
+Merge the results of a sharded run (`pytest --shard i/N`, src/plugins/sharding.py).
+
+    python -m tools.merge_shards reports/shards
+    python -m tools.merge_shards artifacts/ --html report.html --junit junit.xml
+
+Reads every shard-*.json (and shard-*.xml) below the folder and writes:
+- one HTML report (summary, per-shard balance, every test with its failure text)
+- one JUnit file with the test suites of all shards
+- the updated duration history the next sharded run balances with
+
+Exit code 1 if a test failed or a shard is missing.
+"""
+import argparse
+import glob
+import html
+import json
+import os
+import sys
+import xml.etree.ElementTree as ET
+from collections import Counter
+from datetime import datetime
+
+from src.utils.sharding import DURATIONS_PATH, DurationHistory
+
+OUTCOMES = ("passed", "failed", "error", "skipped", "xfailed", "xpassed")
+
+
+def load_shards(folder: str) -> list:
+    shards = []
+    for path in sorted(glob.glob(os.path.join(folder, "**", "shard-*.json"), recursive=True)):
+        with open(path, "r", encoding="utf-8") as f:
+            shards.append(json.load(f))
+    return sorted(shards, key=lambda s: s["shard"])
+
+
+def missing_shards(shards: list) -> list:
+    if not shards:
+        return []
+    total = shards[0]["total"]
+    return sorted(set(range(1, total + 1)) - {s["shard"] for s in shards})
+
+
+def shard_rows(shards: list) -> list:
+    return [{"shard": f"{s['shard']}/{s['total']}", "tests": len(s["tests"]),
+             "test_seconds": round(sum(t["duration"] for t in s["tests"]), 2),
+             "wall_seconds": round(s["stop"] - s["start"], 2)} for s in shards]
+
+
+def merge_junit(folder: str, out: str) -> int:
+    root = ET.Element("testsuites")
+    for path in sorted(glob.glob(os.path.join(folder, "**", "shard-*.xml"), recursive=True)):
+        tree = ET.parse(path).getroot()
+        suites = [tree] if tree.tag == "testsuite" else list(tree)
+        shard = os.path.splitext(os.path.basename(path))[0]
+        for suite in suites:
+            suite.set("name", f"{suite.get('name', 'pytest')} [{shard}]")
+            root.append(suite)
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    ET.ElementTree(root).write(out, encoding="utf-8", xml_declaration=True)
+    return len(root)
+
+
+def render_html(shards: list, tests: list) -> str:
+    counts = Counter(t["outcome"] for t in tests)
+    wall = max((s["stop"] - s["start"] for s in shards), default=0)
+    summary = ", ".join(f"{counts[o]} {o}" for o in OUTCOMES if counts[o])
+    balance = "".join(
+        f"<tr><td>{r['shard']}</td><td>{r['tests']}</td><td>{r['test_seconds']:.1f}s</td>"
+        f"<td>{r['wall_seconds']:.1f}s</td></tr>" for r in shard_rows(shards)
+    )
+    rows = []
+    for t in sorted(tests, key=lambda t: (t["outcome"] not in ("failed", "error"), t["nodeid"])):
+        detail = (f"<tr class='log'><td colspan='3'><pre>{html.escape(t['longrepr'])}</pre>"
+                  "</td></tr>" if t.get("longrepr") else "")
+        rows.append(f"<tr class='{t['outcome']}'><td>{t['outcome'].capitalize()}</td>"
+                    f"<td>{html.escape(t['nodeid'])}</td><td>{t['duration']:.2f}s</td></tr>"
+                    f"{detail}")
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>report.html</title>
+<style>
+body {{ font-family: Helvetica, Arial, sans-serif; font-size: 12px; color: #222; }}
+table {{ border-collapse: collapse; margin-bottom: 16px; }}
+td, th {{ border: 1px solid #e6e6e6; padding: 5px; text-align: left; vertical-align: top; }}
+.passed td:first-child {{ color: green; }}
+.failed td:first-child, .error td:first-child {{ color: red; }}
+.skipped td:first-child, .xfailed td:first-child {{ color: orange; }}
+pre {{ white-space: pre-wrap; margin: 0; max-height: 320px; overflow: auto; }}
+</style></head><body>
+<h1>report.html</h1>
+<p>Merged from {len(shards)} shard(s) on {datetime.now():%d-%b-%Y at %H:%M:%S}.</p>
+<h2>Summary</h2>
+<p>{len(tests)} tests, slowest shard {wall:.1f}s wall time: {summary or "no tests"}</p>
+<table><tr><th>Shard</th><th>Tests</th><th>Test time</th><th>Wall time</th></tr>{balance}</table>
+<h2>Results</h2>
+<table><tr><th>Result</th><th>Test</th><th>Duration</th></tr>{"".join(rows)}</table>
+</body></html>
+"""
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("folder", nargs="?", default="reports/shards")
+    parser.add_argument("--html", default="report.html")
+    parser.add_argument("--junit", default="reports/junit.xml")
+    parser.add_argument("--durations", default=DURATIONS_PATH, help="duration history to update")
+    args = parser.parse_args(argv)
+
+    shards = load_shards(args.folder)
+    if not shards:
+        print(f"no shard-*.json in {args.folder}")
+        return 1
+    tests = [t for s in shards for t in s["tests"]]
+
+    with open(args.html, "w", encoding="utf-8") as f:
+        f.write(render_html(shards, tests))
+    suites = merge_junit(args.folder, args.junit)
+    history = DurationHistory(args.durations)
+    history.update({t["nodeid"]: t["duration"] for t in tests if t["outcome"] != "skipped"})
+    history.save()
+
+    print(f"{'shard':<8}{'tests':>7}{'test time':>11}{'wall':>9}")
+    for r in shard_rows(shards):
+        print(f"{r['shard']:<8}{r['tests']:>7}{r['test_seconds']:>10.1f}s"
+              f"{r['wall_seconds']:>8.1f}s")
+    counts = Counter(t["outcome"] for t in tests)
+    print(", ".join(f"{counts[o]} {o}" for o in OUTCOMES if counts[o]))
+    print(f"html: {args.html}  junit: {args.junit} ({suites} suites)  durations: {args.durations}")
+
+    missing = missing_shards(shards)
+    if missing:
+        print(f"missing shard(s): {', '.join(map(str, missing))} of {shards[0]['total']}")
+    return 1 if missing or counts["failed"] or counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
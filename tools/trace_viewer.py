@@ -0,0 +1,100 @@
+# tools/trace_viewer.py
+"""
+Offline viewer for failure traces (reports/traces/*.zip).
+
+    python -m tools.trace_viewer reports/traces/tests_test_checkout_flow.py_TestX_test_y.zip
+    python -m tools.trace_viewer TRACE --list          # print the whole timeline and exit
+
+Interactive keys: Enter/n next, p previous, <number> jump to seq, d show DOM at this point,
+o open DOM (or screenshot) in the default browser, f jump to failure, q quit.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import webbrowser
+
+from src.utils.trace import load_trace
+
+
+def describe(event) -> str:
+    kind = event["kind"]
+    head = f"#{event['seq']:<5} {event['t']:>8.3f}s  {kind:<10}"
+    if kind == "command":
+        params = ", ".join(f"{k}={v}" for k, v in event["params"].items())
+        line = f"{head}{event['command']}({params})  {event['ms']}ms"
+        return line + (f"  !! {event['error']}" if event.get("error") else "")
+    if kind == "url":
+        return f"{head}{event['url']}"
+    if kind == "console":
+        return f"{head}[{event['level']}] {event['message']}"
+    if kind in ("dom", "screenshot"):
+        return f"{head}{event['file']}"
+    return f"{head}{event.get('message', '')}"
+
+
+def dom_at(events, index):
+    """Latest DOM snapshot at or before `index`."""
+    for event in reversed(events[: index + 1]):
+        if event["kind"] == "dom":
+            return event
+    return None
+
+
+def _open(archive, event):
+    suffix = os.path.splitext(event["file"])[1]
+    with tempfile.NamedTemporaryFile("wb", suffix=suffix, delete=False) as f:
+        f.write(archive.read(event["file"]))
+    webbrowser.open("file://" + f.name)
+    return f.name
+
+
+def run(path: str, list_only: bool = False, out=sys.stdout, read=input):
+    meta, events, archive = load_trace(path)
+    out.write(f"{meta.get('nodeid', path)}: {len(events)} events\n")
+    if list_only or not events:
+        for event in events:
+            out.write(describe(event) + "\n")
+        return
+    by_seq = {e["seq"]: i for i, e in enumerate(events)}
+    failure = next((i for i, e in enumerate(events)
+                    if e["kind"] == "note" and e.get("message") == "failure"),
+                   len(events) - 1)
+    i = 0
+    while True:
+        out.write(describe(events[i]) + "\n")
+        try:
+            key = read("> ").strip().lower()
+        except EOFError:
+            return
+        if key in ("", "n"):
+            i = min(i + 1, len(events) - 1)
+        elif key == "p":
+            i = max(i - 1, 0)
+        elif key == "f":
+            i = failure
+            out.write(events[i].get("longrepr", "") + "\n")
+        elif key.isdigit() and int(key) in by_seq:
+            i = by_seq[int(key)]
+        elif key == "d":
+            dom = dom_at(events, i)
+            out.write(archive.read(dom["file"]).decode("utf-8", "replace") + "\n"
+                      if dom else "(no snapshot yet)\n")
+        elif key == "o":
+            shot = events[i] if events[i]["kind"] == "screenshot" else dom_at(events, i)
+            out.write(f"opened {_open(archive, shot)}\n" if shot else "(no snapshot yet)\n")
+        elif key == "q":
+            return
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("trace")
+    parser.add_argument("--list", action="store_true", help="Print the timeline and exit")
+    args = parser.parse_args(argv)
+    run(args.trace, list_only=args.list)
+
+
+if __name__ == "__main__":
+    main()